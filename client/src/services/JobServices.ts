@@ -1,7 +1,30 @@
 const BASE_URL = 'http://127.0.0.1:8000/api/jobs/';
 
-export async function listJobs() {
-	const res = await fetch(BASE_URL);
+// Fields the job cards need; description is fetched per job when editing
+const LIST_FIELDS = 'id,title,status,domain,jobtype,jobtime,required_skills';
+
+export type JobPage<T = any> = {
+	next: string | null;
+	previous: string | null;
+	results: T[];
+};
+
+// One cursor page of jobs, newest first. Pass the previous page's `next` URL to continue.
+export async function listJobs(cursor?: string | null, params: {
+	status?: string;
+	jobtype?: string;
+	fields?: string;
+	page_size?: number;
+} = {}): Promise<JobPage> {
+	let url = cursor;
+	if (!url) {
+		const query = new URLSearchParams({ fields: LIST_FIELDS });
+		Object.entries(params).forEach(([key, value]) => {
+			if (value !== undefined) query.set(key, String(value));
+		});
+		url = `${BASE_URL}?${query}`;
+	}
+	const res = await fetch(url);
 	if (!res.ok) throw new Error('Failed to fetch jobs');
 	return res.json();
 }
@@ -1,4 +1,7 @@
+import { useEffect, useState } from 'react'
 import Dialog from '@/components/ui/Dialog'
+import Spinner from '@/components/ui/Spinner'
+import { getJob } from '@/services/JobServices'
 import EditJobForm from './EditJobForm'
 
 type JobData = {
@@ -20,6 +23,17 @@ type EditJobDialogProps = {
 }
 
 const EditJobDialog = ({ isOpen, onClose, job, onJobUpdated }: EditJobDialogProps) => {
+    // The job list leaves out the description, so load the full job when opened
+    const [fullJob, setFullJob] = useState<JobData | null>(null)
+
+    useEffect(() => {
+        if (!isOpen) return
+        setFullJob(null)
+        getJob(job.id)
+            .then(setFullJob)
+            .catch((error) => console.error('Failed to fetch job:', error))
+    }, [isOpen, job.id])
+
     return (
         <Dialog
             isOpen={isOpen}
@@ -28,11 +42,17 @@ const EditJobDialog = ({ isOpen, onClose, job, onJobUpdated }: EditJobDialogProp
         >
             <h4>Edit Job</h4>
             <div>
-                <EditJobForm 
-                    job={job} 
-                    onClose={onClose}
-                    onJobUpdated={onJobUpdated}
-                />
+                {fullJob ? (
+                    <EditJobForm 
+                        job={fullJob} 
+                        onClose={onClose}
+                        onJobUpdated={onJobUpdated}
+                    />
+                ) : (
+                    <div className="flex justify-center py-8">
+                        <Spinner size={30} />
+                    </div>
+                )}
             </div>
         </Dialog>
     )
@@ -4,6 +4,7 @@ import classNames from 'classnames'
 import GridItem from './GridItem'
 import ListItem, { JobListItem } from './ListItem'
 import Spinner from '@/components/ui/Spinner'
+import Button from '@/components/ui/Button'
 import { getList, useAppDispatch, useAppSelector } from '../store'
 
 import { useState } from 'react'
@@ -14,12 +15,24 @@ type ProjectListContentProps = {
 
 const ProjectListContent = ({ onJobUpdated }: ProjectListContentProps) => {
     const [jobs, setJobs] = useState<any[]>([]);
+    const [nextPage, setNextPage] = useState<string | null>(null);
 
     const fetchJobs = async () => {
         try {
-            const result = await listJobs();
-            setJobs(result || []);
-            console.log(result);
+            const page = await listJobs();
+            setJobs(page.results || []);
+            setNextPage(page.next);
+        } catch (error) {
+            console.error('Failed to fetch jobs:', error);
+        }
+    };
+
+    const fetchMoreJobs = async () => {
+        if (!nextPage) return;
+        try {
+            const page = await listJobs(nextPage);
+            setJobs((current) => [...current, ...(page.results || [])]);
+            setNextPage(page.next);
         } catch (error) {
             console.error('Failed to fetch jobs:', error);
         }
@@ -81,6 +94,13 @@ const ProjectListContent = ({ onJobUpdated }: ProjectListContentProps) => {
                 projectList.map((project) => (
                     <ListItem key={project.id} data={project} />
                 ))}
+            {nextPage && jobs.length > 0 && !loading && (
+                <div className="flex justify-center mt-4">
+                    <Button size="sm" onClick={fetchMoreJobs}>
+                        Load more
+                    </Button>
+                </div>
+            )}
         </div>
     )
 }
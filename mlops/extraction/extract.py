@@ -1,12 +1,33 @@
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
+
 import fitz  # PyMuPDF for PDFs
 from docx import Document
 import pypandoc
 
-def extract_text(file_path: str) -> str:
+logger = logging.getLogger(__name__)
+
+# Default budget for a single PDF; a PDF cut off by it is logged as truncated
+MAX_PDF_PAGES = int(os.getenv("HIRO_PDF_MAX_PAGES", "50"))
+MAX_PDF_BYTES = int(os.getenv("HIRO_PDF_MAX_BYTES", str(2 * 1024 * 1024)))
+
+# Pages per task when a PDF is split across a worker pool
+PDF_CHUNK_PAGES = 8
+
+def extract_text(
+    file_path: str,
+    max_pages: Optional[int] = MAX_PDF_PAGES,
+    max_bytes: Optional[int] = MAX_PDF_BYTES,
+    workers: Optional[int] = None,
+) -> str:
     """
     Extract all text from a supported file.
     Supports: PDF, DOCX, ODT, TXT
+
+    max_pages / max_bytes bound how much of a PDF is read; workers > 1 splits
+    long PDFs across a process pool by page range.
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
@@ -14,7 +35,7 @@ def extract_text(file_path: str) -> str:
     ext = os.path.splitext(file_path)[1].lower()
 
     if ext == ".pdf":
-        return _extract_from_pdf(file_path)
+        return _extract_from_pdf(file_path, max_pages, max_bytes, workers)
     elif ext == ".docx":
         return _extract_from_docx(file_path)
     elif ext == ".odt":
@@ -24,13 +45,88 @@ def extract_text(file_path: str) -> str:
     else:
         raise ValueError(f"Unsupported file format: {ext}")
 
-def _extract_from_pdf(file_path: str) -> str:
-    text = []
+def _extract_from_pdf(file_path: str, max_pages=None, max_bytes=None, workers=None) -> str:
+    if workers and workers > 1:
+        pages = iter_pdf_pages_parallel(file_path, workers, max_pages=max_pages, max_bytes=max_bytes)
+    else:
+        pages = iter_pdf_pages(file_path, max_pages=max_pages, max_bytes=max_bytes)
+    text = [page_text for page_text, _ in pages]
+
+    bytes_read = sum(len(page_text.encode("utf-8")) for page_text in text)
     with fitz.open(file_path) as doc:
-        for page in doc:
-            text.append(page.get_text("text"))
+        page_count = doc.page_count
+    if len(text) < page_count or (max_bytes is not None and bytes_read >= max_bytes):
+        logger.warning(
+            "PDF %s truncated: read %d of %d pages, %d bytes of text (limits: %s pages, %s bytes)",
+            file_path, len(text), page_count, bytes_read, max_pages, max_bytes,
+        )
     return "\n".join(text).strip()
 
+def _budget(max_bytes: Optional[int]):
+    """Clip each page to what is left of max_bytes; None once it is spent."""
+    remaining = [max_bytes]
+
+    def clip(page_text: str) -> Optional[str]:
+        if remaining[0] is None:
+            return page_text
+        if remaining[0] <= 0:
+            return None
+        data = page_text.encode("utf-8")
+        if len(data) > remaining[0]:
+            page_text = data[:remaining[0]].decode("utf-8", errors="ignore")
+        remaining[0] -= len(data)
+        return page_text
+
+    return clip
+
+def iter_pdf_pages(file_path: str, start: int = 0, stop: Optional[int] = None,
+                   max_pages: Optional[int] = None, max_bytes: Optional[int] = None
+                   ) -> Iterator[tuple[str, list[str]]]:
+    """Yield (page_text, page_urls) one page at a time within the page/byte budget."""
+    clip = _budget(max_bytes)
+    with fitz.open(file_path) as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        if max_pages is not None:
+            stop = min(stop, start + max_pages)
+        for number in range(start, stop):
+            page = doc.load_page(number)
+            page_text = clip(page.get_text("text"))
+            if page_text is None:
+                return
+            urls = [l["uri"] for l in page.get_links() if l.get("uri", "").startswith("http")]
+            yield page_text, urls
+
+def _extract_pdf_range(file_path: str, start: int, stop: int) -> list[tuple[str, list[str]]]:
+    return list(iter_pdf_pages(file_path, start, stop))
+
+def iter_pdf_pages_parallel(file_path: str, workers: int = 4, chunk_pages: int = PDF_CHUNK_PAGES,
+                            max_pages: Optional[int] = None, max_bytes: Optional[int] = None
+                            ) -> Iterator[tuple[str, list[str]]]:
+    """iter_pdf_pages with page ranges read concurrently, yielded in page order."""
+    with fitz.open(file_path) as doc:
+        page_count = doc.page_count
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    if page_count <= chunk_pages or workers <= 1:
+        yield from iter_pdf_pages(file_path, 0, page_count, max_bytes=max_bytes)
+        return
+
+    ranges = [(s, min(s + chunk_pages, page_count)) for s in range(0, page_count, chunk_pages)]
+    clip = _budget(max_bytes)
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        pending, next_range = [], 0
+        while next_range < len(ranges) or pending:
+            while next_range < len(ranges) and len(pending) < workers:
+                pending.append(pool.submit(_extract_pdf_range, file_path, *ranges[next_range]))
+                next_range += 1
+            for page_text, urls in pending.pop(0).result():
+                page_text = clip(page_text)
+                if page_text is None:
+                    for future in pending:
+                        future.cancel()
+                    return
+                yield page_text, urls
+
 def _extract_from_docx(file_path: str) -> str:
     doc = Document(file_path)
     return "\n".join(p.text for p in doc.paragraphs if p.text).strip()
@@ -44,7 +140,8 @@ def _extract_from_txt(file_path: str) -> str:
 
 
 # Example usage:
-file = "Suleman-Resume.pdf"   # or .docx, .odt, .txt
-text = extract_text(file)
+if __name__ == "__main__":
+    file = "Suleman-Resume.pdf"   # or .docx, .odt, .txt
+    text = extract_text(file)
 
-print(text)  # prteview first 1000 chars
+    print(text)  # prteview first 1000 chars
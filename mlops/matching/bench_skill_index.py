@@ -0,0 +1,81 @@
+"""
+Build a SkillIndex over a synthetic applicant pool and time AND/OR queries
+against a linear scan of the parsed skill lists.
+
+Usage (from mlops):
+    python -m matching.bench_skill_index --applicants 100000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from matching.bench_scoring import make_resumes
+from matching.skill_index import SkillIndex
+
+QUERIES = [
+    {"all_of": ["skill0", "skill1"]},
+    {"all_of": ["skill0", "skill150"]},
+    {"any_of": ["skill500", "skill900", "skill1500"]},
+    {"all_of": ["skill2"], "any_of": ["skill10", "skill20"]},
+]
+
+
+def scan(resumes, all_of=(), any_of=()):
+    out = []
+    for i, resume in enumerate(resumes):
+        have = {s.lower() for s in resume["skills"]}
+        if all(s in have for s in all_of) and (not any_of or any(s in have for s in any_of)):
+            out.append(i)
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--applicants", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    resumes, _ = make_resumes(args.applicants)
+
+    start = time.perf_counter()
+    index = SkillIndex.from_parsed(enumerate(resumes))
+    build = time.perf_counter() - start
+    size = sum(len(p) for p in index._postings.values())
+    entries = sum(len(d) for d in index._docs.values())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "skills.idx")
+        start = time.perf_counter()
+        index.save(path)
+        save = time.perf_counter() - start
+        start = time.perf_counter()
+        SkillIndex.load(path)
+        load = time.perf_counter() - start
+
+    print(f"{len(index)} applicants, {len(index.skills())} skills, {entries} postings "
+          f"in {size / 1024:.0f} KiB ({size / entries:.2f} bytes/id)")
+    print(f"build {build * 1000:.0f} ms, snapshot save {save * 1000:.0f} ms, load {load * 1000:.0f} ms")
+
+    for query in QUERIES:
+        index._cache.clear()
+        start = time.perf_counter()
+        got = index.search(**query)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            index.search(**query)
+        warm = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        expected = scan(resumes, **query)
+        linear = time.perf_counter() - start
+
+        assert got == expected, f"index disagrees with scan for {query}"
+        print(f"  {str(query):<60} {len(got):>6} hits  cold {cold * 1000:6.2f} ms  "
+              f"warm {warm * 1000:6.3f} ms  scan {linear * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Vectorized candidate-to-job scoring.
+
+Parsed resumes (the dicts produced by ResumeParse.parse_resume) are encoded
+once into a CandidatePool:
+    - skills:     sparse CSR matrix, one row per candidate, one column per skill
+    - years:      dense float vector of experience years
+    - education:  dense int vector of the highest degree level
+
+A job (a JDparse FunctionalJD, a posts.Job or explicit requirements) becomes a
+sparse skill vector, so scoring a job against every candidate is a single
+sparse matrix-vector product plus a few vector operations:
+
+    pool = CandidatePool.from_resumes(parsed_resumes)
+    ranked = top_k(JobRequirements.from_functional_jd(jd), pool, k=20)
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+# Ordinal degree levels; the first pattern that matches wins, so higher degrees come first
+EDUCATION_LEVELS = [
+    (4, re.compile(r"\b(?:ph\.?\s?d|doctorate|doctoral)\b", re.I)),
+    (3, re.compile(r"\b(?:master'?s?|m\.?sc|m\.?s\.?|mba|m\.?phil|m\.?eng|m\.?tech)\b", re.I)),
+    (2, re.compile(r"\b(?:bachelor'?s?|b\.?sc|b\.?s\.?|b\.?a\.?|bba|b\.?eng|b\.?tech|undergraduate)\b", re.I)),
+    (1, re.compile(r"\b(?:intermediate|a-level|o-level|matriculation|diploma|high school|associate)\b", re.I)),
+]
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)\s*(years?|yrs?|months?|mos?)?", re.I)
+_YEAR = re.compile(r"(?:19|20)\d{2}")
+_YEAR_RANGE = re.compile(r"\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now)\b", re.I)
+
+# Keys of a ResumeParse education entry that name the degree; institution and
+# location text ("BA Academy") must not count as one
+DEGREE_KEYS = ("degree", "title")
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(str(skill).split()).lower()
+
+
+def education_level(entries: Any) -> int:
+    """
+    Highest degree level (0-4) mentioned in a resume's or JD's education field.
+    Accepts strings, lists of strings or lists of dicts (ResumeParse's format);
+    for dicts only the degree is read, or every value when it has no degree key.
+    """
+    if not entries:
+        return 0
+    if isinstance(entries, (str, dict)):
+        entries = [entries]
+    best = 0
+    for entry in entries:
+        text = _degree_text(entry) if isinstance(entry, dict) else str(entry)
+        for level, pattern in EDUCATION_LEVELS:
+            if level <= best:
+                break
+            if pattern.search(text):
+                best = level
+                break
+    return best
+
+
+def _degree_text(entry: dict) -> str:
+    keys = [key for key in DEGREE_KEYS if key in entry] or list(entry)
+    return " ".join(str(entry[key]) for key in keys if entry[key])
+
+
+def parse_years(value: Any) -> float:
+    """
+    Experience in years from values like 3, "2 years", "6 months" or "1.5 years".
+    A year range ("2019 - 2023", "2021 - Present") counts as its duration; other
+    year-like numbers are not durations and are skipped.
+    """
+    if value is None or value == "":
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value)
+    year_range = _YEAR_RANGE.search(text)
+    if year_range:
+        end = year_range.group(2)
+        end_year = int(end) if end.isdigit() else date.today().year
+        return float(max(0, end_year - int(year_range.group(1))))
+    for match in _DURATION.finditer(text):
+        if _YEAR.fullmatch(match.group(1)):
+            continue
+        amount = float(match.group(1))
+        unit = (match.group(2) or "years").lower()
+        return amount / 12 if unit.startswith("mo") else amount
+    return 0.0
+
+
+@dataclass
+class JobRequirements:
+    """What a job asks for, in the form the scorer needs."""
+    skills: List[str]
+    min_years: float = 0.0
+    education_level: int = 0
+
+    @classmethod
+    def from_functional_jd(cls, jd) -> "JobRequirements":
+        """From a JDparse FunctionalJD."""
+        return cls(
+            skills=list(jd.skills_hard),
+            min_years=float(jd.experience.min_years or 0),
+            education_level=education_level(jd.education),
+        )
+
+    @classmethod
+    def from_job(cls, job) -> "JobRequirements":
+        """From a posts.Job, whose required_skills is free text separated by commas or newlines."""
+        skills = [s.strip() for s in re.split(r"[,;\n]", job.required_skills or "") if s.strip()]
+        return cls(skills=skills)
+
+
+@dataclass
+class ScoringWeights:
+    skills: float = 0.6
+    experience: float = 0.25
+    education: float = 0.15
+
+
+class CandidatePool:
+    """
+    Parsed resumes encoded for scoring. Build once, score against many jobs.
+    """
+
+    def __init__(self, ids: Sequence[Any], skills: sparse.csr_matrix, vocab: Dict[str, int],
+                 years: np.ndarray, education: np.ndarray):
+        self.ids = list(ids)
+        self.skills = skills
+        self.vocab = vocab
+        self.years = years
+        self.education = education
+        self._skill_names = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_resumes(cls, resumes: Iterable[dict], ids: Optional[Sequence[Any]] = None) -> "CandidatePool":
+        vocab: Dict[str, int] = {}
+        indptr, indices = [0], []
+        years, education = [], []
+        count = 0
+        for resume in resumes:
+            cols = {vocab.setdefault(normalize_skill(s), len(vocab)) for s in resume.get("skills") or [] if str(s).strip()}
+            indices.extend(sorted(cols))
+            indptr.append(len(indices))
+            years.append(parse_years(resume.get("experience_years")))
+            education.append(education_level(resume.get("education")))
+            count += 1
+
+        indices = np.asarray(indices, dtype=np.int32)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, np.asarray(indptr, dtype=np.int64)),
+            shape=(count, len(vocab)),
+        )
+        return cls(
+            ids=list(ids) if ids is not None else list(range(count)),
+            skills=matrix,
+            vocab=vocab,
+            years=np.asarray(years, dtype=np.float32),
+            education=np.asarray(education, dtype=np.int8),
+        )
+
+    def skill_names(self) -> List[str]:
+        if self._skill_names is None:
+            self._skill_names = sorted(self.vocab, key=self.vocab.get)
+        return self._skill_names
+
+
+@dataclass
+class ScoreBreakdown:
+    """Per-candidate component scores (each in [0, 1]) and the weighted total."""
+    total: np.ndarray
+    skills: np.ndarray
+    experience: np.ndarray
+    education: np.ndarray
+    required: List[str] = field(default_factory=list)
+
+
+def score_candidates(job: JobRequirements, pool: CandidatePool,
+                     weights: ScoringWeights = ScoringWeights()) -> ScoreBreakdown:
+    """
+    Score every candidate in the pool against one job.
+
+    skills      fraction of the job's skills the candidate lists
+    experience  candidate years / required years, capped at 1 (1 if none required)
+    education   candidate level / required level, capped at 1 (1 if none required)
+    """
+    required = list(dict.fromkeys(normalize_skill(s) for s in job.skills if str(s).strip()))
+    n = len(pool)
+
+    cols = [pool.vocab[s] for s in required if s in pool.vocab]
+    if required:
+        # Skills nobody in the pool has still count in the denominator
+        query = np.zeros(len(pool.vocab), dtype=np.float32)
+        query[cols] = 1.0
+        skills = (pool.skills @ query) / len(required)
+    else:
+        skills = np.ones(n, dtype=np.float32)
+
+    if job.min_years > 0:
+        experience = np.minimum(pool.years / job.min_years, 1.0)
+    else:
+        experience = np.ones(n, dtype=np.float32)
+
+    if job.education_level > 0:
+        education = np.minimum(pool.education / job.education_level, 1.0).astype(np.float32)
+    else:
+        education = np.ones(n, dtype=np.float32)
+
+    total_weight = weights.skills + weights.experience + weights.education
+    total = (weights.skills * skills + weights.experience * experience
+             + weights.education * education) / total_weight
+    return ScoreBreakdown(total=total, skills=skills, experience=experience,
+                          education=education, required=required)
+
+
+def top_k(job: JobRequirements, pool: CandidatePool, k: int = 10,
+          weights: ScoringWeights = ScoringWeights()) -> List[dict]:
+    """
+    The k best candidates, best first, with their score breakdown and the
+    matched / missing skills.
+    """
+    scores = score_candidates(job, pool, weights)
+    n = len(pool)
+    if n == 0 or k <= 0:
+        return []
+    k = min(k, n)
+
+    # Partition to find the k-th best score in O(n), then sort only the rows at or
+    # above it; ties break towards the earlier candidate
+    kth = np.partition(scores.total, n - k)[n - k]
+    rows = np.flatnonzero(scores.total >= kth)
+    order = rows[np.lexsort((rows, -scores.total[rows]))][:k]
+
+    names = pool.skill_names()
+    results = []
+    for row in order:
+        have = {names[c] for c in pool.skills.indices[pool.skills.indptr[row]:pool.skills.indptr[row + 1]]}
+        results.append({
+            "id": pool.ids[row],
+            "score": round(float(scores.total[row]), 4),
+            "breakdown": {
+                "skills": round(float(scores.skills[row]), 4),
+                "experience": round(float(scores.experience[row]), 4),
+                "education": round(float(scores.education[row]), 4),
+            },
+            "matched_skills": [s for s in scores.required if s in have],
+            "missing_skills": [s for s in scores.required if s not in have],
+        })
+    return results
@@ -0,0 +1,304 @@
+"""
+In-memory inverted index from skill to applicant ids.
+
+Each posting list is a sorted run of applicant ids stored as delta-encoded
+varints (LEB128) in a bytearray: a list of 100k ids with small gaps takes about
+one byte per id instead of 28+ for a Python int. Encoding and decoding are
+vectorized with NumPy, and the most recently used lists are kept decoded.
+
+    index = SkillIndex()
+    index.add(applicant.pk, parsed["skills"])          # as resumes are parsed
+    index.search(all_of=["python", "django"], any_of=["aws", "gcp"])
+    index.save("skills.idx")                           # SkillIndex.load(...) on restart
+"""
+import json
+import os
+import struct
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .scoring import normalize_skill
+
+SNAPSHOT_MAGIC = b"HIROSKI1"
+
+
+def encode_postings(ids: np.ndarray) -> bytearray:
+    """
+    Sorted unique non-negative ids -> delta + varint bytes.
+    """
+    ids = np.asarray(ids, dtype=np.uint64)
+    if not len(ids):
+        return bytearray()
+    deltas = np.diff(ids, prepend=np.uint64(0))
+
+    nbytes = np.ones(len(deltas), dtype=np.int64)
+    rest = deltas >> np.uint64(7)
+    while rest.any():
+        nbytes += rest > 0
+        rest >>= np.uint64(7)
+
+    starts = np.cumsum(nbytes) - nbytes
+    out = np.empty(int(nbytes.sum()), dtype=np.uint8)
+    for j in range(int(nbytes.max())):
+        mask = nbytes > j
+        chunk = (deltas[mask] >> np.uint64(7 * j)) & np.uint64(0x7F)
+        more = (nbytes[mask] > j + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[mask] + j] = (chunk | more).astype(np.uint8)
+    return bytearray(out.tobytes())
+
+
+def decode_postings(data: bytes) -> np.ndarray:
+    """
+    Inverse of encode_postings; returns a sorted int64 array.
+    """
+    if not data:
+        return np.empty(0, dtype=np.int64)
+    raw = np.frombuffer(bytes(data), dtype=np.uint8)
+    last_byte = (raw & 0x80) == 0
+    ends = np.flatnonzero(last_byte)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    position = np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)
+    values = (raw & 0x7F).astype(np.int64) << (7 * position)
+    return np.cumsum(np.add.reduceat(values, starts))
+
+
+def _intersect(small: np.ndarray, large: np.ndarray) -> np.ndarray:
+    """
+    Intersection of two sorted unique arrays: binary-search each element of
+    the smaller one in the larger, O(m log n) rather than re-sorting both.
+    """
+    if len(small) > len(large):
+        small, large = large, small
+    if not len(small):
+        return small
+    pos = np.searchsorted(large, small)
+    pos[pos == len(large)] = 0
+    return small[large[pos] == small]
+
+
+def _encode_one(delta: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = delta & 0x7F
+        delta >>= 7
+        if delta:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+class SkillIndex:
+    """
+    Skill -> compressed posting list of applicant ids, with incremental updates.
+
+    Ids are non-negative integers (applicant primary keys). Adding ids in
+    increasing order, the usual case as new applicants arrive, appends to the
+    encoded lists in place; anything else re-encodes only the affected lists.
+    """
+
+    def __init__(self, cache_size: int = 256):
+        self._postings: Dict[str, bytearray] = {}
+        self._last: Dict[str, int] = {}
+        self._docs: Dict[int, FrozenSet[str]] = {}
+        # Ids restored from a snapshot whose skill sets are rebuilt only when one
+        # of them is updated (see _materialize)
+        self._snapshot_ids: Optional[np.ndarray] = None
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def __len__(self) -> int:
+        restored = len(self._snapshot_ids) if self._snapshot_ids is not None else 0
+        return len(self._docs) + restored
+
+    def __contains__(self, applicant_id: int) -> bool:
+        return self._skills_of(int(applicant_id)) is not None
+
+    @property
+    def watermark(self) -> int:
+        """Highest applicant id in the index (-1 if empty); rows above it still need indexing."""
+        restored = int(self._snapshot_ids[-1]) if self._snapshot_ids is not None and len(self._snapshot_ids) else -1
+        return max(max(self._docs, default=-1), restored)
+
+    @classmethod
+    def from_parsed(cls, items: Iterable[Tuple[int, object]]) -> "SkillIndex":
+        """
+        Build from (applicant_id, parsed) pairs, where parsed is a parse_resume
+        dict or a plain extract_skills list.
+        """
+        index = cls()
+        lists: Dict[str, List[int]] = {}
+        for applicant_id, parsed in sorted(items, key=lambda item: item[0]):
+            skills = parsed.get("skills") if isinstance(parsed, dict) else parsed
+            applicant_id = int(applicant_id)
+            if applicant_id < 0:
+                raise ValueError("applicant ids must be non-negative")
+            if applicant_id in index._docs:
+                raise ValueError(f"duplicate applicant id {applicant_id}")
+            doc = frozenset(normalize_skill(s) for s in skills or [] if str(s).strip())
+            index._docs[applicant_id] = doc
+            for skill in doc:
+                lists.setdefault(skill, []).append(applicant_id)
+        for skill, ids in lists.items():
+            index._postings[skill] = encode_postings(np.asarray(ids))
+            index._last[skill] = ids[-1]
+        return index
+
+    def skills(self) -> List[str]:
+        return sorted(self._postings)
+
+    def add(self, applicant_id: int, skills: Iterable[str]):
+        """
+        Index (or re-index) one applicant's skills.
+        """
+        applicant_id = int(applicant_id)
+        if applicant_id < 0:
+            raise ValueError("applicant ids must be non-negative")
+        new = frozenset(normalize_skill(s) for s in skills if str(s).strip())
+        old = self._skills_of(applicant_id) or frozenset()
+        for skill in old - new:
+            self._remove_id(skill, applicant_id)
+        for skill in new - old:
+            self._add_id(skill, applicant_id)
+        self._docs[applicant_id] = new
+
+    def remove(self, applicant_id: int):
+        applicant_id = int(applicant_id)
+        self._skills_of(applicant_id)
+        for skill in self._docs.pop(applicant_id, frozenset()):
+            self._remove_id(skill, applicant_id)
+
+    def _skills_of(self, applicant_id: int) -> Optional[FrozenSet[str]]:
+        if applicant_id in self._docs:
+            return self._docs[applicant_id]
+        restored = self._snapshot_ids
+        if restored is not None:
+            pos = np.searchsorted(restored, applicant_id)
+            if pos < len(restored) and restored[pos] == applicant_id:
+                self._materialize()
+                return self._docs[applicant_id]
+        return None
+
+    def _materialize(self):
+        """
+        Rebuild per-applicant skill sets for snapshot ids by inverting the postings.
+        """
+        skills = list(self._postings)
+        decoded = [decode_postings(self._postings[s]) for s in skills]
+        ids = np.concatenate(decoded) if decoded else np.empty(0, dtype=np.int64)
+        owners = np.repeat(np.arange(len(skills)), [len(d) for d in decoded])
+        order = np.argsort(ids, kind="stable")
+        ids, owners = ids[order], owners[order]
+        bounds = np.flatnonzero(np.diff(ids)) + 1
+        for group_ids, group_owners in zip(np.split(ids, bounds), np.split(owners, bounds)):
+            if len(group_ids):
+                self._docs.setdefault(int(group_ids[0]), frozenset(skills[o] for o in group_owners))
+        for applicant_id in self._snapshot_ids.tolist():
+            self._docs.setdefault(applicant_id, frozenset())
+        self._snapshot_ids = None
+
+    def postings(self, skill: str) -> np.ndarray:
+        """Sorted applicant ids listing `skill`."""
+        skill = normalize_skill(skill)
+        cached = self._cache.get(skill)
+        if cached is not None:
+            self._cache.move_to_end(skill)
+            return cached
+        ids = decode_postings(self._postings.get(skill, b""))
+        self._cache[skill] = ids
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return ids
+
+    def search(self, all_of: Iterable[str] = (), any_of: Iterable[str] = ()) -> List[int]:
+        """
+        Applicants having every skill in `all_of` and at least one in `any_of`
+        (either may be empty, not both). Returns sorted ids.
+        """
+        all_of, any_of = list(all_of), list(any_of)
+        if not all_of and not any_of:
+            raise ValueError("search needs at least one skill")
+
+        result = None
+        # Intersect shortest lists first so the working set shrinks fastest
+        for ids in sorted((self.postings(s) for s in all_of), key=len):
+            result = ids if result is None else _intersect(result, ids)
+            if not len(result):
+                return []
+        if any_of:
+            union = np.unique(np.concatenate([self.postings(s) for s in any_of]))
+            result = union if result is None else _intersect(result, union)
+        return result.tolist()
+
+    def _add_id(self, skill: str, applicant_id: int):
+        last = self._last.get(skill)
+        if last is None or applicant_id > last:
+            self._postings.setdefault(skill, bytearray()).extend(
+                _encode_one(applicant_id - (last if last is not None else 0))
+            )
+            self._last[skill] = applicant_id
+        else:
+            ids = np.union1d(decode_postings(self._postings[skill]), [applicant_id])
+            self._postings[skill] = encode_postings(ids)
+        self._cache.pop(skill, None)
+
+    def _remove_id(self, skill: str, applicant_id: int):
+        ids = decode_postings(self._postings.get(skill, b""))
+        ids = ids[ids != applicant_id]
+        if len(ids):
+            self._postings[skill] = encode_postings(ids)
+            self._last[skill] = int(ids[-1])
+        else:
+            self._postings.pop(skill, None)
+            self._last.pop(skill, None)
+        self._cache.pop(skill, None)
+
+    def save(self, path: str, meta: Optional[dict] = None):
+        """
+        Write a snapshot: magic, header length, JSON header, then the raw posting
+        bytes back to back. Written to a temp file and renamed into place, so a
+        crash mid-write leaves the previous snapshot intact. The first blob is
+        the list of every indexed applicant id; per-applicant skill sets are
+        not stored, they are rebuilt from the postings if ever needed.
+        """
+        ids = self._snapshot_ids if self._snapshot_ids is not None else np.empty(0, dtype=np.int64)
+        all_ids = encode_postings(np.union1d(ids, sorted(self._docs)).astype(np.int64))
+        offsets, blobs, offset = [], [all_ids], len(all_ids)
+        for skill, data in self._postings.items():
+            offsets.append([skill, offset, len(data), self._last[skill]])
+            blobs.append(data)
+            offset += len(data)
+        header = json.dumps({
+            "meta": meta or {},
+            "ids": [0, len(all_ids)],
+            "postings": offsets,
+        }).encode("utf-8")
+
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for data in blobs:
+                f.write(data)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> Tuple["SkillIndex", dict]:
+        """Read a snapshot written by save(); returns (index, meta)."""
+        with open(path, "rb") as f:
+            if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a skill index snapshot")
+            (length,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(length))
+            body = f.read()
+
+        index = cls()
+        for skill, offset, size, last in header["postings"]:
+            index._postings[skill] = bytearray(body[offset:offset + size])
+            index._last[skill] = last
+        offset, size = header["ids"]
+        index._snapshot_ids = decode_postings(body[offset:offset + size])
+        return index, header["meta"]
@@ -0,0 +1,62 @@
+import numpy as np
+from types import SimpleNamespace
+
+from matching.scoring import (
+    CandidatePool, JobRequirements, education_level, parse_years, score_candidates, top_k,
+)
+
+RESUMES = [
+    {"skills": ["Python", "Django", "SQL"], "experience_years": "4 years",
+     "education": [{"degree": "BS", "field": "Computer Science"}]},
+    {"skills": ["python", "React"], "experience_years": "6 months", "education": ["Master of Science"]},
+    {"skills": [], "experience_years": "", "education": []},
+    {"skills": ["Django", "Python", "SQL", "Docker"], "experience_years": "1.5 years",
+     "education": [{"degree": "PhD"}]},
+]
+
+
+def loop_score(job, resume):
+    # Reference: the per-pair computation the matrix form replaces
+    have = {s.lower() for s in resume["skills"]}
+    required = list(dict.fromkeys(s.lower() for s in job.skills))
+    skills = sum(s in have for s in required) / len(required)
+    experience = min(parse_years(resume["experience_years"]) / job.min_years, 1.0)
+    education = min(education_level(resume["education"]) / job.education_level, 1.0)
+    return (0.6 * skills + 0.25 * experience + 0.15 * education) / 1.0
+
+
+def test_parsers():
+    assert parse_years("6 months") == 0.5
+    assert parse_years("1.5 years") == 1.5
+    assert parse_years(3) == 3.0
+    assert education_level([{"degree": "BS"}, "MSc Data Science"]) == 3
+    assert education_level("Matriculation") == 1
+
+
+def test_parsers_ignore_institutions_and_calendar_years():
+    assert education_level([{"degree": "Intermediate", "institution": "BA Academy", "location": "Lahore"}]) == 1
+    assert education_level([{"institution": "FAST", "dates": "MS 2020"}]) == 3  # no degree key
+    assert parse_years("2019 - 2023") == 4.0
+    assert parse_years("since 2019") == 0.0
+    assert parse_years("2020: 3 years") == 3.0
+
+
+def test_matrix_scores_match_pairwise_loop():
+    pool = CandidatePool.from_resumes(RESUMES, ids=["a", "b", "c", "d"])
+    job = JobRequirements(skills=["Python", "Django", "SQL", "Kubernetes"], min_years=2, education_level=2)
+
+    scores = score_candidates(job, pool)
+    np.testing.assert_allclose(scores.total, [loop_score(job, r) for r in RESUMES], rtol=1e-6)
+
+    ranked = top_k(job, pool, k=2)
+    assert [r["id"] for r in ranked] == ["a", "d"]
+    assert ranked[0]["breakdown"] == {"skills": 0.75, "experience": 1.0, "education": 1.0}
+    assert ranked[0]["missing_skills"] == ["kubernetes"]
+
+
+def test_job_adapters():
+    jd = SimpleNamespace(skills_hard=["Python"], education=["Bachelor's Degree"],
+                         experience=SimpleNamespace(min_years=3))
+    assert JobRequirements.from_functional_jd(jd) == JobRequirements(["Python"], 3.0, 2)
+    job = SimpleNamespace(required_skills="Python, Django\nSQL")
+    assert JobRequirements.from_job(job).skills == ["Python", "Django", "SQL"]
@@ -0,0 +1,54 @@
+import numpy as np
+
+from matching.skill_index import SkillIndex, decode_postings, encode_postings
+
+PARSED = {
+    7: {"skills": ["Python", "Django", "AWS"]},
+    3: {"skills": ["python", "React"]},
+    12: ["Go", "AWS", "Python"],
+    300: {"skills": ["Django", "GCP"]},
+}
+
+
+def test_varint_round_trip():
+    ids = np.array([0, 1, 127, 128, 300, 16384, 2**40], dtype=np.int64)
+    data = encode_postings(ids)
+    assert len(data) < ids.nbytes
+    assert decode_postings(data).tolist() == ids.tolist()
+
+
+def test_and_or_queries():
+    index = SkillIndex.from_parsed(PARSED.items())
+    assert index.search(all_of=["python"]) == [3, 7, 12]
+    assert index.search(all_of=["Python", "aws"]) == [7, 12]
+    assert index.search(any_of=["react", "gcp"]) == [3, 300]
+    assert index.search(all_of=["django"], any_of=["aws", "gcp"]) == [7, 300]
+    assert index.search(all_of=["python", "cobol"]) == []
+
+
+def test_incremental_updates_match_rebuild_and_survive_snapshot(tmp_path):
+    index = SkillIndex()
+    for applicant_id in [12, 3, 300, 7]:  # out of order on purpose
+        index.add(applicant_id, PARSED[applicant_id]["skills"] if isinstance(PARSED[applicant_id], dict)
+                  else PARSED[applicant_id])
+    index.search(all_of=["python"])  # populate the decoded cache before mutating
+    index.add(3, ["Python", "AWS"])  # re-parsed resume
+    index.remove(300)
+    index.add(5, [])
+
+    assert index.search(all_of=["python", "aws"]) == [3, 7, 12]
+    assert index.search(any_of=["react", "gcp"]) == []
+
+    path = tmp_path / "skills.idx"
+    index.save(str(path), meta={"watermark": index.watermark})
+    loaded, meta = SkillIndex.load(str(path))
+    assert meta == {"watermark": 12}
+    assert len(loaded) == len(index) == 4
+    assert 5 in loaded and 300 not in loaded
+    assert loaded.skills() == index.skills()
+    assert all(loaded.postings(s).tolist() == index.postings(s).tolist() for s in index.skills())
+    loaded.add(40, ["Django"])
+    loaded.add(12, ["Go"])
+    assert loaded.search(all_of=["django"]) == [7, 40]
+    assert loaded.search(all_of=["python"]) == [3, 7]
+    assert len(loaded) == 5
@@ -2,17 +2,20 @@
 import re
 from typing import List
 
-CERT_PATTERNS = [
-    r"(aws certified [\w\s]+)",
-    r"(certified [\w\s]+)",
-    r"(pmp)",
-    r"(scrum master)",
-    r"(gcp professional [\w\s]+)",
-]
+from common.regex_registry import PatternSet, register
+
+# Overlapping alternatives ("aws certified X" / "certified X") are all kept,
+# so the set is scanned pattern by pattern
+CERT_PATTERNS = register("jd.certifications", PatternSet([
+    ("aws_certified", r"(aws certified [\w\s]+)"),
+    ("certified", r"(certified [\w\s]+)"),
+    ("pmp", r"(pmp)"),
+    ("scrum_master", r"(scrum master)"),
+    ("gcp_professional", r"(gcp professional [\w\s]+)"),
+], re.IGNORECASE))
 
 def extract_certifications(text: str) -> List[str]:
     out = []
-    for patt in CERT_PATTERNS:
-        for m in re.finditer(patt, text, flags=re.IGNORECASE):
-            out.append(m.group(0).strip())
+    for _, m in CERT_PATTERNS.every(text):
+        out.append(m.group(0).strip())
     return list(dict.fromkeys(out))
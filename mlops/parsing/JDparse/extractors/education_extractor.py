@@ -2,23 +2,25 @@
 import re
 from typing import List
 
-DEGREE_PATTERNS = [
-    r"(bachelor(?:'s)?(?: of)?(?: degree)?(?: in)?\s*[\w\s&+-]+)",
-    r"(bsc(?:\.\s*)? in [\w\s&+-]+)",
-    r"(ba(?:\.\s*)? in [\w\s&+-]+)",
-    r"(master(?:'s)?(?: of)?(?: degree)?(?: in)?\s*[\w\s&+-]+)",
-    r"(msc(?:\.\s*)? in [\w\s&+-]+)",
-    r"(phd|doctorate)",
-    r"(mba)",
-    r"(degree in [\w\s&+-]+)"
-]
+from common.regex_registry import PatternSet, register
+
+# Every match of every pattern is kept (they overlap, e.g. "bachelor's degree in X"
+# and "degree in X"), so the set is scanned pattern by pattern
+DEGREE_PATTERNS = register("jd.education.degree", PatternSet([
+    ("bachelor", r"(bachelor(?:'s)?(?: of)?(?: degree)?(?: in)?\s*[\w\s&+-]+)"),
+    ("bsc", r"(bsc(?:\.\s*)? in [\w\s&+-]+)"),
+    ("ba", r"(ba(?:\.\s*)? in [\w\s&+-]+)"),
+    ("master", r"(master(?:'s)?(?: of)?(?: degree)?(?: in)?\s*[\w\s&+-]+)"),
+    ("msc", r"(msc(?:\.\s*)? in [\w\s&+-]+)"),
+    ("doctorate", r"(phd|doctorate)"),
+    ("mba", r"(mba)"),
+    ("degree_in", r"(degree in [\w\s&+-]+)"),
+], re.IGNORECASE))
 
 def extract_education(text: str) -> List[str]:
     out = []
-    low = text.lower()
-    for patt in DEGREE_PATTERNS:
-        for m in re.finditer(patt, text, flags=re.IGNORECASE):
-            s = m.group(0).strip()
-            out.append(s)
+    for _, m in DEGREE_PATTERNS.every(text):
+        s = m.group(0).strip()
+        out.append(s)
     # deduplicate
     return list(dict.fromkeys(out))
@@ -2,39 +2,38 @@
 import re
 from typing import Dict
 
+from common.regex_registry import PatternSet, register
+
 LEVEL_KEYWORDS = {
     "entry": ["entry level", "junior", "jr."],
     "mid": ["mid-level", "mid level", "midlevel"],
     "senior": ["senior", "sr.", "lead", "manager"],
 }
 
+# years patterns: "3+ years", "at least 5 years", "5-7 years", "minimum 4 years";
+# the first alternative that matches anywhere wins
+YEARS_PATTERNS = register("jd.experience.years", PatternSet([
+    ("plus", r"(\d+)\s*\+\s*years"),
+    ("at_least", r"at least\s*(\d+)\s*years"),
+    ("minimum", r"minimum\s*(\d+)\s*years"),
+    ("range", r"(\d+)\s*-\s*(\d+)\s*years"),
+    ("plain", r"(\d+)\s*years"),
+], re.IGNORECASE))
+
 def extract_experience(text: str) -> Dict:
     """
     Return: {min_years: int|None, max_years: int|None, level: str|None, domains: List[str]}
     """
     res = {"min_years": None, "max_years": None, "level": None, "domains": []}
 
-    # years patterns: "3+ years", "at least 5 years", "5-7 years", "minimum 4 years"
-    patterns = [
-        r"(\d+)\s*\+\s*years",
-        r"at least\s*(\d+)\s*years",
-        r"minimum\s*(\d+)\s*years",
-        r"(\d+)\s*-\s*(\d+)\s*years",
-        r"(\d+)\s*years"
-    ]
-    for patt in patterns:
-        m = re.search(patt, text, flags=re.IGNORECASE)
-        if m:
-            if len(m.groups()) == 2:
-                res["min_years"], res["max_years"] = int(m.group(1)), int(m.group(2))
-            else:
-                yrs = int(m.group(1))
-                # If pattern had a trailing plus we consider that min only
-                if "+" in patt or "at least" in patt or "minimum" in patt:
-                    res["min_years"] = yrs
-                else:
-                    res["min_years"] = yrs
-            break
+    found = YEARS_PATTERNS.first(text)
+    if found:
+        name, m = found
+        if name == "range":
+            res["min_years"], res["max_years"] = int(m.group(1)), int(m.group(2))
+        else:
+            # "3+", "at least" and "minimum" are lower bounds, a bare count is treated the same
+            res["min_years"] = int(m.group(1))
 
     # level detection
     low = text.lower()
@@ -0,0 +1,121 @@
+# jdparsing/extractors/fuzzy_index.py
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+
+def _bigrams(s: str) -> Counter:
+    return Counter(s[i:i + 2] for i in range(len(s) - 1))
+
+
+class FuzzySkillIndex:
+    """
+    Fuzzy token -> skill lookup that returns the same answer as
+    process.extractOne(token, vocab, scorer=fuzz.WRatio) with a score threshold,
+    without scoring every vocabulary entry.
+
+    Candidate blocking is lossless for WRatio >= 85 on tokens of 2+ characters:
+      - every adjacent pair of aligned characters is a shared bigram, so a score
+        of 85 needs at least ~0.27 * min(len) - 1 shared bigrams (counted with
+        multiplicity); we require 0.25 * min(len) - 1, and at least one, and
+      - a length ratio above 8 caps WRatio at 60.
+    Skills shorter than two characters (after WRatio's word de-duplication)
+    have no usable bigrams, so they are always scored.
+    Candidates are scored with one process.cdist call per token and answers are
+    memoized per token.
+    """
+
+    def __init__(self, vocab: List[str], threshold: float = 85, memo_size: int = 100_000):
+        self.vocab = list(vocab)
+        self.threshold = threshold
+        self.memo_size = memo_size
+        self._memo: Dict[str, Optional[str]] = {}
+        self._lengths = np.array([len(s) for s in self.vocab], dtype=np.int64)
+        # WRatio's token ratios compare the de-duplicated, space-joined words, which
+        # can be shorter than the raw skill; the bigram bound must use that length
+        self._min_lengths = np.array(
+            [min(len(s), len(" ".join(sorted(set(s.split()))))) for s in self.vocab],
+            dtype=np.int64,
+        )
+
+        postings = defaultdict(lambda: ([], []))
+        always = []
+        for idx, skill in enumerate(self.vocab):
+            grams = _bigrams(skill)
+            if self._min_lengths[idx] < 2:
+                always.append(idx)
+            for g, count in grams.items():
+                postings[g][0].append(idx)
+                postings[g][1].append(count)
+        self._postings = {
+            g: (np.array(ids, dtype=np.int64), np.array(counts, dtype=np.int64))
+            for g, (ids, counts) in postings.items()
+        }
+        self._always = np.array(always, dtype=np.int64)
+
+    def candidates(self, token: str) -> np.ndarray:
+        """
+        Sorted vocabulary indices that could score >= threshold against `token`.
+        """
+        n = len(token)
+        if any(ch.isspace() for ch in token):
+            # Token-based ratios split on whitespace; score everything to stay exact
+            cand = np.arange(len(self.vocab), dtype=np.int64)
+        else:
+            ids, shared = [], []
+            for g, count in _bigrams(token).items():
+                if g in self._postings:
+                    g_ids, g_counts = self._postings[g]
+                    ids.append(g_ids)
+                    shared.append(np.minimum(g_counts, count))
+            if ids:
+                ids = np.concatenate(ids)
+                shared = np.bincount(ids, weights=np.concatenate(shared), minlength=len(self.vocab))
+                cand = np.flatnonzero(shared)
+                required = np.maximum(1, np.ceil(0.25 * np.minimum(self._min_lengths[cand], n) - 1))
+                cand = cand[shared[cand] >= required]
+            else:
+                cand = np.array([], dtype=np.int64)
+            if len(self._always):
+                cand = np.union1d(cand, self._always)
+
+        lengths = self._lengths[cand]
+        keep = (lengths * 8 >= n) & (n * 8 >= lengths) & (lengths > 0)
+        return cand[keep]
+
+    def match(self, token: str) -> Optional[str]:
+        return self.match_many([token])[0]
+
+    def match_many(self, tokens: Iterable[str]) -> List[Optional[str]]:
+        """
+        Best skill per token (or None below the threshold), in input order.
+        """
+        tokens = list(tokens)
+        results = {t: self._memo[t] for t in tokens if t in self._memo}
+        pending = [t for t in dict.fromkeys(tokens) if t not in results]
+
+        for tok in pending:
+            cand = self.candidates(tok)
+            best = None
+            if len(cand):
+                choices = [self.vocab[i] for i in cand]
+                scores = process.cdist(
+                    [tok], choices, scorer=fuzz.WRatio,
+                    score_cutoff=self.threshold, dtype=np.float64,
+                )[0]
+                # argmax keeps the first maximum, i.e. the lowest vocabulary index,
+                # which is the tie-break extractOne uses
+                col = scores.argmax()
+                if scores[col] >= self.threshold:
+                    best = choices[col]
+            results[tok] = best
+            self._remember(tok, best)
+
+        return [results[t] for t in tokens]
+
+    def _remember(self, token: str, skill: Optional[str]):
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[token] = skill
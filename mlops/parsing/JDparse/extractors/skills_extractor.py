@@ -1,12 +1,12 @@
 # jdparsing/extractors/skills_extractor.py
-from typing import List, Tuple
-import spacy
+from typing import Iterable, List, Tuple
 from spacy.matcher import PhraseMatcher
-from rapidfuzz import process, fuzz
+from spacy.tokens import Doc
 import json
 import os
 
-nlp = spacy.load("en_core_web_sm", disable=["parser", "tagger"])
+from ..nlp import get_nlp, pipe
+from .fuzzy_index import FuzzySkillIndex
 
 # Load your canonical skills list from a file (one skill per line)
 SKILLS_FILE = os.path.join(os.path.dirname(__file__), "skills_list.txt")
@@ -23,8 +23,10 @@ def load_skill_vocab(path=SKILLS_FILE) -> List[str]:
 
 _skill_vocab = load_skill_vocab()
 _phrase_matcher = None
+_fuzzy_index = None
 
 def _build_phrase_matcher(vocab: List[str]):
+    nlp = get_nlp()
     matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
     patterns = [nlp.make_doc(s) for s in sorted(set(vocab), key=len, reverse=True)]
     matcher.add("SKILL", patterns)
@@ -38,11 +40,22 @@ def extract_skills(text: str, top_k_fuzzy=3) -> Tuple[List[str], List[str]]:
       2. Fallback fuzzy match for tokens if phrase matcher misses them.
       3. Soft skills detection via small heuristics list.
     """
-    global _phrase_matcher, _skill_vocab
+    return _extract_from_doc(get_nlp()(text))
+
+def extract_skills_batch(texts: Iterable[str], batch_size: int = 64, n_process: int = 1) -> List[Tuple[List[str], List[str]]]:
+    """
+    extract_skills for many JDs, tokenized together through nlp.pipe.
+    """
+    return [_extract_from_doc(doc) for doc in pipe(texts, batch_size=batch_size, n_process=n_process)]
+
+def _extract_from_doc(doc: Doc) -> Tuple[List[str], List[str]]:
+    global _phrase_matcher, _fuzzy_index, _skill_vocab
     if _phrase_matcher is None:
         _phrase_matcher = _build_phrase_matcher(_skill_vocab)
+    if _fuzzy_index is None:
+        _fuzzy_index = FuzzySkillIndex(_skill_vocab, threshold=85)  # threshold; tune later
 
-    doc = nlp(text)
+    text = doc.text
     matches = _phrase_matcher(doc)
     hard = set()
     for match_id, start, end in matches:
@@ -51,10 +64,9 @@ def extract_skills(text: str, top_k_fuzzy=3) -> Tuple[List[str], List[str]]:
 
     # fuzzy search on tokens (to catch slight variations)
     tokens = [t.text for t in doc if not t.is_stop and not t.is_punct and len(t.text) > 1]
-    for tok in tokens:
-        best = process.extractOne(tok, _skill_vocab, scorer=fuzz.WRatio)
-        if best and best[1] >= 85:  # threshold; tune later
-            hard.add(best[0])
+    for best in _fuzzy_index.match_many(tokens):
+        if best:
+            hard.add(best)
 
     # soft skills: small rule-based list
     soft_vocab = ["communication", "teamwork", "leadership", "problem solving", "collaboration", "adaptability", "time management"]
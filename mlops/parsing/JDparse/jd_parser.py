@@ -9,35 +9,189 @@ from .extractors.projects_extractor import extract_projects
 from .extractors.certifications_extractor import extract_certifications
 from .normalization import normalize_skill, normalize_education
 
-from .llm.client import call_llm
-from .llm.prompts import jd_extraction_prompt
+from .llm.client import call_llm, DEFAULT_MODEL
+from .llm.prompts import jd_batch_extraction_prompt, jd_extraction_prompt, JD_PROMPT_VERSION
+from common import compaction
+from common.backends import BackendRouter, RemoteBackend, local_backend_from_env
+from common.batching import pack_batches, run_batch
+from common.llm_cache import get_default_cache, make_cache_key
+from common.orchestration import CONCURRENT, DEFAULT_DEADLINE, race_with_fallback, resolve_mode
+from common.tracing import span, traced
+from typing import Dict, List
 import json
 
-def parse_job_description(jd_text: str) -> FunctionalJD:
+# OpenRouter, or a local model for short JDs when HIRO_LOCAL_LLM_URL is set (see
+# common.backends). The lambda looks call_llm up at call time.
+LLM_BACKENDS = BackendRouter(
+    remote=RemoteBackend("openrouter", DEFAULT_MODEL, complete=lambda prompt: call_llm(prompt, model=DEFAULT_MODEL)),
+    local=local_backend_from_env(),
+)
+
+
+def compact_jd_text(jd_text: str) -> str:
+    """
+    JD text as sent to the LLM: HTML and entities cleaned line by line (so the
+    layout survives), boilerplate and repeated bullets dropped, cut to the budget.
+    """
+    with span("jd.compact") as stage:
+        cleaned = "\n".join(clean_text(line) for line in jd_text.splitlines())
+        text = compaction.compact_text(cleaned)
+        stage.add(tokens_saved=max(0, compaction.estimate_tokens(jd_text) - compaction.estimate_tokens(text)))
+    return text
+
+
+def _llm_fields(jd_text: str) -> dict:
+    """
+    LLM extraction step: cached response or a new call, decoded to a dict.
+    """
+    cache = get_default_cache()
+    backend = LLM_BACKENDS.select(compaction.estimate_tokens(jd_text))
+    if compaction.ENABLED:
+        jd_text = compact_jd_text(jd_text)
+        cache_key = make_cache_key(jd_text, f"{JD_PROMPT_VERSION}/{compaction.COMPACTION_VERSION}",
+                                   backend.model, None)
+    else:
+        cache_key = make_cache_key(jd_text, JD_PROMPT_VERSION, backend.model, None)
+
+    with span("jd.llm", backend=backend.name) as stage:
+        llm_response = cache.get(cache_key) if cache else None
+        stage.add(cache_hits=int(llm_response is not None), cache_misses=int(llm_response is None))
+
+        if llm_response is None:
+            # 1. Create prompt
+            prompt = jd_extraction_prompt(jd_text)
+
+            # 2. Call LLM
+            llm_response = backend.complete(prompt)
+            cacheable = True
+        else:
+            cacheable = False
+
+        # 3. Load JSON from LLM response
+        try:
+            with span("jd.json_parse"):
+                jd_data = json.loads(llm_response)
+            if cacheable and cache:
+                cache.set(cache_key, llm_response)
+        except json.JSONDecodeError:
+            print("LLM returned invalid JSON, using empty schema.")
+            jd_data = {}
+    return jd_data
+
+
+# LLM fields and the types a batched answer must use for them
+JD_LLM_FIELDS = {
+    "title": str, "skills_hard": list, "skills_soft": list,
+    "experience_min_years": (int, float), "experience_max_years": (int, float),
+    "education": list, "projects": list, "certifications": list, "other_requirements": list,
+}
+
+
+def validate_jd_data(data) -> bool:
+    """
+    Accept one JD's data from a batched response.
+    """
+    if not isinstance(data, dict) or not set(data) & set(JD_LLM_FIELDS):
+        return False
+    return all(
+        data.get(key) is None or isinstance(data[key], types)
+        for key, types in JD_LLM_FIELDS.items()
+    )
+
+
+def _llm_fields_batch(documents: Dict[str, str]) -> Dict[str, dict]:
+    """
+    LLM fields for many JDs ({id: JD text}), packing short ones into shared requests.
+    """
+    cache = get_default_cache()
+    version = f"{JD_PROMPT_VERSION}/batch"
+    if compaction.ENABLED:
+        version += f"/{compaction.COMPACTION_VERSION}"
+
+    # Documents go into the prompt under short ids ("0", "1", ...), not their keys
+    ids = {str(i): doc_id for i, doc_id in enumerate(documents)}
+    results, todo, texts = {}, [], {}
+    for short_id, doc_id in ids.items():
+        texts[short_id] = text = compact_jd_text(documents[doc_id]) if compaction.ENABLED else documents[doc_id]
+        cached = None
+        for model in LLM_BACKENDS.models() if cache else ():
+            cached = cache.get(make_cache_key(text, version, model, None))
+            if cached is not None:
+                break
+        if cached is not None:
+            results[doc_id] = json.loads(cached)
+        else:
+            todo.append((short_id, text))
+
+    answered_by = {}
+
+    def batch_call(batch):
+        backend = LLM_BACKENDS.select(sum(compaction.estimate_tokens(text) for _, text in batch))
+        answered_by.update((short_id, backend.model) for short_id, _ in batch)
+        return backend.complete(jd_batch_extraction_prompt(batch))
+
+    single_call = lambda short_id, _: _llm_fields(documents[ids[short_id]])
+
+    for batch in pack_batches(todo):
+        outcome = run_batch(batch, batch_call, single_call, validate_jd_data)
+        for short_id, data in outcome.results.items():
+            results[ids[short_id]] = data
+            if cache and len(batch) > 1 and short_id not in outcome.retried:
+                key = make_cache_key(texts[short_id], version, answered_by[short_id], None)
+                cache.set(key, json.dumps(data, ensure_ascii=False))
+    return results
+
+
+def _rule_based_projects(jd_text: str) -> List[str]:
+    with span("jd.fallback.projects"):
+        return extract_projects(jd_text)
+
+
+@traced("jd.parse")
+def parse_job_description(jd_text: str, mode: str = None, deadline: float = DEFAULT_DEADLINE) -> FunctionalJD:
     """
     Parses JD using LLM for structured field extraction.
+    LLM responses are cached by JD content, so re-saved JDs skip the LLM call.
+
+    mode="concurrent" runs the rule-based project extractor while the LLM request is
+    in flight and waits at most `deadline` seconds for the LLM before falling back to
+    an empty LLM result (see common.orchestration).
     """
-    # 1. Create prompt
-    prompt = jd_extraction_prompt(jd_text)
+    if resolve_mode(mode) == CONCURRENT:
+        race = race_with_fallback(lambda: _llm_fields(jd_text), lambda: _rule_based_projects(jd_text), deadline)
+        if race.timed_out:
+            print(f"LLM missed the {deadline}s deadline, using rule-based fields only.")
+        jd_data, projects = race.llm or {}, race.fallback
+    else:
+        jd_data = _llm_fields(jd_text)
+        # ✅ Extract projects first using rule-based method
+        projects = _rule_based_projects(jd_text)
 
-    # 2. Call LLM
-    llm_response = call_llm(prompt)
+    return _to_functional_jd(jd_data, projects)
 
-    # 3. Load JSON from LLM response
-    try:
-        jd_data = json.loads(llm_response)
-    except json.JSONDecodeError:
-        print("LLM returned invalid JSON, using empty schema.")
-        jd_data = {}
 
-    # ✅ Extract projects first using rule-based method
-    projects = extract_projects(jd_text)
+def parse_job_descriptions(documents: Dict[str, str]) -> Dict[str, FunctionalJD]:
+    """
+    Parse many JDs ({id: JD text}) with batched LLM requests; same result per JD
+    as parse_job_description in serial mode.
+    """
+    with span("jd.parse_batch", docs=len(documents)):
+        llm_results = _llm_fields_batch(documents)
+        return {
+            doc_id: _to_functional_jd(llm_results.get(doc_id) or {}, _rule_based_projects(jd_text))
+            for doc_id, jd_text in documents.items()
+        }
+
+
+def _to_functional_jd(jd_data: dict, projects: List[str]) -> FunctionalJD:
+    """
+    Map LLM output to the schema with defaults; rule-based projects win over the LLM's.
+    """
     if not projects:
         # fallback to LLM parsed projects
         projects = jd_data.get("projects", [])
 
-    # 4. Map LLM output to schema with defaults
-    parsed = FunctionalJD(
+    return FunctionalJD(
         title = jd_data.get("title"),
         skills_hard = jd_data.get("skills_hard", []),
         skills_soft = jd_data.get("skills_soft", []),
@@ -49,10 +203,9 @@ def parse_job_description(jd_text: str) -> FunctionalJD:
         },
         education = jd_data.get("education", []),
         certifications = jd_data.get("certifications", []),
-        projects = jd_data.get("projects", []),
+        projects = projects,
         other_requirements = jd_data.get("other_requirements", [])
     )
-    return parsed
 
 if __name__ == "__main__":
     sample = """
@@ -1,12 +1,87 @@
-import requests
+import time
+
+from common.http_client import get_client
+from common.scheduler import get_scheduler, request_tokens
+from common.sse import aiter_content, iter_content
+from common.tracing import detached_span, record, span
 from .config import OPENROUTER_API_KEY
 
 BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
+DEFAULT_MODEL = "deepseek/deepseek-r1-0528-qwen3-8b:free"
+REQUEST_TIMEOUT = 60  # seconds; reasoning models on the free tier are slow
 
-def call_llm(prompt: str, model: str = "deepseek/deepseek-r1-0528-qwen3-8b:free") -> str:
+def call_llm(prompt: str, model: str = DEFAULT_MODEL) -> str:
     """
     Send a prompt to OpenRouter API and return the assistant response.
     """
+    headers, payload = _build_request(prompt, model)
+    with span("llm.openrouter", model=model) as stage:
+        stage.add(bytes_in=len(prompt.encode("utf-8")))
+        response = get_scheduler("openrouter").call(
+            lambda: get_client().post_sync(BASE_URL, json=payload, headers=headers, timeout=REQUEST_TIMEOUT),
+            tokens=request_tokens(prompt),
+        )
+        return _handle_response(response)
+
+async def acall_llm(prompt: str, model: str = DEFAULT_MODEL) -> str:
+    """
+    Async variant of call_llm; shares the same pooled connections.
+    """
+    headers, payload = _build_request(prompt, model)
+    with span("llm.openrouter", model=model) as stage:
+        stage.add(bytes_in=len(prompt.encode("utf-8")))
+        response = await get_scheduler("openrouter").acall(
+            lambda: get_client().post(BASE_URL, json=payload, headers=headers, timeout=REQUEST_TIMEOUT),
+            tokens=request_tokens(prompt),
+        )
+        return _handle_response(response)
+
+def stream_llm(prompt: str, model: str = DEFAULT_MODEL):
+    """
+    Stream an OpenRouter completion, yielding text fragments as they arrive.
+    Closing the generator early cancels the request.
+    """
+    headers, payload = _build_request(prompt, model, stream=True)
+    lines = get_scheduler("openrouter").stream(
+        lambda: get_client().stream_lines_sync(BASE_URL, json=payload, headers=headers, timeout=REQUEST_TIMEOUT),
+        tokens=request_tokens(prompt),
+    )
+    with detached_span("llm.openrouter.stream", model=model) as stage:
+        stage.add(bytes_in=len(prompt.encode("utf-8")))
+        start = time.perf_counter()
+        try:
+            for i, fragment in enumerate(iter_content(lines, on_usage=lambda u: _add_usage(stage, u))):
+                if i == 0:
+                    stage.set(first_token_ms=round((time.perf_counter() - start) * 1000, 1))
+                stage.add(bytes_out=len(fragment.encode("utf-8")))
+                yield fragment
+        finally:
+            lines.close()
+
+async def astream_llm(prompt: str, model: str = DEFAULT_MODEL):
+    """
+    Async variant of stream_llm.
+    """
+    headers, payload = _build_request(prompt, model, stream=True)
+    lines = get_scheduler("openrouter").astream(
+        lambda: get_client().stream_lines(BASE_URL, json=payload, headers=headers, timeout=REQUEST_TIMEOUT),
+        tokens=request_tokens(prompt),
+    )
+    with detached_span("llm.openrouter.stream", model=model) as stage:
+        stage.add(bytes_in=len(prompt.encode("utf-8")))
+        start = time.perf_counter()
+        first = True
+        try:
+            async for fragment in aiter_content(lines, on_usage=lambda u: _add_usage(stage, u)):
+                if first:
+                    stage.set(first_token_ms=round((time.perf_counter() - start) * 1000, 1))
+                    first = False
+                stage.add(bytes_out=len(fragment.encode("utf-8")))
+                yield fragment
+        finally:
+            await lines.aclose()
+
+def _build_request(prompt: str, model: str, stream: bool = False) -> tuple:
     if not OPENROUTER_API_KEY:
         raise ValueError("OPENROUTER_API_KEY is not set. Cannot make API request.")
 
@@ -19,8 +94,23 @@ def call_llm(prompt: str, model: str = "deepseek/deepseek-r1-0528-qwen3-8b:free"
         "model": model,
         "messages": [{"role": "user", "content": prompt}],
     }
+    if stream:
+        payload["stream"] = True
+    return headers, payload
 
-    response = requests.post(BASE_URL, json=payload, headers=headers)
+def _handle_response(response) -> str:
     response.raise_for_status()
     data = response.json()
+    usage = data.get("usage") or {}
+    record(
+        bytes_out=len(response.content),
+        prompt_tokens=usage.get("prompt_tokens", 0),
+        completion_tokens=usage.get("completion_tokens", 0),
+    )
     return data["choices"][0]["message"]["content"]
+
+def _add_usage(stage, usage: dict):
+    stage.add(
+        prompt_tokens=usage.get("prompt_tokens", 0),
+        completion_tokens=usage.get("completion_tokens", 0),
+    )
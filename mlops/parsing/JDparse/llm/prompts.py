@@ -1,3 +1,6 @@
+# Bump when the template changes so cached LLM responses are not reused
+JD_PROMPT_VERSION = "jd-v1"
+
 def jd_extraction_prompt(jd_text: str) -> str:
     return f"""
 Extract structured information from the following job description. 
@@ -19,3 +22,31 @@ JSON format:
   "other_requirements": ["<other requirement 1>", "<other requirement 2>"]
 }}
 """
+
+
+def jd_batch_extraction_prompt(documents) -> str:
+    """
+    Prompt for several job descriptions at once; documents is a list of (id, JD text).
+    """
+    jds = "\n\n".join(f'<job id="{doc_id}">\n{text}\n</job>' for doc_id, text in documents)
+    return f"""
+Extract structured information from each job description below.
+STRICTLY RETURN ONLY A VALID JSON ARRAY. DO NOT WRITE ANY EXPLANATION OR EXTRA TEXT.
+Return exactly one item per job, with its id copied from the <job> tag:
+[{{"id": "<job id>", "data": <object for that job>}}]
+
+Each data object uses this format:
+{{
+  "title": "<Job Title>",
+  "skills_hard": ["<hard skill 1>", "<hard skill 2>"],
+  "skills_soft": ["<soft skill 1>", "<soft skill 2>"],
+  "experience_min_years": <minimum years of experience, integer>,
+  "experience_max_years": <maximum years of experience, integer>,
+  "education": ["<degree 1>", "<degree 2>"],
+  "projects": ["<project 1>", "<project 2>"],
+  "certifications": ["<certification 1>", "<certification 2>"],
+  "other_requirements": ["<other requirement 1>", "<other requirement 2>"]
+}}
+
+{jds}
+"""
@@ -0,0 +1,42 @@
+# jdparsing/nlp.py
+"""
+Shared spaCy pipeline for the JD parser.
+
+The model is loaded once per process, on first use, instead of at import time in
+every module. Callers only need the tokenizer (PhraseMatcher on LOWER, is_stop and
+is_punct are lexical attributes) and sentence boundaries, so every statistical
+component is excluded and a rule-based sentencizer is added in their place.
+"""
+import os
+import threading
+from typing import Iterable, Iterator
+
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+MODEL_NAME = os.getenv("HIRO_SPACY_MODEL", "en_core_web_sm")
+
+# Components no caller uses; excluded components are never loaded from disk
+EXCLUDED_COMPONENTS = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+_nlp = None
+_lock = threading.Lock()
+
+
+def get_nlp() -> Language:
+    """Return the process-wide pipeline, loading it on first call."""
+    global _nlp
+    if _nlp is None:
+        with _lock:
+            if _nlp is None:
+                nlp = spacy.load(MODEL_NAME, exclude=EXCLUDED_COMPONENTS)
+                if "sentencizer" not in nlp.pipe_names:
+                    nlp.add_pipe("sentencizer")
+                _nlp = nlp
+    return _nlp
+
+
+def pipe(texts: Iterable[str], batch_size: int = 64, n_process: int = 1) -> Iterator[Doc]:
+    """Batch-process many texts through the shared pipeline (for bulk callers)."""
+    return get_nlp().pipe(texts, batch_size=batch_size, n_process=n_process)
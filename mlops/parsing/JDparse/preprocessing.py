@@ -2,9 +2,8 @@
 import re
 import html
 from typing import List
-import spacy
 
-nlp = spacy.load("en_core_web_sm", disable=["parser", "tagger"])
+from .nlp import get_nlp
 
 def clean_text(raw: str) -> str:
     """Basic cleaning: strip HTML, unescape entities, normalize whitespace."""
@@ -19,5 +18,5 @@ def clean_text(raw: str) -> str:
 
 def sentence_tokenize(text: str) -> List[str]:
     """Split into sentences using spaCy's sentencizer for robustness."""
-    doc = nlp(text)
+    doc = get_nlp()(text)
     return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
@@ -0,0 +1,47 @@
+# jdparsing/tests/test_fuzzy_index.py
+import random
+import re
+import string
+
+from rapidfuzz import process, fuzz
+
+from JDparse.extractors.fuzzy_index import FuzzySkillIndex
+from JDparse.tests.sample_jds import SIMPLE_JD, SIMPLE_JD3, SIMPLE_JD4, SIMPLE_JD5
+
+
+def extract_one(tok, vocab, threshold=85):
+    best = process.extractOne(tok, vocab, scorer=fuzz.WRatio)
+    return best[0] if best and best[1] >= threshold else None
+
+
+def make_vocab(rng, size):
+    vocab = ["python", "django", "aws", "docker", "Microsoft Office", "R", "C", " U", "x x x", ""]
+    while len(vocab) < size:
+        vocab.append("".join(rng.choice(string.ascii_letters + ".+#- ") for _ in range(rng.randint(1, 18))))
+    return vocab
+
+
+def test_matches_extract_one_on_jd_tokens():
+    rng = random.Random(0)
+    vocab = make_vocab(rng, 2000)
+    tokens = [t for jd in (SIMPLE_JD, SIMPLE_JD3, SIMPLE_JD4, SIMPLE_JD5)
+              for t in re.findall(r"\S+", jd) if len(t) > 1]
+
+    assert FuzzySkillIndex(vocab).match_many(tokens) == [extract_one(t, vocab) for t in tokens]
+
+
+def test_matches_extract_one_on_perturbed_vocab_entries():
+    rng = random.Random(1)
+    vocab = make_vocab(rng, 1000)
+    tokens = []
+    for _ in range(1500):
+        s = rng.choice(vocab)
+        i = rng.randint(0, len(s))
+        tokens.append(rng.choice([s.lower(), s[i:], s[:i] + "x" + s[i:], s + s[:3]]))
+    tokens = [t for t in tokens if len(t) > 1]
+
+    index = FuzzySkillIndex(vocab)
+    expected = [extract_one(t, vocab) for t in tokens]
+    assert index.match_many(tokens) == expected
+    # second pass is served from the memo
+    assert index.match_many(tokens) == expected
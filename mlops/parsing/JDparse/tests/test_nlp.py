@@ -0,0 +1,27 @@
+from JDparse import nlp
+from JDparse.extractors import skills_extractor
+from JDparse.preprocessing import sentence_tokenize
+
+
+def _use_blank_model(monkeypatch):
+    # en_core_web_sm is not needed to exercise the registry itself
+    monkeypatch.setattr(nlp, "MODEL_NAME", "blank:en")
+    monkeypatch.setattr(nlp, "_nlp", None)
+
+
+def test_pipeline_is_loaded_once_and_shared(monkeypatch):
+    _use_blank_model(monkeypatch)
+    first = nlp.get_nlp()
+    assert nlp.get_nlp() is first
+    assert first.pipe_names == ["sentencizer"]
+
+
+def test_sentence_tokenize_and_batch_extraction(monkeypatch):
+    _use_blank_model(monkeypatch)
+    monkeypatch.setattr(skills_extractor, "_phrase_matcher", None)
+    monkeypatch.setattr(skills_extractor, "_fuzzy_index", None)
+
+    assert sentence_tokenize("We use Python. You know Docker!") == ["We use Python.", "You know Docker!"]
+
+    texts = ["Experience with Python and Docker required.", "Strong communication and teamwork."]
+    assert skills_extractor.extract_skills_batch(texts) == [skills_extractor.extract_skills(t) for t in texts]
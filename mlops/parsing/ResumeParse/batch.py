@@ -0,0 +1,272 @@
+"""
+Batch resume parsing.
+
+Text extraction and the rule-based extractors run on a process pool, while the
+LLM calls (network bound) run on a separate thread pool so they overlap with
+the CPU work. Results are yielded as soon as each resume finishes, so a batch
+of thousands of uploads never has to sit in memory at once.
+
+With --llm-batch, extracted resumes are queued and sent to the LLM several per
+request (see common.batching), which cuts request count for bulk re-parses.
+
+Usage:
+    python batch.py uploads/ -o parsed.jsonl --workers 8 --llm-workers 16 [--llm-batch] [--trace spans.jsonl]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from resume_parser import extract_with_fallback, extract_with_llm, extract_with_llm_batch, merge_resume_data
+from text.extract import extract_text
+from common.batching import DEFAULT_BATCH_SIZE, DEFAULT_BATCH_TOKENS
+from common.compaction import estimate_tokens
+from common.scheduler import BACKFILL, request_priority
+from common.tracing import configure
+
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".odt", ".txt")
+
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage."""
+    docs: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+
+    def add(self, seconds: float, ok: bool = True):
+        self.docs += 1
+        self.busy_seconds += seconds
+        if not ok:
+            self.errors += 1
+
+
+@dataclass
+class BatchStats:
+    """Per-stage throughput for a batch run."""
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def stage(self, name: str) -> StageStats:
+        return self.stages.setdefault(name, StageStats())
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def summary(self) -> str:
+        """
+        One line per stage: documents handled, errors, mean latency and docs/sec over the wall clock.
+        """
+        elapsed = max(self.elapsed(), 1e-9)
+        lines = [f"Batch finished in {elapsed:.2f}s"]
+        for name, st in self.stages.items():
+            mean = st.busy_seconds / st.docs if st.docs else 0.0
+            lines.append(
+                f"  {name:<8} {st.docs:>6} docs  {st.errors:>4} errors  "
+                f"{mean * 1000:8.1f} ms/doc  {st.docs / elapsed:8.2f} docs/s"
+            )
+        return "\n".join(lines)
+
+
+def iter_resume_paths(inputs: Iterable[str]) -> Iterator[str]:
+    """
+    Expand files and directories into resume file paths (directories are walked recursively).
+    """
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                for name in sorted(files):
+                    if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield item
+
+
+def _extract_stage(path: str) -> dict:
+    """
+    CPU stage, runs in a worker process: text extraction plus every rule-based extractor.
+    """
+    start = time.perf_counter()
+    text, urls = extract_text(path)
+    fallback = extract_with_fallback(text, urls)
+    return {"text": text, "fallback": fallback, "seconds": time.perf_counter() - start}
+
+
+def _llm_stage(text: str) -> tuple:
+    """
+    I/O stage, runs on the thread pool. Bulk requests queue behind interactive ones.
+    """
+    start = time.perf_counter()
+    with request_priority(BACKFILL):
+        data = extract_with_llm(text)
+    return data, time.perf_counter() - start
+
+
+def _llm_batch_stage(texts: Dict[str, str]) -> tuple:
+    """
+    I/O stage for --llm-batch: several resumes, keyed by path, in shared requests.
+    """
+    start = time.perf_counter()
+    with request_priority(BACKFILL):
+        data = extract_with_llm_batch(texts)
+    return data, time.perf_counter() - start
+
+
+def parse_resumes_batch(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    llm_workers: Optional[int] = None,
+    use_llm: bool = True,
+    max_pending: Optional[int] = None,
+    stats: Optional[BatchStats] = None,
+    llm_batch: bool = False,
+) -> Iterator[dict]:
+    """
+    Parse many resumes, yielding one result dict per file in completion order.
+
+    Args:
+        paths: Resume file paths (consumed lazily).
+        workers: Process pool size for text extraction and regex extractors.
+        llm_workers: Thread pool size for concurrent LLM calls.
+        use_llm: Set False to run only the rule-based extractors.
+        max_pending: Maximum resumes in flight at once (bounds memory).
+        stats: Optional BatchStats that is updated as results complete.
+        llm_batch: Send several resumes per LLM request.
+
+    Yields:
+        {"path", "status": "ok", "data", "timings"} or {"path", "status": "error", "error"}.
+    """
+    workers = workers or os.cpu_count() or 1
+    llm_workers = llm_workers or 8
+    max_pending = max_pending or (workers + 2 * llm_workers)
+    stats = stats if stats is not None else BatchStats()
+
+    path_iter = iter(paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as cpu_pool, \
+            ThreadPoolExecutor(max_workers=llm_workers) as io_pool:
+        pending = {}
+        queued = {}  # path -> extracted, waiting for a batched LLM request
+        queued_tokens = 0
+
+        def submit_next() -> bool:
+            path = next(path_iter, None)
+            if path is None:
+                return False
+            pending[cpu_pool.submit(_extract_stage, path)] = ("extract", path, None)
+            return True
+
+        def flush_queue():
+            nonlocal queued, queued_tokens
+            texts = {path: extracted["text"] for path, extracted in queued.items()}
+            pending[io_pool.submit(_llm_batch_stage, texts)] = ("llm-batch", None, queued)
+            queued, queued_tokens = {}, 0
+
+        def finish(path, extracted, llm_data, llm_seconds) -> dict:
+            start = time.perf_counter()
+            data = merge_resume_data(llm_data, extracted["fallback"])
+            stats.stage("merge").add(time.perf_counter() - start)
+            return {
+                "path": path,
+                "status": "ok",
+                "data": data,
+                "timings": {"extract": extracted["seconds"], "llm": llm_seconds},
+            }
+
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        while pending or queued:
+            if queued and (not pending or len(queued) >= DEFAULT_BATCH_SIZE
+                           or queued_tokens >= DEFAULT_BATCH_TOKENS):
+                flush_queue()
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                stage, path, extracted = pending.pop(fut)
+
+                if stage == "llm-batch":
+                    results, llm_seconds = fut.result()
+                    share = llm_seconds / len(extracted)
+                    for path, item in extracted.items():
+                        llm_data = results.get(path) or {}
+                        stats.stage("llm").add(share, ok=bool(llm_data))
+                        yield finish(path, item, llm_data, share)
+                        submit_next()
+                    continue
+
+                if stage == "extract":
+                    try:
+                        extracted = fut.result()
+                    except Exception as e:
+                        stats.stage("extract").add(0.0, ok=False)
+                        yield {"path": path, "status": "error", "error": f"{type(e).__name__}: {e}"}
+                        submit_next()
+                        continue
+
+                    stats.stage("extract").add(extracted["seconds"])
+                    if use_llm and llm_batch:
+                        queued[path] = extracted
+                        queued_tokens += estimate_tokens(extracted["text"])
+                        continue
+                    if use_llm:
+                        llm_fut = io_pool.submit(_llm_stage, extracted["text"])
+                        pending[llm_fut] = ("llm", path, extracted)
+                        continue
+                    llm_data, llm_seconds = {}, 0.0
+                else:
+                    llm_data, llm_seconds = fut.result()
+                    stats.stage("llm").add(llm_seconds, ok=bool(llm_data))
+
+                yield finish(path, extracted, llm_data, llm_seconds)
+                submit_next()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Parse a batch of resumes into JSONL.")
+    parser.add_argument("inputs", nargs="+", help="Resume files or directories")
+    parser.add_argument("-o", "--output", default="-", help="Output JSONL path (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    parser.add_argument("--llm-workers", type=int, default=8, help="Concurrent LLM calls")
+    parser.add_argument("--no-llm", action="store_true", help="Only run the rule-based extractors")
+    parser.add_argument("--llm-batch", action="store_true", help="Send several resumes per LLM request")
+    parser.add_argument("--trace", metavar="FILE", help="Append per-stage spans to this JSONL file")
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        # Worker processes read the same settings from the environment
+        os.environ["HIRO_TRACING"] = "1"
+        os.environ["HIRO_TRACE_FILE"] = args.trace
+        configure(enabled=True, jsonl_path=args.trace)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    stats = BatchStats()
+    failed = 0
+    try:
+        results = parse_resumes_batch(
+            iter_resume_paths(args.inputs),
+            workers=args.workers,
+            llm_workers=args.llm_workers,
+            use_llm=not args.no_llm,
+            stats=stats,
+            llm_batch=args.llm_batch,
+        )
+        for result in results:
+            if result["status"] != "ok":
+                failed += 1
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(stats.summary(), file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,29 @@
-import re
+try:
+    from extractors.patterns import compiled
+except ImportError:  # run directly as a script from extractors/
+    from patterns import compiled
+
+
+# Email pattern - more strict to avoid false positives
+EMAIL_RE = compiled("resume.basic_info.email", r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
+
+# Phone pattern - handles various formats
+PHONE_RE = compiled(
+    "resume.basic_info.phone",
+    r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{3,4}\b',
+)
+
+# URL pattern
+URL_RE = compiled("resume.basic_info.url", r'https?://[^\s]+')
+
+NON_PHONE_CHARS_RE = compiled("resume.basic_info.non_phone_chars", r'[^\d+]')
+DIGIT_RUN_RE = compiled("resume.basic_info.digit_run", r'\d{3,}')
 
 
 def extract_basic_info(text: str, extra_urls: list[str] = None) -> dict:
     """
     Extracts basic info like name, emails, phone numbers, and URLs from resume text.
     """
-    # Email pattern - more strict to avoid false positives
-    EMAIL_RE = re.compile(
-        r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
-    )
-    
-    # Phone pattern - handles various formats
-    PHONE_RE = re.compile(
-        r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{3,4}\b'
-    )
-    
-    # URL pattern
-    URL_RE = re.compile(r'https?://[^\s]+')
-    
     # Extract emails
     emails = list(set(EMAIL_RE.findall(text)))
     # Filter out generic/placeholder emails
@@ -28,7 +34,7 @@ def extract_basic_info(text: str, extra_urls: list[str] = None) -> dict:
     phones = []
     for phone in phones_raw:
         # Clean phone number
-        clean = re.sub(r'[^\d+]', '', phone)
+        clean = NON_PHONE_CHARS_RE.sub('', phone)
         # Filter valid phone numbers (7-15 digits)
         if 7 <= len(clean.replace('+', '')) <= 15:
             phones.append(phone.strip())
@@ -82,7 +88,7 @@ def extract_name(text: str) -> str:
     # Check first few lines
     for line in lines[:5]:
         # Skip if line has email, phone, or URL
-        if '@' in line or 'http' in line or re.search(r'\d{3,}', line):
+        if '@' in line or 'http' in line or DIGIT_RUN_RE.search(line):
             continue
         
         # Skip common headers
@@ -1,6 +1,13 @@
 import re
 from typing import List
 
+try:
+    from extractors.patterns import PatternSet, compiled, register
+    from extractors.sections import ResumeSections, segment_resume
+except ImportError:  # run directly as a script from extractors/
+    from patterns import PatternSet, compiled, register
+    from sections import ResumeSections, segment_resume
+
 
 # Common certification providers and keywords
 CERT_PROVIDERS = [
@@ -24,14 +31,42 @@ CERT_TYPES = [
     "A+", "Cloud+", "Linux+", "CCNA", "CCNP", "MCSA", "MCSE", "OCA", "OCP"
 ]
 
+# Matches of different alternatives may overlap ("AWS Certified ..." also
+# contains "Certified ..."), and every one is kept, so these are scanned one
+# precompiled pattern at a time with PatternSet.every rather than merged.
+
+# Known certification types, each through to the end of its line
+CERT_TYPE_PATTERNS = register("resume.certifications.types", PatternSet(
+    [(f"type_{i}", r'\b' + re.escape(cert_type) + r'\b.*?(?=\n|$)') for i, cert_type in enumerate(CERT_TYPES)],
+    re.IGNORECASE,
+    literals={f"type_{i}": cert_type.lower() for i, cert_type in enumerate(CERT_TYPES)},
+))
+
+CERT_PATTERNS = register("resume.certifications.patterns", PatternSet([
+    # "Certified [Something] by [Provider]"
+    ("certified_by", r'Certified\s+[\w\s]+(?:by|from)\s+[A-Z][\w\s]+'),
+    # "[Provider] Certified [Something]"
+    ("provider_certified", r'(?:' + '|'.join(re.escape(p) for p in CERT_PROVIDERS) + r')\s+Certified\s+[\w\s]+'),
+    # "Certificate in [Something]"
+    ("certificate_in", r'Certificate\s+(?:in|of)\s+[\w\s]+'),
+    # "[Something] Certification"
+    ("certification", r'[\w\s]+\s+Certification(?:\s+by|\s+from)?\s*[A-Z][\w\s]*'),
+], re.IGNORECASE, literals={
+    "certified_by": "certified", "provider_certified": "certified",
+    "certificate_in": "certificate", "certification": "certification",
+}))
+
+WHITESPACE_RE = compiled("resume.certifications.whitespace", r'\s+')
+DATED_PARENTHETICAL_RE = compiled("resume.certifications.dated_parenthetical", r'\s*\([^)]*\d{4}[^)]*\)')
+
 
-def extract_certifications(text: str) -> List[str]:
+def extract_certifications(text: str, sections: ResumeSections = None) -> List[str]:
     """
     Extract professional certifications from resume text.
     Returns list of certification names with issuing organization if available.
     """
     # Find certifications section
-    cert_section = extract_certifications_section(text)
+    cert_section = extract_certifications_section(text, sections)
     
     # If no section found, search in full text
     search_text = cert_section if cert_section else text
@@ -39,33 +74,17 @@ def extract_certifications(text: str) -> List[str]:
     certifications = set()
     
     # Method 1: Look for known certification types
-    for cert_type in CERT_TYPES:
-        pattern = r'\b' + re.escape(cert_type) + r'\b.*?(?=\n|$)'
-        matches = re.findall(pattern, search_text, re.IGNORECASE)
-        for match in matches:
-            # Clean up the match
-            cleaned = clean_certification_text(match)
-            if cleaned:
-                certifications.add(cleaned)
+    for _, match in CERT_TYPE_PATTERNS.every(search_text):
+        # Clean up the match
+        cleaned = clean_certification_text(match.group(0))
+        if cleaned:
+            certifications.add(cleaned)
     
     # Method 2: Look for certification patterns
-    patterns = [
-        # "Certified [Something] by [Provider]"
-        r'Certified\s+[\w\s]+(?:by|from)\s+[A-Z][\w\s]+',
-        # "[Provider] Certified [Something]"
-        r'(?:' + '|'.join(re.escape(p) for p in CERT_PROVIDERS) + r')\s+Certified\s+[\w\s]+',
-        # "Certificate in [Something]"
-        r'Certificate\s+(?:in|of)\s+[\w\s]+',
-        # "[Something] Certification"
-        r'[\w\s]+\s+Certification(?:\s+by|\s+from)?\s*[A-Z][\w\s]*'
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, search_text, re.IGNORECASE)
-        for match in matches:
-            cleaned = clean_certification_text(match)
-            if cleaned and is_valid_certification(cleaned):
-                certifications.add(cleaned)
+    for _, match in CERT_PATTERNS.every(search_text):
+        cleaned = clean_certification_text(match.group(0))
+        if cleaned and is_valid_certification(cleaned):
+            certifications.add(cleaned)
     
     # Method 3: Parse certifications section line by line if it exists
     if cert_section:
@@ -91,22 +110,12 @@ def extract_certifications(text: str) -> List[str]:
     return sorted(valid_certs)
 
 
-def extract_certifications_section(text: str) -> str:
+def extract_certifications_section(text: str, sections: ResumeSections = None) -> str:
     """
     Extract the certifications section from resume.
     """
-    patterns = [
-        r'Certifications?[:\-]?\s*(.+?)(?=\n\s*(?:Experience|Education|Skills|Projects|References)[:\-]|\Z)',
-        r'Professional\s+Certifications?[:\-]?\s*(.+?)(?=\n\s*(?:Experience|Education|Skills|Projects)[:\-]|\Z)',
-        r'Licenses?\s+(?:and|&)\s+Certifications?[:\-]?\s*(.+?)(?=\n\s*(?:Experience|Education|Skills|Projects)[:\-]|\Z)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            return match.group(1).strip()
-    
-    return ""
+    sections = sections or segment_resume(text)
+    return sections.get("certifications")
 
 
 def clean_certification_text(text: str) -> str:
@@ -114,10 +123,10 @@ def clean_certification_text(text: str) -> str:
     Clean and format certification text.
     """
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE_RE.sub(' ', text).strip()
     
     # Remove dates in parentheses
-    text = re.sub(r'\s*\([^)]*\d{4}[^)]*\)', '', text)
+    text = DATED_PARENTHETICAL_RE.sub('', text)
     
     # Remove trailing punctuation
     text = text.rstrip('.,;:')
@@ -1,38 +1,42 @@
 import re
 from typing import List
 
+try:
+    from extractors.patterns import PatternSet, compiled, register
+    from extractors.sections import ResumeSections, segment_resume
+except ImportError:  # run directly as a script from extractors/
+    from patterns import PatternSet, compiled, register
+    from sections import ResumeSections, segment_resume
 
-def extract_education(text: str) -> List[dict]:
+
+# Common degree patterns, highest priority first; the first that matches a line wins
+DEGREE_PATTERNS = register("resume.education.degree", PatternSet([
+    ("bachelor", r'\b(?:BS|BSc|B\.S\.|Bachelor(?:\'s)?)\s+(?:of\s+)?(?:Science\s+)?(?:in\s+)?([A-Za-z\s&]+?)(?=\s*\n|\s*Expected|\s*\d{4}|\s*[A-Z][a-z]+\s+\d{4})'),
+    ("master", r'\b(?:MS|MSc|M\.S\.|Master(?:\'s)?)\s+(?:of\s+)?(?:Science\s+)?(?:in\s+)?([A-Za-z\s&]+?)(?=\s*\n|\s*Expected|\s*\d{4})'),
+    ("doctorate", r'\b(?:PhD|Ph\.D\.|Doctorate)\s+(?:in\s+)?([A-Za-z\s&]+?)(?=\s*\n|\s*Expected|\s*\d{4})'),
+    ("other_degree", r'\b(?:MBA|BBA|MPhil)\b'),
+    ("school", r'\b(?:Intermediate|Matriculation|O-Level|A-Level)\b'),
+], re.IGNORECASE))
+
+EDUCATION_HEADER_RE = compiled("resume.education.header", r'^\s*Education\s*$', re.IGNORECASE)
+EDUCATION_DATE_RE = compiled(
+    "resume.education.date",
+    r'(?:Expected\s+)?([A-Z][a-z]+\s+\d{4}|\d{4}|[A-Z][a-z]+\.\s+\d{4}\s*[-–]\s*[A-Z][a-z]+\.\s+\d{4})',
+)
+
+
+def extract_education(text: str, sections: ResumeSections = None) -> List[dict]:
     """
     Extract education entries with degree, institution, location, and dates.
     Returns list of structured education dicts.
     """
-    # Split text into sections
-    sections = re.split(r'\n\s*\n', text)
+    sections = sections or segment_resume(text)
     
     education_entries = []
     
-    # Common degree patterns
-    degree_patterns = [
-        r'\b(?:BS|BSc|B\.S\.|Bachelor(?:\'s)?)\s+(?:of\s+)?(?:Science\s+)?(?:in\s+)?([A-Za-z\s&]+?)(?=\s*\n|\s*Expected|\s*\d{4}|\s*[A-Z][a-z]+\s+\d{4})',
-        r'\b(?:MS|MSc|M\.S\.|Master(?:\'s)?)\s+(?:of\s+)?(?:Science\s+)?(?:in\s+)?([A-Za-z\s&]+?)(?=\s*\n|\s*Expected|\s*\d{4})',
-        r'\b(?:PhD|Ph\.D\.|Doctorate)\s+(?:in\s+)?([A-Za-z\s&]+?)(?=\s*\n|\s*Expected|\s*\d{4})',
-        r'\b(?:MBA|BBA|MPhil)\b',
-        r'\b(?:Intermediate|Matriculation|O-Level|A-Level)\b',
-    ]
     
-    # Look for education section
-    edu_section_idx = -1
-    for i, section in enumerate(sections):
-        if re.search(r'^\s*Education\s*$', section, re.IGNORECASE | re.MULTILINE):
-            edu_section_idx = i
-            break
-    
-    # If education section found, focus on that and next few sections
-    if edu_section_idx >= 0:
-        relevant_text = '\n\n'.join(sections[edu_section_idx:edu_section_idx+5])
-    else:
-        relevant_text = text
+    # If education section found, focus on that
+    relevant_text = sections.get("education") or text
     
     # Split by newlines and process
     lines = relevant_text.split('\n')
@@ -48,32 +52,26 @@ def extract_education(text: str) -> List[dict]:
             continue
         
         # Skip "Education" header
-        if re.match(r'^\s*Education\s*$', line, re.IGNORECASE):
+        if EDUCATION_HEADER_RE.match(line):
             continue
         
         # Check for degree
-        degree_found = False
-        for pattern in degree_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                if not current_entry:
-                    current_entry = {'degree': '', 'field': '', 'institution': '', 'location': '', 'dates': ''}
-                
-                degree_text = match.group(0)
-                if match.groups():
-                    current_entry['degree'] = degree_text.split(match.group(1))[0].strip()
-                    current_entry['field'] = match.group(1).strip()
-                else:
-                    current_entry['degree'] = degree_text
-                
-                degree_found = True
-                break
-        
-        if degree_found:
+        found = DEGREE_PATTERNS.first(line)
+        if found:
+            _, match = found
+            if not current_entry:
+                current_entry = {'degree': '', 'field': '', 'institution': '', 'location': '', 'dates': ''}
+            
+            degree_text = match.group(0)
+            if match.groups():
+                current_entry['degree'] = degree_text.split(match.group(1))[0].strip()
+                current_entry['field'] = match.group(1).strip()
+            else:
+                current_entry['degree'] = degree_text
             continue
         
         # Check for dates (graduation date or range)
-        date_match = re.search(r'(?:Expected\s+)?([A-Z][a-z]+\s+\d{4}|\d{4}|[A-Z][a-z]+\.\s+\d{4}\s*[-–]\s*[A-Z][a-z]+\.\s+\d{4})', line)
+        date_match = EDUCATION_DATE_RE.search(line)
         if date_match and current_entry:
             current_entry['dates'] = date_match.group(1).strip()
             continue
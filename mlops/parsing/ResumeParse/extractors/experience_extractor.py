@@ -2,14 +2,40 @@ import re
 from datetime import datetime
 from typing import List, Dict
 
-
-def extract_experience(text: str) -> str:
+try:
+    from extractors.patterns import PatternSet, compiled, register
+    from extractors.sections import ResumeSections, segment_resume
+except ImportError:  # run directly as a script from extractors/
+    from patterns import PatternSet, compiled, register
+    from sections import ResumeSections, segment_resume
+
+
+# Explicit statements, tried in this order: "5+ years of experience",
+# "experience of 5 years", "3-5 years of experience"
+EXPLICIT_EXPERIENCE = register("resume.experience.explicit", PatternSet([
+    ("years_of_experience", r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)'),
+    ("experience_of_years", r'(?:experience|exp)(?:\s+of)?\s+(\d+)\+?\s*(?:years?|yrs?)'),
+    ("years_range", r'(\d+)\s*-\s*(\d+)\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)'),
+], re.IGNORECASE))
+
+# Date ranges like "June 2024 – Jan 2025" or "May 2024 – Aug 2024"
+DATE_RANGE_RE = compiled(
+    "resume.experience.date_range",
+    r'([A-Z][a-z]+\.?\s+\d{4})\s*[-–—]\s*([A-Z][a-z]+\.?\s+\d{4}|Present|Current)',
+    re.IGNORECASE,
+)
+
+DATE_RANGE_LINE_RE = compiled("resume.experience.date_range_line", r'^[A-Z][a-z]+\.?\s+\d{4}\s*[-–]')
+DATE_LINE_RE = compiled("resume.experience.date_line", r'^[A-Z][a-z]+\s+\d{4}')
+
+
+def extract_experience(text: str, sections: ResumeSections = None) -> str:
     """
     Calculate total years of experience from work history.
     Returns string like '2 years' or '6 months' or '1.5 years'
     """
     # Find experience section
-    exp_section = extract_experience_section(text)
+    exp_section = extract_experience_section(text, sections)
     
     if not exp_section:
         # Fallback: search for explicit experience mentions
@@ -44,42 +70,26 @@ def extract_experience(text: str) -> str:
             return f"{years} years"
 
 
-def extract_experience_section(text: str) -> str:
+def extract_experience_section(text: str, sections: ResumeSections = None) -> str:
     """
     Extract the experience/work history section.
     """
-    patterns = [
-        r'(?:Work\s+)?Experience[:\-]?\s*(.+?)(?=\n\s*(?:Education|Projects|Skills|Certifications)[:\-]|\Z)',
-        r'(?:Professional\s+)?(?:Work\s+)?History[:\-]?\s*(.+?)(?=\n\s*(?:Education|Projects|Skills|Certifications)[:\-]|\Z)',
-        r'Employment[:\-]?\s*(.+?)(?=\n\s*(?:Education|Projects|Skills|Certifications)[:\-]|\Z)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            return match.group(1).strip()
-    
-    return ""
+    sections = sections or segment_resume(text)
+    return sections.get("experience")
 
 
 def find_explicit_experience(text: str) -> str:
     """
     Find explicitly stated experience like '5+ years of experience'
     """
-    patterns = [
-        r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)',
-        r'(?:experience|exp)(?:\s+of)?\s+(\d+)\+?\s*(?:years?|yrs?)',
-        r'(\d+)\s*-\s*(\d+)\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            if match.lastindex == 2:
-                # Range like "3-5 years"
-                return f"{match.group(1)}-{match.group(2)} years"
-            else:
-                return f"{match.group(1)} years"
+    found = EXPLICIT_EXPERIENCE.first(text)
+    if found:
+        _, match = found
+        if match.lastindex == 2:
+            # Range like "3-5 years"
+            return f"{match.group(1)}-{match.group(2)} years"
+        else:
+            return f"{match.group(1)} years"
     
     return ""
 
@@ -91,10 +101,7 @@ def extract_date_ranges(text: str) -> List[tuple]:
     """
     date_ranges = []
     
-    # Pattern for date ranges like "June 2024 – Jan 2025" or "May 2024 – Aug 2024"
-    pattern = r'([A-Z][a-z]+\.?\s+\d{4})\s*[-–—]\s*([A-Z][a-z]+\.?\s+\d{4}|Present|Current)'
-    
-    matches = re.findall(pattern, text, re.IGNORECASE)
+    matches = DATE_RANGE_RE.findall(text)
     
     for start_str, end_str in matches:
         try:
@@ -148,11 +155,11 @@ def calculate_months_between(start: datetime, end: datetime) -> int:
     return max(0, total_months)
 
 
-def extract_companies(text: str) -> List[str]:
+def extract_companies(text: str, sections: ResumeSections = None) -> List[str]:
     """
     Extract company names from experience section.
     """
-    exp_section = extract_experience_section(text)
+    exp_section = extract_experience_section(text, sections)
     if not exp_section:
         return []
     
@@ -166,7 +173,7 @@ def extract_companies(text: str) -> List[str]:
         line = line.strip()
         
         # Skip empty lines and dates
-        if not line or re.match(r'^[A-Z][a-z]+\.?\s+\d{4}\s*[-–]', line):
+        if not line or DATE_RANGE_LINE_RE.match(line):
             continue
         
         # Check if line looks like a company name
@@ -174,7 +181,7 @@ def extract_companies(text: str) -> List[str]:
         if (line[0].isupper() and 
             len(line.split()) <= 6 and 
             not line.startswith('•') and
-            not re.match(r'^[A-Z][a-z]+\s+\d{4}', line)):
+            not DATE_LINE_RE.match(line)):
             
             # Additional validation: not a location or common header
             if not any(word in line.lower() for word in [
@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+# The shared registry lives in mlops/parsing/common, next to ResumeParse
+_PARSING_DIR = str(Path(__file__).resolve().parents[2])
+if _PARSING_DIR not in sys.path:
+    sys.path.append(_PARSING_DIR)
+
+from common.regex_registry import REGISTRY, PatternSet, compiled, register  # noqa: E402,F401
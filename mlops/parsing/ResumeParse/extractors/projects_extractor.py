@@ -1,14 +1,26 @@
 import re
 from typing import List, Dict
 
+try:
+    from extractors.patterns import compiled
+    from extractors.sections import ResumeSections, segment_resume
+except ImportError:  # run directly as a script from extractors/
+    from patterns import compiled
+    from sections import ResumeSections, segment_resume
 
-def extract_projects(text: str) -> List[Dict[str, str]]:
+
+# "Project Name | Tech, Stack" header lines
+PROJECT_HEADER_RE = compiled("resume.projects.header", r'(.+?)\s*\|\s*(.+)')
+WHITESPACE_RE = compiled("resume.projects.whitespace", r'\s+')
+
+
+def extract_projects(text: str, sections: ResumeSections = None) -> List[Dict[str, str]]:
     """
     Extract project information from resume.
     Returns list of dicts with project name, tech stack, and description.
     """
     # Find projects section
-    projects_section = extract_projects_section(text)
+    projects_section = extract_projects_section(text, sections)
     
     if not projects_section:
         return []
@@ -28,7 +40,7 @@ def extract_projects(text: str) -> List[Dict[str, str]]:
             continue
         
         # Check if line is a project title (has tech stack in pipe format)
-        tech_match = re.search(r'(.+?)\s*\|\s*(.+)', line)
+        tech_match = PROJECT_HEADER_RE.search(line)
         if tech_match and not line.startswith('•'):
             # This is likely a project header
             if current_project and current_project.get('name'):
@@ -61,7 +73,7 @@ def extract_projects(text: str) -> List[Dict[str, str]]:
     for project in projects:
         if project['description']:
             # Remove extra whitespace
-            project['description'] = re.sub(r'\s+', ' ', project['description']).strip()
+            project['description'] = WHITESPACE_RE.sub(' ', project['description']).strip()
             # Limit length
             if len(project['description']) > 300:
                 project['description'] = project['description'][:300] + '...'
@@ -69,22 +81,12 @@ def extract_projects(text: str) -> List[Dict[str, str]]:
     return projects
 
 
-def extract_projects_section(text: str) -> str:
+def extract_projects_section(text: str, sections: ResumeSections = None) -> str:
     """
     Extract the projects section from resume.
     """
-    patterns = [
-        r'Projects?[:\-]?\s*(.+?)(?=\n\s*(?:Experience|Education|Skills|Certifications|Technical Skills)[:\-]|\Z)',
-        r'Academic\s+Projects?[:\-]?\s*(.+?)(?=\n\s*(?:Experience|Education|Skills|Certifications)[:\-]|\Z)',
-        r'Personal\s+Projects?[:\-]?\s*(.+?)(?=\n\s*(?:Experience|Education|Skills|Certifications)[:\-]|\Z)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            return match.group(1).strip()
-    
-    return ""
+    sections = sections or segment_resume(text)
+    return sections.get("projects")
 
 
 def format_projects_for_output(projects: List[Dict[str, str]]) -> List[str]:
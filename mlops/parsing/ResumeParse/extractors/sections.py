@@ -0,0 +1,124 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+# Canonical section type -> header titles (regex fragments, matched case-insensitively).
+# A header is a line holding only the title, optionally prefixed by a qualifier
+# ("Technical Skills", "Highlighted Personal Projects") and followed by ':' or '-'.
+# One-word titles that are also skills ("Leadership", "Research") are left out,
+# so a bare skill line does not end the skills section.
+SECTION_HEADERS: Dict[str, List[str]] = {
+    "summary": [r"summary", r"profile", r"objective", r"about(?:\s+me)?"],
+    "experience": [r"experience", r"work\s+history", r"employment(?:\s+history)?",
+                   r"(?:professional\s+)?history", r"internships?"],
+    "education": [r"education(?:al\s+background)?", r"academic\s+background", r"academics"],
+    "coursework": [r"coursework", r"courses"],
+    "skills": [r"skills(?:\s*(?:&|and)\s*(?:tools|technologies|interests))?", r"competencies",
+               r"tools\s*(?:&|and)\s*technologies", r"tech\s+stack", r"areas\s+of\s+expertise"],
+    "projects": [r"projects?"],
+    "certifications": [r"certifications?(?:\s*(?:&|and)\s*(?:licenses?|courses|awards))?",
+                       r"licenses?\s*(?:&|and)\s*certifications?", r"certificates?"],
+    "awards": [r"awards?(?:\s*(?:&|and)\s*honou?rs)?", r"honou?rs", r"achievements?", r"accomplishments"],
+    "publications": [r"publications?"],
+    "volunteering": [r"volunteer(?:ing|\s+experience|\s+work)?", r"extracurricular(?:\s+activities)?",
+                     r"leadership\s*(?:&|and)\s*activities"],
+    "interests": [r"interests", r"hobbies(?:\s*(?:&|and)\s*interests)?"],
+    "references": [r"references?"],
+}
+
+QUALIFIERS = (r"(?:(?:technical|core|key|professional|work|relevant|selected|notable|highlighted|"
+              r"personal|academic|additional|other|industry|research|career|related)\s+)*")
+
+# Zero-width and non-breaking characters some PDF generators leave around headings
+_BLANK = r"[ \t\u00a0\u200b\u200c\u200d\ufeff]"
+
+HEADER_PATTERN = re.compile(
+    rf"^{_BLANK}*(?P<title>{QUALIFIERS}(?:"
+    + "|".join(f"(?P<{name}>{'|'.join(titles)})" for name, titles in SECTION_HEADERS.items())
+    + rf")){_BLANK}*[:\-]?{_BLANK}*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class Section:
+    """
+    One resume section: `name` is the canonical type, `title` the header as written.
+    Offsets index the original text: the header spans [start, body_start) and
+    the body [body_start, end).
+    """
+    name: str
+    title: str
+    start: int
+    body_start: int
+    end: int
+
+
+class ResumeSections:
+    """
+    Typed section map of one resume, built once and shared by the extractors.
+    """
+
+    def __init__(self, text: str, sections: List[Section]):
+        self.text = text
+        self.sections = sections
+
+    def __contains__(self, name: str) -> bool:
+        return any(s.name == name for s in self.sections)
+
+    def all(self, name: str) -> List[Section]:
+        return [s for s in self.sections if s.name == name]
+
+    def body(self, section: Section) -> str:
+        return self.text[section.body_start:section.end].strip()
+
+    def get(self, name: str) -> str:
+        """
+        Body of the first section of this type, or "" if the resume has none.
+        """
+        for section in self.sections:
+            if section.name == name:
+                return self.body(section)
+        return ""
+
+    def names(self) -> List[str]:
+        return [s.name for s in self.sections]
+
+
+def segment_resume(text: str) -> ResumeSections:
+    """
+    Split a resume into sections with a single scan for header lines.
+    Text before the first header (name, contact details) is not a section.
+    """
+    headers = []
+    for match in HEADER_PATTERN.finditer(text):
+        name = next(name for name in SECTION_HEADERS if match.group(name))
+        headers.append((name, match.group("title").strip(), match.start(), match.end()))
+
+    sections = []
+    for i, (name, title, start, body_start) in enumerate(headers):
+        end = headers[i + 1][2] if i + 1 < len(headers) else len(text)
+        sections.append(Section(name, title, start, body_start, end))
+    return ResumeSections(text, sections)
+
+
+# Test
+if __name__ == "__main__":
+    sample = """
+    Jane Doe
+    jane@doe.dev
+
+    Professional Summary
+    Backend engineer with 5 years of experience.
+
+    WORK EXPERIENCE
+    Software Engineer
+    Jan 2020 - Present
+
+    Technical Skills:
+    Languages: Python, Go
+    """
+
+    for section in segment_resume(sample).sections:
+        print(f"{section.name:<12} {section.title!r:<24} [{section.start}:{section.end}]")
@@ -1,5 +1,16 @@
 import re
-from typing import List, Set
+from bisect import bisect_right
+from typing import Dict, List, Optional, Set
+
+try:
+    from extractors.patterns import compiled
+    from extractors.sections import ResumeSections, segment_resume
+except ImportError:  # run directly as a script from extractors/
+    from patterns import compiled
+    from sections import ResumeSections, segment_resume
+
+
+SKILL_DELIMITERS_RE = compiled("resume.skills.delimiters", r'[,;\n•\-\|]')
 
 
 # Comprehensive skill database organized by category
@@ -68,32 +79,165 @@ for category in SKILL_DATABASE.values():
     ALL_SKILLS.extend(category)
 
 
-def extract_skills(text: str) -> List[str]:
+def _is_word(ch: str) -> bool:
+    # Same definition as the regex \w class for str patterns
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Finds every vocabulary skill in a text with one linear scan.
+
+    Matching is case-insensitive and uses the same word-boundary rule as
+    r'\\b' + re.escape(skill) + r'\\b', so results equal running one regex per skill.
+    Internally it is an Aho-Corasick automaton over the lowercased skills.
+    """
+
+    def __init__(self, skills: List[str]):
+        self.skills = list(skills)
+
+        # pattern (lowercased) -> skill names that produce it
+        self._names: List[List[str]] = []
+        self._lengths: List[int] = []
+        pattern_ids: Dict[str, int] = {}
+        for skill in self.skills:
+            pattern = skill.lower()
+            if not pattern:
+                continue
+            if pattern not in pattern_ids:
+                pattern_ids[pattern] = len(self._names)
+                self._names.append([])
+                self._lengths.append(len(pattern))
+            self._names[pattern_ids[pattern]].append(skill)
+
+        self._build_automaton(pattern_ids)
+        self._build_substring_index()
+
+    def _build_automaton(self, pattern_ids: Dict[str, int]):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+
+        for pattern, pid in pattern_ids.items():
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            out[node].append(pid)
+
+        # Breadth-first failure links; outputs are merged along them
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for node in queue:
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                out[child] = out[child] + out[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def _build_substring_index(self):
+        # All lowercased skills joined by a separator: str.find on it returns the
+        # first skill (in vocabulary order) containing a token.
+        lowered = [s.lower() for s in self.skills]
+        starts = []
+        pos = 1
+        for skill in lowered:
+            starts.append(pos)
+            pos += len(skill) + 1
+        self._joined = "\x00" + "\x00".join(lowered) + "\x00"
+        self._starts = starts
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Return the skills that occur in `text` as whole words (case-insensitive).
+        """
+        text = text.lower()
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        n = len(text)
+        found_ids: Set[int] = set()
+
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            for pid in out[node]:
+                if pid in found_ids:
+                    continue
+                start = i - lengths[pid] + 1
+                # \b before the match
+                before = _is_word(text[start - 1]) if start > 0 else False
+                if before == _is_word(text[start]):
+                    continue
+                # \b after the match
+                after = _is_word(text[i + 1]) if i + 1 < n else False
+                if after == _is_word(ch):
+                    continue
+                found_ids.add(pid)
+
+        found: Set[str] = set()
+        for pid in found_ids:
+            found.update(self._names[pid])
+        return found
+
+    def first_containing(self, token: str) -> Optional[str]:
+        """
+        Return the first skill (vocabulary order) whose lowercase form contains `token`.
+        """
+        token = token.lower()
+        if not token or "\x00" in token:
+            return None
+        pos = self._joined.find(token)
+        if pos == -1:
+            return None
+        return self.skills[bisect_right(self._starts, pos) - 1]
+
+
+_skill_matcher = None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """
+    Matcher over ALL_SKILLS, built on first use and rebuilt if the list grows or shrinks.
+    """
+    global _skill_matcher
+    if _skill_matcher is None or len(_skill_matcher.skills) != len(ALL_SKILLS):
+        _skill_matcher = SkillMatcher(ALL_SKILLS)
+    return _skill_matcher
+
+
+def extract_skills(text: str, sections: ResumeSections = None) -> List[str]:
     """
     Extract technical and soft skills from resume text.
     Uses exact matching, case-insensitive with word boundaries.
     """
     found_skills: Set[str] = set()
-    text_lower = text.lower()
+    matcher = get_skill_matcher()
     
     # Find technical/skills section
-    skills_section = extract_skills_section(text)
+    skills_section = extract_skills_section(text, sections)
     
     # If we found a skills section, prioritize it
     search_text = skills_section if skills_section else text
-    search_text_lower = search_text.lower()
     
-    # Method 1: Exact match with word boundaries
-    for skill in ALL_SKILLS:
-        # Create pattern with word boundaries
-        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-        if re.search(pattern, search_text_lower):
-            found_skills.add(skill)
+    # Method 1: Exact match with word boundaries (single scan over the text)
+    found_skills.update(matcher.find(search_text))
     
     # Method 2: Parse skills section if exists
     if skills_section:
         # Split by common delimiters
-        tokens = re.split(r'[,;\n•\-\|]', skills_section)
+        tokens = SKILL_DELIMITERS_RE.split(skills_section)
         for token in tokens:
             token = token.strip()
             # Skip empty or very short tokens
@@ -107,12 +251,10 @@ def extract_skills(text: str) -> List[str]:
             ]):
                 continue
             
-            # Check if token is a known skill
-            token_lower = token.lower()
-            for skill in ALL_SKILLS:
-                if token_lower == skill.lower() or token_lower in skill.lower():
-                    found_skills.add(skill)
-                    break
+            # Check if token is a known skill (first skill containing the token)
+            skill = matcher.first_containing(token)
+            if skill:
+                found_skills.add(skill)
             else:
                 # If not in database but looks like a skill (capitalized, reasonable length)
                 if token[0].isupper() and 3 <= len(token) <= 30:
@@ -127,23 +269,12 @@ def extract_skills(text: str) -> List[str]:
     return sorted(found_skills)
 
 
-def extract_skills_section(text: str) -> str:
+def extract_skills_section(text: str, sections: ResumeSections = None) -> str:
     """
     Extract the skills section from resume if it exists.
     """
-    # Look for skills section headers
-    patterns = [
-        r'(?:Technical\s+)?Skills[:\-]?\s*(.+?)(?=\n\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*[:\-]|\n\s*\n|$)',
-        r'(?:Core\s+)?Competencies[:\-]?\s*(.+?)(?=\n\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*[:\-]|\n\s*\n|$)',
-        r'Technologies[:\-]?\s*(.+?)(?=\n\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*[:\-]|\n\s*\n|$)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            return match.group(1).strip()
-    
-    return ""
+    sections = sections or segment_resume(text)
+    return sections.get("skills")
 
 
 # Test
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Shared modules (mlops/parsing/common) live next to the parser packages
+_PARSING_DIR = str(Path(__file__).resolve().parents[2])
+if _PARSING_DIR not in sys.path:
+    sys.path.append(_PARSING_DIR)
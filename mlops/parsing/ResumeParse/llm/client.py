@@ -1,18 +1,29 @@
-import requests
+import httpx
 import os
 import json
 import re
+import time
 from dotenv import load_dotenv
 
+from common.http_client import get_client
+from common.scheduler import get_scheduler, request_tokens
+from common.sse import aiter_content, iter_content
+from common.tracing import detached_span, record, span
+
 # Load environment variables
 load_dotenv()
 
 # === Configuration ===
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_MODEL = "llama-3.1-8b-instant"
+SYSTEM_PROMPT = (
+    "You are a precise resume parser that outputs strict JSON only. "
+    "Never include markdown, comments, or explanations — only valid JSON."
+)
 
 # === Function to call Groq API ===
-def call_groq(prompt: str, model: str = "llama-3.1-8b-instant", temperature: float = 0.0):
+def call_groq(prompt: str, model: str = GROQ_MODEL, temperature: float = 0.0):
     """
     Call GROQ API with robust error handling and JSON extraction.
 
@@ -24,6 +35,103 @@ def call_groq(prompt: str, model: str = "llama-3.1-8b-instant", temperature: flo
     Returns:
         Cleaned response text (JSON or plain text).
     """
+    headers, payload = _build_groq_request(prompt, model, temperature)
+
+    with span("llm.groq", model=model) as stage:
+        stage.add(bytes_in=len(prompt.encode("utf-8")))
+        try:
+            response = get_scheduler("groq").call(
+                lambda: get_client().post_sync(GROQ_API_URL, json=payload, headers=headers, timeout=30),
+                tokens=request_tokens(prompt),
+            )
+        except httpx.TimeoutException:
+            raise Exception("⏰ GROQ API request timed out.")
+        except httpx.HTTPError as e:
+            raise Exception(f"🚨 GROQ API request failed: {str(e)}")
+
+        return _handle_groq_response(response)
+
+
+async def acall_groq(prompt: str, model: str = GROQ_MODEL, temperature: float = 0.0):
+    """
+    Async variant of call_groq; shares the same pooled connections.
+    """
+    headers, payload = _build_groq_request(prompt, model, temperature)
+
+    with span("llm.groq", model=model) as stage:
+        stage.add(bytes_in=len(prompt.encode("utf-8")))
+        try:
+            response = await get_scheduler("groq").acall(
+                lambda: get_client().post(GROQ_API_URL, json=payload, headers=headers, timeout=30),
+                tokens=request_tokens(prompt),
+            )
+        except httpx.TimeoutException:
+            raise Exception("⏰ GROQ API request timed out.")
+        except httpx.HTTPError as e:
+            raise Exception(f"🚨 GROQ API request failed: {str(e)}")
+
+        return _handle_groq_response(response)
+
+
+def stream_groq(prompt: str, model: str = GROQ_MODEL, temperature: float = 0.0):
+    """
+    Stream a GROQ completion, yielding the raw text fragments as they arrive.
+    Closing the generator early cancels the request. Streams are admitted by the
+    scheduler like other requests but not retried (fragments may already be out).
+    """
+    headers, payload = _build_groq_request(prompt, model, temperature, stream=True)
+    lines = get_scheduler("groq").stream(
+        lambda: get_client().stream_lines_sync(GROQ_API_URL, json=payload, headers=headers, timeout=30),
+        tokens=request_tokens(prompt),
+    )
+
+    with detached_span("llm.groq.stream", model=model) as stage:
+        stage.add(bytes_in=len(prompt.encode("utf-8")))
+        start = time.perf_counter()
+        try:
+            for i, fragment in enumerate(iter_content(lines, on_usage=lambda u: _add_usage(stage, u))):
+                if i == 0:
+                    stage.set(first_token_ms=round((time.perf_counter() - start) * 1000, 1))
+                stage.add(bytes_out=len(fragment.encode("utf-8")))
+                yield fragment
+        except httpx.TimeoutException:
+            raise Exception("⏰ GROQ API request timed out.")
+        except httpx.HTTPError as e:
+            raise Exception(f"🚨 GROQ API request failed: {str(e)}")
+        finally:
+            lines.close()
+
+
+async def astream_groq(prompt: str, model: str = GROQ_MODEL, temperature: float = 0.0):
+    """
+    Async variant of stream_groq.
+    """
+    headers, payload = _build_groq_request(prompt, model, temperature, stream=True)
+    lines = get_scheduler("groq").astream(
+        lambda: get_client().stream_lines(GROQ_API_URL, json=payload, headers=headers, timeout=30),
+        tokens=request_tokens(prompt),
+    )
+
+    with detached_span("llm.groq.stream", model=model) as stage:
+        stage.add(bytes_in=len(prompt.encode("utf-8")))
+        start = time.perf_counter()
+        first = True
+        try:
+            async for fragment in aiter_content(lines, on_usage=lambda u: _add_usage(stage, u)):
+                if first:
+                    stage.set(first_token_ms=round((time.perf_counter() - start) * 1000, 1))
+                    first = False
+                stage.add(bytes_out=len(fragment.encode("utf-8")))
+                yield fragment
+        except httpx.TimeoutException:
+            raise Exception("⏰ GROQ API request timed out.")
+        except httpx.HTTPError as e:
+            raise Exception(f"🚨 GROQ API request failed: {str(e)}")
+        finally:
+            await lines.aclose()
+
+
+def _build_groq_request(prompt: str, model: str, temperature: float, stream: bool = False) -> tuple:
     if not GROQ_API_KEY:
         raise ValueError("❌ GROQ_API_KEY not found in environment variables. Please check your .env file.")
 
@@ -37,10 +145,7 @@ def call_groq(prompt: str, model: str = "llama-3.1-8b-instant", temperature: flo
         "messages": [
             {
                 "role": "system",
-                "content": (
-                    "You are a precise resume parser that outputs strict JSON only. "
-                    "Never include markdown, comments, or explanations — only valid JSON."
-                )
+                "content": SYSTEM_PROMPT
             },
             {
                 "role": "user",
@@ -49,31 +154,54 @@ def call_groq(prompt: str, model: str = "llama-3.1-8b-instant", temperature: flo
         ],
         "temperature": temperature
     }
+    if stream:
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+    return headers, payload
 
-    try:
-        response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=30)
 
-        # Debug: Print the raw response if something fails
-        if response.status_code != 200:
-            print("🔍 Status Code:", response.status_code)
-            print("🔍 Response Text:", response.text)
+def _handle_groq_response(response: httpx.Response) -> str:
+    # Debug: Print the raw response if something fails
+    if response.status_code != 200:
+        print("🔍 Status Code:", response.status_code)
+        print("🔍 Response Text:", response.text)
 
+    try:
         response.raise_for_status()
         data = response.json()
+        _record_usage(data, response)
 
         content = data["choices"][0]["message"]["content"]
-        cleaned_content = extract_json_from_response(content)
+        with span("llm.json_repair"):
+            cleaned_content = extract_json_from_response(content)
 
         return cleaned_content
 
-    except requests.exceptions.Timeout:
-        raise Exception("⏰ GROQ API request timed out.")
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPStatusError as e:
         raise Exception(f"🚨 GROQ API request failed: {str(e)}")
     except (KeyError, IndexError) as e:
         raise Exception(f"⚠️ Invalid response format from GROQ: {str(e)}")
 
 
+def _record_usage(data: dict, response: httpx.Response):
+    """
+    Attach response size and token usage to the open llm.groq span.
+    """
+    usage = data.get("usage") or {}
+    record(
+        bytes_out=len(response.content),
+        prompt_tokens=usage.get("prompt_tokens", 0),
+        completion_tokens=usage.get("completion_tokens", 0),
+    )
+
+
+def _add_usage(stage, usage: dict):
+    stage.add(
+        prompt_tokens=usage.get("prompt_tokens", 0),
+        completion_tokens=usage.get("completion_tokens", 0),
+    )
+
+
 # === Helper: Clean JSON from response ===
 def extract_json_from_response(text: str) -> str:
     """
@@ -1,3 +1,7 @@
+# Bump when a prompt template changes so cached LLM responses are not reused
+RESUME_PROMPT_VERSION = "resume-v1"
+
+
 def resume_extraction_prompt(resume_text: str) -> str:
     """
     Create a detailed prompt for LLM to extract structured resume data.
@@ -82,4 +86,36 @@ JSON Schema:
 Resume:
 {resume_text}
 
-JSON only:"""
\ No newline at end of file
+JSON only:"""
+
+def resume_batch_extraction_prompt(documents) -> str:
+    """
+    Prompt for several resumes at once; documents is a list of (id, resume text).
+    The answer is a JSON array with one {"id", "data"} item per resume.
+    """
+    resumes = "\n\n".join(
+        f'<resume id="{doc_id}">\n{text}\n</resume>' for doc_id, text in documents
+    )
+    return f"""Extract information from each resume below. Return ONLY a JSON array, no explanations.
+Return exactly one item per resume, with its id copied from the <resume> tag:
+[{{"id": "<resume id>", "data": <object for that resume>}}]
+
+Each data object uses this schema (empty "" or [] when not found, never invent data):
+{{
+  "name": "",
+  "email": "",
+  "phone": "",
+  "linkedin": "",
+  "github": "",
+  "education": [],
+  "skills": [],
+  "experience_years": "",
+  "companies": [],
+  "projects": [],
+  "certifications": [],
+  "summary": ""
+}}
+
+{resumes}
+
+JSON array only:"""
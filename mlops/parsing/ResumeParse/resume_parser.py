@@ -1,26 +1,110 @@
+import asyncio
+import copy
 import json
-from llm.client import call_groq
-from llm.prompts import resume_extraction_prompt
+import time
+from llm.client import acall_groq, call_groq, extract_json_from_response, stream_groq, GROQ_MODEL, SYSTEM_PROMPT
+from llm.prompts import (
+    resume_batch_extraction_prompt, resume_extraction_prompt, resume_extraction_prompt_simple, RESUME_PROMPT_VERSION
+)
+from common import compaction
+from common.backends import BackendRouter, RemoteBackend, local_backend_from_env
+from common.batching import pack_batches, run_batch
+from common.llm_cache import get_default_cache, make_cache_key
+from common.json_stream import IncrementalJSONObject
+from common.orchestration import CONCURRENT, DEFAULT_DEADLINE, arace_with_fallback, race_with_fallback, resolve_mode
+from common.tracing import detached_span, span, traced
 
 from extractors.basic_info_extractor import extract_basic_info
 from extractors.education_extractor import extract_education
 from extractors.skills_extractor import extract_skills
 from extractors.experience_extractor import extract_experience
 from extractors.projects_extractor import extract_projects
-from extractors.certifications_extractor import extract_certifications
+from extractors.certifications_extractors import extract_certifications
+from extractors.sections import segment_resume
 
 from text.extract import extract_text
 
 
-def parse_resume(resume_text: str, extracted_urls: list = None):
+# Output schema shared by every parse path (single resume and batch)
+RESUME_SCHEMA = {
+    "name": "",
+    "email": "",
+    "phone": "",
+    "linkedin": "",
+    "github": "",
+    "education": [],
+    "skills": [],
+    "experience_years": "",
+    "companies": [],
+    "projects": [],
+    "certifications": [],
+    "summary": ""
+}
+
+# Groq, or a local model for short documents when HIRO_LOCAL_LLM_URL is set (see
+# common.backends). The lambdas look the client functions up at call time.
+LLM_BACKENDS = BackendRouter(
+    remote=RemoteBackend(
+        "groq", GROQ_MODEL,
+        complete=lambda prompt: call_groq(prompt, model=GROQ_MODEL, temperature=0.0),
+        acomplete=lambda prompt: acall_groq(prompt, model=GROQ_MODEL, temperature=0.0),
+        stream=lambda prompt: stream_groq(prompt, model=GROQ_MODEL, temperature=0.0),
+    ),
+    local=local_backend_from_env(system=SYSTEM_PROMPT),
+)
+
+# Sections kept first when a resume is over the prompt token budget; the rest are
+# cut before these. References never reach the prompt.
+PROMPT_SECTION_PRIORITY = ("skills", "experience", "education", "certifications", "projects", "summary")
+PROMPT_DROP_SECTIONS = ("references",)
+
+
+def _resume_blocks(text: str) -> list:
     """
-    Parse resume using LLM first, then fallback to regex extractors.
+    Split cleaned resume text into (section name, text) blocks for compaction.
     """
-    prompt = resume_extraction_prompt(resume_text)
+    sections = segment_resume(text).sections
+    preamble_end = sections[0].start if sections else len(text)
+    blocks = [(None, text[:preamble_end])]
+    blocks += [(s.name, text[s.start:s.end]) for s in sections]
+    return blocks
 
-    try:
-        llm_response = call_groq(prompt)
-        
+
+def compact_resume(resume_text: str) -> str:
+    """
+    Resume text as sent to the LLM (see common.compaction).
+    """
+    with span("resume.compact") as stage:
+        text = compaction.compact_text(
+            resume_text,
+            split=_resume_blocks,
+            priority=PROMPT_SECTION_PRIORITY,
+            drop=PROMPT_DROP_SECTIONS,
+        )
+        stage.add(tokens_saved=max(0, compaction.estimate_tokens(resume_text) - compaction.estimate_tokens(text)))
+    return text
+
+
+def build_llm_prompt(resume_text: str, model: str = GROQ_MODEL):
+    """
+    Compact the resume and pick the prompt template for it.
+
+    Returns (prompt, cache_key). Small documents use the short template; the key
+    covers the compacted text, the template and the model that will answer.
+    """
+    if not compaction.ENABLED:
+        prompt = resume_extraction_prompt(resume_text)
+        return prompt, make_cache_key(resume_text, RESUME_PROMPT_VERSION, model, 0.0)
+
+    text = compact_resume(resume_text)
+    simple = compaction.estimate_tokens(text) <= compaction.SIMPLE_PROMPT_MAX_TOKENS
+    template = resume_extraction_prompt_simple if simple else resume_extraction_prompt
+    version = f"{RESUME_PROMPT_VERSION}/{'simple' if simple else 'full'}/{compaction.COMPACTION_VERSION}"
+    return template(text), make_cache_key(text, version, model, 0.0)
+
+
+def _load_llm_json(llm_response: str) -> dict:
+    with span("resume.json_parse"):
         # Try to extract JSON from response (sometimes wrapped in markdown)
         if "```json" in llm_response:
             json_str = llm_response.split("```json")[1].split("```")[0].strip()
@@ -28,84 +112,347 @@ def parse_resume(resume_text: str, extracted_urls: list = None):
             json_str = llm_response.split("```")[1].split("```")[0].strip()
         else:
             json_str = llm_response.strip()
-        
-        resume_data = json.loads(json_str)
-        print("✅ Extracted via GROQ LLM.")
-        
-    except Exception as e:
-        print(f"⚠️ LLM failed: {e}")
-        print("   Switching to fallback extractors...")
-        resume_data = {}
 
-    # Import company extractor
+        return json.loads(json_str)
+
+
+def _llm_request(resume_text: str) -> tuple:
+    """
+    (cache, backend, prompt, cache key) for one resume. Compacts the text and may
+    open the SQLite cache, so async callers run it on a thread.
+    """
+    backend = LLM_BACKENDS.select(compaction.estimate_tokens(resume_text))
+    prompt, cache_key = build_llm_prompt(resume_text, backend.model)
+    return get_default_cache(), backend, prompt, cache_key
+
+
+def _llm_succeeded(cache, cache_key: str, llm_response: str, cached, backend):
+    if cached is None:
+        print(f"✅ Extracted via {backend.name.upper()} LLM.")
+        if cache:
+            cache.set(cache_key, llm_response)
+    else:
+        print(f"✅ Extracted via {backend.name.upper()} LLM (cached).")
+
+
+def _llm_failed(stage, error: Exception) -> dict:
+    print(f"⚠️ LLM failed: {error}")
+    print("   Switching to fallback extractors...")
+    stage.set(failed=type(error).__name__)
+    return {}
+
+
+def extract_with_llm(resume_text: str) -> dict:
+    """
+    Run the LLM extraction step. Returns an empty dict if the call or JSON parsing fails.
+    Responses are cached by document content, so re-uploads skip the LLM call.
+    """
+    cache, backend, prompt, cache_key = _llm_request(resume_text)
+
+    with span("resume.llm", backend=backend.name) as stage:
+        cached = cache.get(cache_key) if cache else None
+        stage.add(cache_hits=int(cached is not None), cache_misses=int(cached is None))
+
+        try:
+            llm_response = cached if cached is not None else backend.complete(prompt)
+            resume_data = _load_llm_json(llm_response)
+            _llm_succeeded(cache, cache_key, llm_response, cached, backend)
+        except Exception as e:
+            resume_data = _llm_failed(stage, e)
+
+    return resume_data
+
+
+async def aextract_with_llm(resume_text: str) -> dict:
+    """
+    Async extract_with_llm: awaits the LLM request instead of blocking a thread,
+    and runs the compaction and SQLite cache reads and writes off the event loop.
+    """
+    cache, backend, prompt, cache_key = await asyncio.to_thread(_llm_request, resume_text)
+
+    with span("resume.llm", backend=backend.name) as stage:
+        cached = await asyncio.to_thread(cache.get, cache_key) if cache else None
+        stage.add(cache_hits=int(cached is not None), cache_misses=int(cached is None))
+
+        try:
+            llm_response = cached if cached is not None else await backend.acomplete(prompt)
+            resume_data = _load_llm_json(llm_response)
+            await asyncio.to_thread(_llm_succeeded, cache, cache_key, llm_response, cached, backend)
+        except Exception as e:
+            resume_data = _llm_failed(stage, e)
+
+    return resume_data
+
+
+def validate_resume_data(data) -> bool:
+    """
+    Accept one resume's data from a batched response: an object with at least one
+    schema field, list fields as lists and string fields as scalars.
+    """
+    if not isinstance(data, dict) or not set(data) & set(RESUME_SCHEMA):
+        return False
+    for key, default in RESUME_SCHEMA.items():
+        value = data.get(key)
+        if value is None:
+            continue
+        if isinstance(default, list) != isinstance(value, list) or isinstance(value, dict):
+            return False
+    return True
+
+
+def extract_with_llm_batch(documents: dict) -> dict:
+    """
+    LLM extraction for many resumes ({id: resume text}), packing short ones into
+    shared requests (see common.batching). Returns {id: resume_data}, with {} for
+    resumes the LLM could not parse, like extract_with_llm.
+    """
+    cache = get_default_cache()
+    version = f"{RESUME_PROMPT_VERSION}/batch"
+    if compaction.ENABLED:
+        version += f"/{compaction.COMPACTION_VERSION}"
+
+    # Documents go into the prompt under short ids ("0", "1", ...), not their keys
+    ids = {str(i): doc_id for i, doc_id in enumerate(documents)}
+    results, todo, texts = {}, [], {}
+    for short_id, doc_id in ids.items():
+        resume_text = documents[doc_id]
+        texts[short_id] = text = compact_resume(resume_text) if compaction.ENABLED else resume_text
+        cached = None
+        for model in LLM_BACKENDS.models() if cache else ():
+            cached = cache.get(make_cache_key(text, version, model, 0.0))
+            if cached is not None:
+                break
+        if cached is not None:
+            results[doc_id] = json.loads(cached)
+        else:
+            todo.append((short_id, text))
+
+    answered_by = {}
+
+    def batch_call(batch):
+        backend = LLM_BACKENDS.select(sum(compaction.estimate_tokens(text) for _, text in batch))
+        answered_by.update((short_id, backend.model) for short_id, _ in batch)
+        return backend.complete(resume_batch_extraction_prompt(batch))
+
+    single_call = lambda short_id, _: extract_with_llm(documents[ids[short_id]])
+
+    for batch in pack_batches(todo):
+        outcome = run_batch(batch, batch_call, single_call, validate_resume_data)
+        for short_id, data in outcome.results.items():
+            results[ids[short_id]] = data
+            if cache and len(batch) > 1 and short_id not in outcome.retried:
+                key = make_cache_key(texts[short_id], version, answered_by[short_id], 0.0)
+                cache.set(key, json.dumps(data, ensure_ascii=False))
+    return results
+
+
+@traced("resume.fallback")
+def extract_with_fallback(resume_text: str, extracted_urls: list = None, fields: list = None) -> dict:
+    """
+    Run the rule-based extractors for the requested output fields (all fields by default).
+    """
     from extractors.experience_extractor import extract_companies
     from extractors.projects_extractor import format_projects_for_output
-    
-    # Extract basic info with URLs
-    basic_info = extract_basic_info(resume_text, extra_urls=extracted_urls or [])
-    
-    # Merge data: use LLM data if available, otherwise fallback
-    if not resume_data.get("name"):
-        resume_data["name"] = basic_info.get("name", "")
-    
-    if not resume_data.get("email"):
+
+    wanted = set(fields) if fields is not None else set(RESUME_SCHEMA)
+    fallback = {}
+
+    # Find the section boundaries once; every extractor below reuses them
+    with span("resume.fallback.sections"):
+        sections = segment_resume(resume_text)
+
+    # Basic info covers several fields in one pass
+    if wanted & {"name", "email", "phone", "linkedin", "github"}:
+        with span("resume.fallback.basic_info"):
+            basic_info = extract_basic_info(resume_text, extra_urls=extracted_urls or [])
         emails = basic_info.get("emails", [])
-        resume_data["email"] = emails[0] if emails else ""
-    
-    if not resume_data.get("phone"):
         phones = basic_info.get("phones", [])
-        resume_data["phone"] = phones[0] if phones else ""
-    
-    # Add social links
-    if not resume_data.get("linkedin"):
-        resume_data["linkedin"] = basic_info.get("linkedin", "")
-    if not resume_data.get("github"):
-        resume_data["github"] = basic_info.get("github", "")
-    
-    if not resume_data.get("education") or len(resume_data.get("education", [])) == 0:
-        resume_data["education"] = extract_education(resume_text)
-    
-    if not resume_data.get("skills") or len(resume_data.get("skills", [])) == 0:
-        resume_data["skills"] = extract_skills(resume_text)
-    
-    if not resume_data.get("experience_years"):
-        resume_data["experience_years"] = extract_experience(resume_text)
-    
-    if not resume_data.get("companies") or len(resume_data.get("companies", [])) == 0:
-        resume_data["companies"] = extract_companies(resume_text)
-    
-    if not resume_data.get("projects") or len(resume_data.get("projects", [])) == 0:
-        projects_dicts = extract_projects(resume_text)
-        resume_data["projects"] = format_projects_for_output(projects_dicts)
-    
-    if not resume_data.get("certifications") or len(resume_data.get("certifications", [])) == 0:
-        resume_data["certifications"] = extract_certifications(resume_text)
-    
-    if not resume_data.get("summary"):
-        resume_data["summary"] = ""
+        fallback["name"] = basic_info.get("name", "")
+        fallback["email"] = emails[0] if emails else ""
+        fallback["phone"] = phones[0] if phones else ""
+        fallback["linkedin"] = basic_info.get("linkedin", "")
+        fallback["github"] = basic_info.get("github", "")
+
+    if "education" in wanted:
+        with span("resume.fallback.education"):
+            fallback["education"] = extract_education(resume_text, sections)
+
+    if "skills" in wanted:
+        with span("resume.fallback.skills"):
+            fallback["skills"] = extract_skills(resume_text, sections)
+
+    if "experience_years" in wanted:
+        with span("resume.fallback.experience_years"):
+            fallback["experience_years"] = extract_experience(resume_text, sections)
+
+    if "companies" in wanted:
+        with span("resume.fallback.companies"):
+            fallback["companies"] = extract_companies(resume_text, sections)
+
+    if "projects" in wanted:
+        with span("resume.fallback.projects"):
+            projects_dicts = extract_projects(resume_text, sections)
+            fallback["projects"] = format_projects_for_output(projects_dicts)
+
+    if "certifications" in wanted:
+        with span("resume.fallback.certifications"):
+            fallback["certifications"] = extract_certifications(resume_text, sections)
+
+    if "summary" in wanted:
+        fallback["summary"] = ""
+
+    return fallback
+
+
+def missing_fields(resume_data: dict) -> list:
+    """
+    Return the schema fields the LLM left empty.
+    """
+    return [key for key in RESUME_SCHEMA if not resume_data.get(key)]
+
+
+def merge_resume_data(resume_data: dict, fallback: dict) -> dict:
+    """
+    Fill fields missing from the LLM output with fallback values and apply the schema defaults.
+    """
+    for key in missing_fields(resume_data):
+        if key in fallback:
+            resume_data[key] = fallback[key]
 
     # Ensure consistent output schema
-    schema = {
-        "name": "",
-        "email": "",
-        "phone": "",
-        "linkedin": "",
-        "github": "",
-        "education": [],
-        "skills": [],
-        "experience_years": "",
-        "companies": [],
-        "projects": [],
-        "certifications": [],
-        "summary": ""
-    }
-    
-    for key in schema:
-        resume_data.setdefault(key, schema[key])
+    for key in RESUME_SCHEMA:
+        if key not in resume_data:
+            resume_data[key] = copy.deepcopy(RESUME_SCHEMA[key])
 
     return resume_data
 
 
+def parse_resume(resume_text: str, extracted_urls: list = None, mode: str = None,
+                 deadline: float = DEFAULT_DEADLINE):
+    """
+    Parse resume using LLM first, then fallback to regex extractors.
+
+    mode="concurrent" runs every extractor while the LLM request is in flight and
+    waits at most `deadline` seconds for the LLM before returning the fallback
+    result (see common.orchestration). The default mode comes from HIRO_PARSE_MODE.
+    """
+    with span("resume.parse") as stage:
+        stage.add(bytes_in=len(resume_text.encode("utf-8")))
+
+        if resolve_mode(mode) == CONCURRENT:
+            race = race_with_fallback(
+                lambda: extract_with_llm(resume_text),
+                lambda: extract_with_fallback(resume_text, extracted_urls),
+                deadline,
+            )
+            if race.timed_out:
+                print(f"⏱️ LLM missed the {deadline}s deadline, using fallback extractors.")
+                stage.set(deadline_missed=True)
+            return merge_resume_data(race.llm or {}, race.fallback)
+
+        resume_data = extract_with_llm(resume_text)
+
+        # Only run the extractors for fields the LLM did not fill
+        fallback = extract_with_fallback(
+            resume_text, extracted_urls, fields=missing_fields(resume_data)
+        )
+        return merge_resume_data(resume_data, fallback)
+
+
+async def aparse_resume(resume_text: str, extracted_urls: list = None, deadline: float = DEFAULT_DEADLINE):
+    """
+    parse_resume for event-loop servers (ASGI views): the LLM request is awaited
+    while the rule-based extractors run on a worker thread, and the LLM is given
+    at most `deadline` seconds (as in concurrent mode).
+    """
+    with span("resume.parse") as stage:
+        stage.add(bytes_in=len(resume_text.encode("utf-8")))
+        race = await arace_with_fallback(
+            lambda: aextract_with_llm(resume_text),
+            lambda: extract_with_fallback(resume_text, extracted_urls),
+            deadline,
+        )
+        if race.timed_out:
+            print(f"⏱️ LLM missed the {deadline}s deadline, using fallback extractors.")
+            stage.set(deadline_missed=True)
+        return merge_resume_data(race.llm or {}, race.fallback)
+
+
+def parse_resumes(documents: dict, extracted_urls: dict = None) -> dict:
+    """
+    Parse many resumes ({id: resume text}) with batched LLM requests.
+
+    Same result per resume as parse_resume in serial mode; extracted_urls maps ids
+    to the URL lists from extract_text.
+    """
+    extracted_urls = extracted_urls or {}
+    with span("resume.parse_batch", docs=len(documents)):
+        llm_results = extract_with_llm_batch(documents)
+        parsed = {}
+        for doc_id, resume_text in documents.items():
+            resume_data = llm_results.get(doc_id) or {}
+            fallback = extract_with_fallback(
+                resume_text, extracted_urls.get(doc_id), fields=missing_fields(resume_data)
+            )
+            parsed[doc_id] = merge_resume_data(resume_data, fallback)
+    return parsed
+
+
+def iter_resume_fields(resume_text: str, extracted_urls: list = None, fields: list = None):
+    """
+    Yield (field, value) pairs as soon as each one is known.
+
+    The LLM response is streamed and parsed incrementally, so short fields (name,
+    email, skills) arrive before long arrays finish. When `fields` is given, the
+    stream is closed as soon as all of them have arrived. Fields the LLM left empty
+    are then filled by the fallback extractors and yielded last. Collecting the
+    pairs into a dict gives the parse_resume result (limited to `fields` if given).
+    """
+    wanted = list(fields) if fields is not None else list(RESUME_SCHEMA)
+    waiting = set(wanted)
+    resume_data = {}
+
+    cache = get_default_cache()
+    backend = LLM_BACKENDS.select(compaction.estimate_tokens(resume_text))
+    prompt, cache_key = build_llm_prompt(resume_text, backend.model)
+    cached = cache.get(cache_key) if cache else None
+
+    with detached_span("resume.stream", cached=cached is not None, backend=backend.name) as stage:
+        start = time.perf_counter()
+        parser = IncrementalJSONObject()
+        received = []
+        chunks = [cached] if cached is not None else backend.stream(prompt)
+        try:
+            for chunk in chunks:
+                received.append(chunk)
+                for key, value in parser.feed(chunk):
+                    if fields is not None and key not in waiting:
+                        continue
+                    waiting.discard(key)
+                    resume_data[key] = value
+                    if value:
+                        if start is not None:
+                            stage.set(first_field_ms=round((time.perf_counter() - start) * 1000, 1))
+                            start = None
+                        yield key, value
+                if fields is not None and not waiting:
+                    break  # every requested field is in; stop the generation
+            if parser.done and cached is None and cache:
+                cache.set(cache_key, extract_json_from_response("".join(received)))
+        except Exception as e:
+            print(f"⚠️ LLM stream failed: {e}")
+            print("   Switching to fallback extractors...")
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+    missing = [key for key in wanted if not resume_data.get(key)]
+    if missing:
+        fallback = extract_with_fallback(resume_text, extracted_urls, fields=missing)
+        for key in missing:
+            yield key, fallback[key] if key in fallback else copy.deepcopy(RESUME_SCHEMA.get(key))
+
+
 if __name__ == "__main__":
     try:
         file_path = "MusaArfah-Resume.pdf"
@@ -0,0 +1,61 @@
+import json
+import logging
+
+import fitz
+
+from text.extract import extract_text, iter_pdf_pages, iter_pdf_pages_parallel
+from common import tracing
+
+
+def make_pdf(path, pages):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i} text")
+        page.insert_link({"kind": fitz.LINK_URI, "from": fitz.Rect(72, 60, 200, 80),
+                          "uri": f"https://example.com/{i % 3}"})
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_pages_stream_in_order_with_links(tmp_path):
+    path = make_pdf(tmp_path / "cv.pdf", 5)
+    pages = list(iter_pdf_pages(path))
+    assert [t.strip() for t, _ in pages] == [f"Page {i} text" for i in range(5)]
+    assert [u for _, u in pages] == [[f"https://example.com/{i % 3}"] for i in range(5)]
+
+    text, urls = extract_text(path)
+    assert text.splitlines()[0] == "Page 0 text"
+    assert urls == ["https://example.com/0", "https://example.com/1", "https://example.com/2"]
+
+
+def test_page_and_byte_budgets(tmp_path):
+    path = make_pdf(tmp_path / "cv.pdf", 5)
+    assert len(list(iter_pdf_pages(path, max_pages=2))) == 2
+    text = "".join(t for t, _ in iter_pdf_pages(path, max_bytes=20))
+    assert len(text.encode("utf-8")) == 20
+
+
+def test_truncated_pdf_is_logged_and_marked_on_the_span(tmp_path, caplog):
+    path = make_pdf(tmp_path / "portfolio.pdf", 5)
+    tracer = tracing.configure(enabled=True, jsonl_path=str(tmp_path / "spans.jsonl"))
+    try:
+        with caplog.at_level(logging.WARNING):
+            text, _ = extract_text(path, max_pages=2)
+        extract_text(path)
+    finally:
+        tracing.configure(enabled=False, jsonl_path="")
+        tracer.metrics.reset()
+
+    assert [line for line in text.splitlines() if line] == ["Page 0 text", "Page 1 text"]
+    assert "read 2 of 5 pages" in caplog.text
+    spans = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    assert [(s["pages_read"], s.get("truncated")) for s in spans] == [(2, True), (5, None)]
+
+
+def test_parallel_matches_sequential(tmp_path):
+    path = make_pdf(tmp_path / "portfolio.pdf", 23)
+    expected = list(iter_pdf_pages(path, max_pages=21))
+    assert list(iter_pdf_pages_parallel(path, workers=3, chunk_pages=4, max_pages=21)) == expected
+    assert extract_text(path, workers=3) == extract_text(path)
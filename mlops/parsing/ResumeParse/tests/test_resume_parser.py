@@ -0,0 +1,81 @@
+import json
+import time
+
+import resume_parser
+
+RESUME_TEXT = """Jane Doe
+jane@doe.dev | +1 415 555 0199
+
+Technical Skills
+Languages: Python, SQL
+
+Education
+Stanford University
+BSc Computer Science
+"""
+
+
+def fake_llm(delay, data):
+    def extract_with_llm(text):
+        time.sleep(delay)
+        return dict(data)
+    return extract_with_llm
+
+
+def test_concurrent_mode_matches_serial(monkeypatch):
+    monkeypatch.setattr(resume_parser, "extract_with_llm", fake_llm(0.0, {"name": "Jane Doe", "skills": ["Go"]}))
+    serial = resume_parser.parse_resume(RESUME_TEXT, mode="serial")
+    concurrent = resume_parser.parse_resume(RESUME_TEXT, mode="concurrent")
+
+    assert concurrent == serial
+    assert concurrent["skills"] == ["Go"]
+    assert concurrent["email"] == "jane@doe.dev"
+
+
+def test_deadline_returns_the_fallback_result(monkeypatch):
+    monkeypatch.setattr(resume_parser, "extract_with_llm", fake_llm(2.0, {"name": "LLM Name"}))
+    start = time.perf_counter()
+    parsed = resume_parser.parse_resume(RESUME_TEXT, mode="concurrent", deadline=0.2)
+
+    assert time.perf_counter() - start < 1.0
+    assert parsed["name"] == "Jane Doe"
+    assert set(parsed) >= set(resume_parser.RESUME_SCHEMA)
+
+
+def test_schema_defaults_are_fresh_per_parse():
+    merged = resume_parser.merge_resume_data({}, {})
+    merged["skills"].append("Python")
+    assert resume_parser.RESUME_SCHEMA["skills"] == []
+    assert resume_parser.merge_resume_data({}, {})["skills"] == []
+
+
+def test_llm_prompt_is_compacted(monkeypatch):
+    monkeypatch.setattr(resume_parser.compaction, "ENABLED", True)
+    prompt, key = resume_parser.build_llm_prompt(RESUME_TEXT + "\nReferences\nJohn Smith, ACME Corp\n")
+
+    assert prompt.startswith("Extract resume information as JSON only")  # short template for a small resume
+    assert "jane@doe.dev" not in prompt and "John Smith" not in prompt
+    assert "Languages: Python, SQL" in prompt
+    assert key != resume_parser.build_llm_prompt(RESUME_TEXT * 40)[1]
+
+
+def test_parse_resumes_batches_and_retries_invalid_items(monkeypatch):
+    prompts = []
+
+    def fake_call_groq(prompt, **kwargs):
+        prompts.append(prompt)
+        # Valid data for resume "0", a string where a list belongs for resume "1"
+        return json.dumps([
+            {"id": "0", "data": {"name": "Jane Doe", "skills": ["Go"]}},
+            {"id": "1", "data": {"name": "John Roe", "skills": "Rust"}},
+        ])
+
+    monkeypatch.setattr(resume_parser, "get_default_cache", lambda: None)
+    monkeypatch.setattr(resume_parser, "call_groq", fake_call_groq)
+    monkeypatch.setattr(resume_parser, "extract_with_llm", fake_llm(0.0, {"name": "John Roe", "skills": ["Rust"]}))
+    parsed = resume_parser.parse_resumes({"jane.pdf": RESUME_TEXT, "john.pdf": RESUME_TEXT.replace("Jane", "John")})
+
+    assert len(prompts) == 1 and '<resume id="1">' in prompts[0]
+    assert parsed["jane.pdf"]["skills"] == ["Go"]
+    assert parsed["john.pdf"]["skills"] == ["Rust"]
+    assert parsed["jane.pdf"]["email"] == "jane@doe.dev"  # contact fields still come from the fallback
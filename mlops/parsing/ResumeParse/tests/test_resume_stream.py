@@ -0,0 +1,96 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+import llm.client as groq_client
+import resume_parser
+from common.scheduler import LLMScheduler
+from common.stub_server import StubLLMServer
+
+RESUME_TEXT = """Jane Doe
+jane@doe.dev | github.com/janedoe
+
+Technical Skills
+Languages: Python, SQL
+"""
+
+LLM_JSON = {
+    "name": "Jane Doe",
+    "email": "jane@doe.dev",
+    "phone": "",
+    "skills": ["Python"],
+    "experience": [{"title": "Engineer", "responsibilities": ["x" * 40] * 20}],
+}
+
+
+@pytest.fixture
+def groq_stub(monkeypatch):
+    monkeypatch.setenv("HIRO_LLM_CACHE", "0")
+    monkeypatch.setattr(groq_client, "GROQ_API_KEY", "test")
+    with StubLLMServer(content="```json\n" + json.dumps(LLM_JSON) + "\n```", chunk_size=8) as server:
+        monkeypatch.setattr(groq_client, "GROQ_API_URL", server.url)
+        yield server
+
+
+def test_fields_stream_then_fallback_fills_the_rest(groq_stub, monkeypatch):
+    monkeypatch.setattr(resume_parser, "call_groq", lambda *a, **k: "```json\n" + json.dumps(LLM_JSON) + "\n```")
+    pairs = list(resume_parser.iter_resume_fields(RESUME_TEXT))
+    keys = [k for k, _ in pairs]
+
+    # LLM fields first, in response order, then the fallback fields
+    assert keys[:4] == ["name", "email", "skills", "experience"]
+    assert dict(pairs) == resume_parser.parse_resume(RESUME_TEXT)
+
+
+def test_stream_is_cancelled_once_requested_fields_arrive(groq_stub):
+    groq_stub.chunk_delay = 0.02  # the full response would take ~2.5s
+    start = time.perf_counter()
+    pairs = dict(resume_parser.iter_resume_fields(RESUME_TEXT, fields=["name", "email"]))
+
+    assert pairs == {"name": "Jane Doe", "email": "jane@doe.dev"}
+    assert time.perf_counter() - start < 1.0
+    deadline = time.time() + 5
+    while not groq_stub.cancelled and time.time() < deadline:
+        time.sleep(0.02)
+    assert groq_stub.cancelled == 1
+
+
+def test_rate_limited_call_is_retried_not_dropped(groq_stub, monkeypatch):
+    monkeypatch.setattr(groq_client, "get_scheduler", lambda name: LLMScheduler(name, backoff_base=0.01))
+    groq_stub.failures = [429, 503]
+    groq_stub.retry_after = 0.05
+
+    assert resume_parser.extract_with_llm(RESUME_TEXT)["skills"] == ["Python"]
+    assert groq_stub.requests == 3
+
+
+def test_async_parse_awaits_the_llm_and_matches_parse_resume(groq_stub):
+    parsed = asyncio.run(resume_parser.aparse_resume(RESUME_TEXT))
+
+    assert groq_stub.requests == 1
+    assert parsed == resume_parser.parse_resume(RESUME_TEXT)
+    assert parsed["skills"] == ["Python"]
+
+
+def test_async_extraction_keeps_cache_io_off_the_event_loop(groq_stub, monkeypatch):
+    loop_thread, cache_threads = None, []
+
+    class RecordingCache:
+        def get(self, key):
+            cache_threads.append(threading.get_ident())
+
+        def set(self, key, value):
+            cache_threads.append(threading.get_ident())
+
+    monkeypatch.setattr(resume_parser, "get_default_cache", lambda: RecordingCache())
+
+    async def extract():
+        nonlocal loop_thread
+        loop_thread = threading.get_ident()
+        return await resume_parser.aextract_with_llm(RESUME_TEXT)
+
+    assert asyncio.run(extract())["skills"] == ["Python"]
+    assert len(cache_threads) == 2 and loop_thread not in cache_threads
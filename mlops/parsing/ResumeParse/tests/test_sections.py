@@ -0,0 +1,51 @@
+from extractors.experience_extractor import extract_companies
+from extractors.sections import segment_resume
+from extractors.skills_extractor import extract_skills
+
+RESUME = """Jane Doe
+jane@doe.dev | 5 years of experience
+
+Professional Summary
+Backend engineer.
+
+WORK EXPERIENCE​
+Software Engineer
+Jan 2020 - Present
+Acme Corp
+
+Highlighted Personal Projects
+Chatbot | Python, LangChain
+Skills: Python, LangChain
+
+Technical Skills:
+Languages: Python, Go
+Frameworks: Django
+
+EDUCATION
+BS Computer Science
+"""
+
+
+def test_single_pass_section_map_with_offsets():
+    sections = segment_resume(RESUME)
+    assert sections.names() == ["summary", "experience", "projects", "skills", "education"]
+
+    experience = sections.all("experience")[0]
+    assert experience.title == "WORK EXPERIENCE"
+    assert RESUME[experience.start:experience.body_start].strip("\n​") == "WORK EXPERIENCE"
+    assert sections.get("experience") == "Software Engineer\nJan 2020 - Present\nAcme Corp"
+    # An inline "Skills:" line inside a project is not a section header
+    assert sections.get("projects").endswith("Skills: Python, LangChain")
+    assert sections.get("certifications") == ""
+
+
+def test_extractors_share_precomputed_sections():
+    sections = segment_resume(RESUME)
+    assert extract_skills(RESUME, sections) == extract_skills(RESUME)
+    assert extract_companies(RESUME, sections) == ["Software Engineer", "Acme Corp"]
+
+
+def test_bare_skill_words_do_not_end_the_skills_section():
+    text = "Skills\nPython\nLeadership\nDocker\nKubernetes\nResearch\n"
+    assert segment_resume(text).names() == ["skills"]
+    assert {"Python", "Leadership", "Docker", "Kubernetes"} <= set(extract_skills(text))
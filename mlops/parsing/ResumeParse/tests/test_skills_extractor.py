@@ -0,0 +1,35 @@
+import re
+
+from extractors.skills_extractor import ALL_SKILLS, SkillMatcher, extract_skills
+
+
+def regex_find(text, skills):
+    # Reference behaviour: one word-bounded regex per skill
+    return {s for s in skills if re.search(r'\b' + re.escape(s.lower()) + r'\b', text.lower())}
+
+
+def test_matches_per_skill_regex_on_edge_cases():
+    matcher = SkillMatcher(ALL_SKILLS)
+    texts = [
+        "Spring Boot, SQL Server and C++ with .NET / ASP.NET",
+        "c# developer; node.js+react, Vue.js; CI/CD via GitHub",
+        "JavaScript (not Java) and R, Go, C",
+        "Machine Learning / Deep Learning on GCP & Google Cloud",
+        "Power BI_ and Excel2019 plus REST API design",
+    ]
+    for text in texts:
+        assert matcher.find(text) == regex_find(text, ALL_SKILLS)
+
+
+def test_first_containing_follows_vocabulary_order():
+    matcher = SkillMatcher(["Java", "JavaScript", "Scala"])
+    assert matcher.first_containing("java") == "Java"
+    assert matcher.first_containing("script") == "JavaScript"
+    assert matcher.first_containing("ala") == "Scala"
+    assert matcher.first_containing("rust") is None
+
+
+def test_extract_skills_from_skills_section():
+    text = "Technical Skills\nPython, SQL, Flask, Scikit-learn\n\nEducation\nBS Computer Science"
+    skills = extract_skills(text)
+    assert {"Python", "SQL", "Flask", "Scikit-learn"} <= set(skills)
@@ -1,13 +1,45 @@
+import logging
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
 import fitz  # PyMuPDF for PDFs
 from docx import Document
 import pypandoc
 
+# Shared modules (mlops/parsing/common) live next to ResumeParse
+_PARSING_DIR = str(Path(__file__).resolve().parents[2])
+if _PARSING_DIR not in sys.path:
+    sys.path.append(_PARSING_DIR)
+
+from common.tracing import span  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Default budget for a single PDF; resumes are rarely longer, scanned portfolios can be
+MAX_PDF_PAGES = int(os.getenv("HIRO_PDF_MAX_PAGES", "50"))
+MAX_PDF_BYTES = int(os.getenv("HIRO_PDF_MAX_BYTES", str(2 * 1024 * 1024)))
+
+# Pages per task when a PDF is split across a worker pool
+PDF_CHUNK_PAGES = 8
 
-def extract_text(file_path: str) -> tuple[str, list[str]]:
+
+def extract_text(
+    file_path: str,
+    max_pages: Optional[int] = MAX_PDF_PAGES,
+    max_bytes: Optional[int] = MAX_PDF_BYTES,
+    workers: Optional[int] = None,
+) -> tuple[str, list[str]]:
     """
     Extract text from a supported file and return both text and URLs.
     Supports: PDF, DOCX, ODT, TXT
+
+    Args:
+        max_pages / max_bytes: PDF budget, pages past either limit are not read.
+            A cut-off PDF is logged and marked truncated on the span.
+        workers: Split PDFs longer than one chunk across this many processes.
     
     Returns:
         tuple: (text_content, list_of_urls)
@@ -17,42 +49,160 @@ def extract_text(file_path: str) -> tuple[str, list[str]]:
 
     ext = os.path.splitext(file_path)[1].lower()
 
-    if ext == ".pdf":
-        text, urls = _extract_from_pdf(file_path)
-    elif ext == ".docx":
-        text, urls = _extract_from_docx(file_path)
-    elif ext == ".odt":
-        text = _extract_from_odt(file_path)
-        urls = []
-    elif ext == ".txt":
-        text = _extract_from_txt(file_path)
-        urls = []
-    else:
-        raise ValueError(f"Unsupported file format: {ext}")
+    with span("resume.extract_text", format=ext.lstrip(".")) as stage:
+        stage.add(bytes_in=os.path.getsize(file_path))
+        if ext == ".pdf":
+            text, urls, pages_read, truncated = _extract_from_pdf(file_path, max_pages, max_bytes, workers)
+            stage.set(pages_read=pages_read)
+            if truncated:
+                stage.set(truncated=True)
+        elif ext == ".docx":
+            text, urls = _extract_from_docx(file_path)
+        elif ext == ".odt":
+            text = _extract_from_odt(file_path)
+            urls = []
+        elif ext == ".txt":
+            text = _extract_from_txt(file_path)
+            urls = []
+        else:
+            raise ValueError(f"Unsupported file format: {ext}")
 
-    return text.strip(), urls
+        text = text.strip()
+        stage.add(bytes_out=len(text.encode("utf-8")))
+    return text, urls
 
 
-def _extract_from_pdf(file_path: str) -> tuple[str, list[str]]:
+def _extract_from_pdf(
+    file_path: str,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> tuple[str, list[str], int, bool]:
     """
-    Extract text and embedded hyperlinks from PDF.
+    Extract text and embedded hyperlinks from PDF, with the number of pages read
+    and whether the page or byte budget cut the document short.
     """
     text = []
-    urls = []
-    
+    urls = {}  # ordered set
+    bytes_read = 0
+
+    pages = iter_pdf_pages_parallel if workers and workers > 1 else iter_pdf_pages
+    kwargs = {"workers": workers} if workers and workers > 1 else {}
+    for page_text, page_urls in pages(file_path, max_pages=max_pages, max_bytes=max_bytes, **kwargs):
+        text.append(page_text)
+        urls.update(dict.fromkeys(page_urls))
+        bytes_read += len(page_text.encode("utf-8"))
+
     with fitz.open(file_path) as doc:
-        for page in doc:
-            # Extract text
-            page_text = page.get_text("text")
-            text.append(page_text)
-            
-            # Extract hyperlinks
-            for link in page.get_links():
-                uri = link.get("uri", None)
-                if uri and uri.startswith("http"):
-                    urls.append(uri)
-    
-    return "\n".join(text).strip(), list(set(urls))
+        page_count = doc.page_count
+    truncated = len(text) < page_count or (max_bytes is not None and bytes_read >= max_bytes)
+    if truncated:
+        logger.warning(
+            "PDF %s truncated: read %d of %d pages, %d bytes of text (limits: %s pages, %s bytes)",
+            file_path, len(text), page_count, bytes_read, max_pages, max_bytes,
+        )
+    return "\n".join(text).strip(), list(urls), len(text), truncated
+
+
+def _page_content(page) -> tuple[str, list[str]]:
+    page_text = page.get_text("text")
+    page_urls = []
+    for link in page.get_links():
+        uri = link.get("uri", None)
+        if uri and uri.startswith("http"):
+            page_urls.append(uri)
+    return page_text, page_urls
+
+
+def _budget(max_bytes: Optional[int]):
+    """
+    Returns a function that clips each page to what is left of `max_bytes`
+    (None once the budget is spent).
+    """
+    remaining = [max_bytes]
+
+    def clip(page_text: str) -> Optional[str]:
+        if remaining[0] is None:
+            return page_text
+        if remaining[0] <= 0:
+            return None
+        data = page_text.encode("utf-8")
+        if len(data) > remaining[0]:
+            page_text = data[:remaining[0]].decode("utf-8", errors="ignore")
+        remaining[0] -= len(data)
+        return page_text
+
+    return clip
+
+
+def iter_pdf_pages(
+    file_path: str,
+    start: int = 0,
+    stop: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> Iterator[tuple[str, list[str]]]:
+    """
+    Yield (page_text, page_urls) one page at a time, so only the current page
+    is held in memory. Stops after `max_pages` pages or `max_bytes` of text.
+    """
+    clip = _budget(max_bytes)
+    with fitz.open(file_path) as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        if max_pages is not None:
+            stop = min(stop, start + max_pages)
+        for number in range(start, stop):
+            page_text, page_urls = _page_content(doc.load_page(number))
+            page_text = clip(page_text)
+            if page_text is None:
+                return
+            yield page_text, page_urls
+
+
+def _extract_pdf_range(file_path: str, start: int, stop: int) -> list[tuple[str, list[str]]]:
+    """
+    Worker task: the pages in [start, stop) of one PDF.
+    """
+    return list(iter_pdf_pages(file_path, start, stop))
+
+
+def iter_pdf_pages_parallel(
+    file_path: str,
+    workers: int = 4,
+    chunk_pages: int = PDF_CHUNK_PAGES,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> Iterator[tuple[str, list[str]]]:
+    """
+    Same output as iter_pdf_pages, but page ranges of `chunk_pages` are read
+    concurrently on a process pool. Ranges are yielded in page order as they
+    complete, and at most `workers` ranges are in flight at once.
+    """
+    with fitz.open(file_path) as doc:
+        page_count = doc.page_count
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    if page_count <= chunk_pages or workers <= 1:
+        yield from iter_pdf_pages(file_path, 0, page_count, max_bytes=max_bytes)
+        return
+
+    ranges = [(s, min(s + chunk_pages, page_count)) for s in range(0, page_count, chunk_pages)]
+    clip = _budget(max_bytes)
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        pending = []
+        next_range = 0
+        while next_range < len(ranges) or pending:
+            while next_range < len(ranges) and len(pending) < workers:
+                start, stop = ranges[next_range]
+                pending.append(pool.submit(_extract_pdf_range, file_path, start, stop))
+                next_range += 1
+            for page_text, page_urls in pending.pop(0).result():
+                page_text = clip(page_text)
+                if page_text is None:
+                    for future in pending:
+                        future.cancel()
+                    return
+                yield page_text, page_urls
 
 
 def _extract_from_docx(file_path: str) -> tuple[str, list[str]]:
@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+# Benchmarks import both parsers: JDparse/common as packages, ResumeParse as a script dir
+PARSING_DIR = Path(__file__).resolve().parents[1]
+RESUME_PARSE_DIR = PARSING_DIR / "ResumeParse"
+
+for _p in (str(PARSING_DIR), str(RESUME_PARSE_DIR)):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
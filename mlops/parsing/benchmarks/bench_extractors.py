@@ -0,0 +1,82 @@
+"""
+Per-extractor timings over a synthetic corpus of sample resumes and JDs.
+
+Usage (from mlops/parsing):
+    python -m benchmarks.bench_extractors --docs 1000 --repeat 3
+    python -m benchmarks.bench_extractors --patterns   # also list the compiled pattern registry
+"""
+import argparse
+import time
+
+from benchmarks import _paths  # noqa: F401
+from benchmarks.corpus import make_jds, make_resumes
+from common.regex_registry import REGISTRY
+from extractors.basic_info_extractor import extract_basic_info
+from extractors.certifications_extractors import extract_certifications
+from extractors.education_extractor import extract_education
+from extractors.experience_extractor import (
+    extract_companies, extract_date_ranges, extract_experience, find_explicit_experience,
+)
+from extractors.projects_extractor import extract_projects
+from extractors.sections import segment_resume
+from extractors.skills_extractor import extract_skills
+from JDparse.extractors.certifications_extractor import extract_certifications as jd_certifications
+from JDparse.extractors.education_extractor import extract_education as jd_education
+from JDparse.extractors.experience_extractor import extract_experience as jd_experience
+
+RESUME_EXTRACTORS = {
+    "resume.segment_resume": segment_resume,
+    "resume.basic_info": extract_basic_info,
+    "resume.find_explicit_experience": find_explicit_experience,
+    "resume.extract_date_ranges": extract_date_ranges,
+    "resume.experience": extract_experience,
+    "resume.companies": extract_companies,
+    "resume.education": extract_education,
+    "resume.certifications": extract_certifications,
+    "resume.projects": extract_projects,
+    "resume.skills": extract_skills,
+}
+
+JD_EXTRACTORS = {
+    "jd.experience": jd_experience,
+    "jd.education": jd_education,
+    "jd.certifications": jd_certifications,
+}
+
+
+def time_extractor(fn, docs, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for doc in docs:
+            fn(doc)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--patterns", action="store_true", help="List the compiled pattern registry.")
+    args = parser.parse_args(argv)
+
+    resumes, jds = make_resumes(args.docs), make_jds(args.docs)
+    print(f"{args.docs} resumes, {args.docs} JDs, best of {args.repeat}")
+    print(f"{'extractor':<34} {'total ms':>10} {'us/doc':>10}")
+    total = 0.0
+    for extractors, docs in ((RESUME_EXTRACTORS, resumes), (JD_EXTRACTORS, jds)):
+        for name, fn in extractors.items():
+            seconds = time_extractor(fn, docs, args.repeat)
+            total += seconds
+            print(f"{name:<34} {seconds * 1000:>10.1f} {seconds / len(docs) * 1e6:>10.1f}")
+    print(f"{'total':<34} {total * 1000:>10.1f}")
+
+    if args.patterns:
+        print(f"\n{len(REGISTRY)} registered pattern sets")
+        for name, pattern_set in sorted(REGISTRY.items()):
+            print(f"  {name:<40} {len(pattern_set.patterns)} alternative(s)")
+
+
+if __name__ == "__main__":
+    main()
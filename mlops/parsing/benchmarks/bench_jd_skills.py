@@ -0,0 +1,68 @@
+"""
+Compare JDparse fuzzy skill matching (FuzzySkillIndex) against the previous
+per-token process.extractOne scan across vocabulary sizes.
+
+Usage (from mlops/parsing):
+    python -m benchmarks.bench_jd_skills --sizes 1000 10000 40000
+"""
+import argparse
+import re
+import time
+
+from rapidfuzz import fuzz, process
+
+from benchmarks import _paths  # noqa: F401
+from benchmarks.bench_resume_skills import make_vocab
+from JDparse.extractors.fuzzy_index import FuzzySkillIndex
+from JDparse.tests import sample_jds
+
+
+def jd_tokens():
+    jds = [getattr(sample_jds, name) for name in dir(sample_jds) if name.startswith("SIMPLE_JD")]
+    return [t for jd in jds for t in re.findall(r"\S+", jd) if len(t) > 1]
+
+
+def legacy_match(tokens, vocab, threshold=85):
+    out = []
+    for tok in tokens:
+        best = process.extractOne(tok, vocab, scorer=fuzz.WRatio)
+        out.append(best[0] if best and best[1] >= threshold else None)
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 40000])
+    args = parser.parse_args(argv)
+
+    tokens = jd_tokens()
+    print(f"{len(tokens)} JD tokens ({len(set(tokens))} unique)")
+    print(f"{'vocab':>8} {'build ms':>10} {'cold ms':>10} {'warm ms':>10} {'legacy ms':>10} {'cands/tok':>10}")
+
+    for size in args.sizes:
+        vocab = make_vocab(size)
+
+        start = time.perf_counter()
+        index = FuzzySkillIndex(vocab)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = index.match_many(tokens)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index.match_many(tokens)
+        warm = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = legacy_match(tokens, vocab)
+        legacy = time.perf_counter() - start
+
+        assert got == expected, "FuzzySkillIndex output differs from extractOne"
+        cands = sum(len(index.candidates(t)) for t in set(tokens)) / len(set(tokens))
+        print(f"{size:>8} {build * 1000:>10.1f} {cold * 1000:>10.1f} {warm * 1000:>10.2f} "
+              f"{legacy * 1000:>10.1f} {cands:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Compare ResumeParse skill extraction (compiled SkillMatcher) against the previous
+per-skill regex loop on a large synthetic skill vocabulary.
+
+Usage (from mlops/parsing):
+    python -m benchmarks.bench_resume_skills --vocab 10000 --docs 50
+"""
+import argparse
+import random
+import re
+import time
+from typing import List, Set
+
+from benchmarks import _paths  # noqa: F401
+from extractors import skills_extractor
+from extractors.skills_extractor import SkillMatcher, extract_skills_section
+
+SYLLABLES = ["ka", "fa", "ro", "ne", "ti", "lo", "ber", "zen", "quo", "mi", "dra", "vex", "on", "ix", "ul"]
+SUFFIXES = ["", "", "", ".js", "DB", " Cloud", " Studio", "ML", " API", "++"]
+
+
+def make_vocab(size: int, seed: int = 0) -> List[str]:
+    """
+    The real skill list padded with synthetic product-like names up to `size` entries.
+    """
+    rng = random.Random(seed)
+    vocab = list(skills_extractor.ALL_SKILLS)
+    seen = {s.lower() for s in vocab}
+    while len(vocab) < size:
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+        name += rng.choice(SUFFIXES)
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            vocab.append(name)
+    return vocab
+
+
+def make_resume(vocab: List[str], rng: random.Random) -> str:
+    picked = rng.sample(vocab, 25)
+    return "\n".join([
+        "Jane Doe",
+        "jane@doe.dev | github.com/janedoe",
+        "Experience",
+        "Software Engineer at Example Corp, using " + ", ".join(picked[:8]) + " daily.",
+        "Technical Skills",
+        "Languages: " + ", ".join(picked[8:16]),
+        "Frameworks: " + ", ".join(picked[16:]),
+        "",
+        "Education",
+        "BS Computer Science",
+    ])
+
+
+def legacy_extract_skills(text: str, all_skills: List[str]) -> List[str]:
+    """
+    The per-skill regex implementation that SkillMatcher replaced (kept for comparison).
+    """
+    found_skills: Set[str] = set()
+    skills_section = extract_skills_section(text)
+    search_text = skills_section if skills_section else text
+    search_text_lower = search_text.lower()
+
+    for skill in all_skills:
+        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
+        if re.search(pattern, search_text_lower):
+            found_skills.add(skill)
+
+    if skills_section:
+        tokens = re.split(r'[,;\n•\-\|]', skills_section)
+        for token in tokens:
+            token = token.strip()
+            if len(token) < 2 or len(token) > 50:
+                continue
+            if any(header in token.lower() for header in [
+                'skills:', 'technical skills', 'languages:', 'frameworks:',
+                'tools:', 'databases:', 'soft skills'
+            ]):
+                continue
+            token_lower = token.lower()
+            for skill in all_skills:
+                if token_lower == skill.lower() or token_lower in skill.lower():
+                    found_skills.add(skill)
+                    break
+            else:
+                if token[0].isupper() and 3 <= len(token) <= 30:
+                    if not any(word in token.lower() for word in [
+                        'experience', 'education', 'project', 'worked', 'developed',
+                        'university', 'college', 'company', 'team', 'using'
+                    ]):
+                        found_skills.add(token.title())
+
+    return sorted(found_skills)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--vocab", type=int, default=10000)
+    parser.add_argument("--docs", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    vocab = make_vocab(args.vocab)
+    rng = random.Random(1)
+    docs = [make_resume(vocab, rng) for _ in range(args.docs)]
+
+    start = time.perf_counter()
+    skills_extractor.ALL_SKILLS[:] = vocab
+    skills_extractor.get_skill_matcher()
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = [skills_extractor.extract_skills(d) for d in docs]
+    new_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    old = [legacy_extract_skills(d, vocab) for d in docs]
+    old_time = time.perf_counter() - start
+
+    assert new == old, "SkillMatcher output differs from the legacy implementation"
+
+    print(f"vocabulary: {len(vocab)} skills, {len(docs)} resumes")
+    print(f"  matcher build     {build * 1000:9.1f} ms (once)")
+    print(f"  SkillMatcher      {new_time / len(docs) * 1000:9.2f} ms/resume")
+    print(f"  legacy regex loop {old_time / len(docs) * 1000:9.2f} ms/resume")
+    print(f"  speedup           {old_time / new_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
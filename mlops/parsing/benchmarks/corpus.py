@@ -0,0 +1,177 @@
+"""
+Deterministic synthetic resumes and job descriptions for the benchmarks.
+
+The generated documents follow the layouts of the sample resumes under
+mlops/extraction (contact line, section headers, date ranges, bulleted
+projects, certification lists), with enough variation in section order,
+header spelling, date formats and contact formats to exercise every
+extractor branch.
+
+`size` scales the number of jobs, schools and projects per resume, `sections`
+picks the section mix, and write_corpus() renders documents to txt/PDF/DOCX
+files for the text-extraction benchmarks.
+"""
+import os
+import random
+from typing import Iterable, List, Optional
+
+FIRST = ["Jane", "Musa", "Affan", "Sara", "Ali", "Maria", "John", "Ayesha", "Omar", "Li"]
+LAST = ["Doe", "Khan", "Abid", "Arfah", "Smith", "Garcia", "Chen", "Malik", "Haider", "Park"]
+COMPANIES = ["Acme Corp", "DataVerse Labs", "DATXOC", "Tanbits", "JobLogic", "Globex", "Initech", "Umbrella AI"]
+TITLES = ["Software Engineer", "Data Science Intern", "Python Developer", "ML Engineer", "Backend Developer"]
+SCHOOLS = ["Punjab University College of Information Technology (PUCIT)", "Government College University (GCU)",
+           "Stanford University", "National Institute of Technology"]
+DEGREES = ["BS Data Science", "BSc Computer Science", "Master of Science in Artificial Intelligence",
+           "PhD in Physics", "MBA", "Intermediate", "Bachelor's in Software Engineering"]
+SKILLS = ["Python", "Java", "SQL", "Django", "FastAPI", "React", "Docker", "AWS", "Pandas", "NumPy",
+          "TensorFlow", "Git", "PostgreSQL", "Power BI", "Kubernetes", "C++", "Node.js", "Scikit-learn"]
+CERTS = ["AWS Certified Solutions Architect – Associate", "Meta: Django Web Framework",
+         "IBM: Python for Data Science, AI, and Development", "CompTIA Security+ (2023)",
+         "Certified Kubernetes Administrator by Linux Foundation", "Google Cloud Professional Data Engineer Certification",
+         "PMP", "Certificate in Data Analytics from Coursera"]
+MONTHS = ["Jan", "Feb.", "March", "Apr", "May", "June", "Jul.", "Aug", "Sep.", "October", "Nov", "Dec."]
+EXPERIENCE_HEADERS = ["Experience", "WORK EXPERIENCE", "Professional Experience", "Employment History"]
+SKILL_HEADERS = ["Technical Skills", "Skills", "SKILLS", "Core Competencies"]
+PROJECT_HEADERS = ["Projects", "Highlighted Personal Projects", "Academic Projects"]
+CERT_HEADERS = ["Certifications", "CERTIFICATIONS", "Licenses & Certifications"]
+
+
+def _date(rng: random.Random) -> str:
+    return f"{rng.choice(MONTHS)} {rng.randint(2012, 2025)}"
+
+
+RESUME_SECTIONS = ("experience", "skills", "education", "projects", "certifications")
+
+
+def make_resume(rng: random.Random, size: int = 1, sections: Optional[Iterable[str]] = None) -> str:
+    """
+    One synthetic resume; `size` multiplies the repeated entries, `sections` limits
+    the optional sections to the given names (all of RESUME_SECTIONS by default).
+    """
+    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+    handle = name.lower().replace(" ", ".")
+    phone = rng.choice(["+92 3094503679", "0309-2753032", "(555) 123-4567", "+1 415 555 0199"])
+    contact = f"{phone} | {handle}@example.org | linkedin.com/in/{handle.replace('.', '')} | https://github.com/{handle}"
+
+    blocks = {}
+    jobs = []
+    for _ in range(rng.randint(1, 4) * size):
+        end = rng.choice(["Present", "Current", _date(rng)])
+        jobs.append("\n".join([
+            rng.choice(TITLES),
+            f"{_date(rng)} {rng.choice(['–', '-', '—'])} {end}",
+            rng.choice(COMPANIES),
+            rng.choice(["Remote", "Lahore", "San Francisco, CA"]),
+            f"• Built services in {rng.choice(SKILLS)} and {rng.choice(SKILLS)}.",
+            f"• Improved latency by {rng.randint(5, 60)}% over {rng.randint(2, 9)} years of experience.",
+        ]))
+    blocks["experience"] = f"{rng.choice(EXPERIENCE_HEADERS)}\n" + "\n\n".join(jobs)
+
+    picked = rng.sample(SKILLS, rng.randint(4, 12))
+    half = len(picked) // 2
+    blocks["skills"] = "\n".join([
+        rng.choice(SKILL_HEADERS),
+        "Languages: " + ", ".join(picked[:half]),
+        "Frameworks: " + ", ".join(picked[half:]),
+    ])
+
+    schools = []
+    for _ in range(rng.randint(1, 2) * size):
+        schools.append("\n".join([rng.choice(SCHOOLS), rng.choice(["Lahore", "Stanford, CA"]),
+                                  rng.choice(DEGREES), f"Expected {_date(rng)}"]))
+    blocks["education"] = "Education\n" + "\n\n".join(schools)
+
+    projects = []
+    for _ in range(rng.randint(1, 4) * size):
+        projects.append(f"{rng.choice(['Chatbot', 'Hospital Dashboard', 'Portal', 'Roadmap App'])} | "
+                        f"{', '.join(rng.sample(SKILLS, 3))}\n• Shipped to {rng.randint(10, 900)} users.")
+    blocks["projects"] = f"{rng.choice(PROJECT_HEADERS)}\n" + "\n".join(projects)
+
+    if rng.random() < 0.7:
+        blocks["certifications"] = f"{rng.choice(CERT_HEADERS)}\n" + "\n".join(
+            "● " + c for c in rng.sample(CERTS, rng.randint(1, 4))
+        )
+
+    order = list(blocks)
+    rng.shuffle(order)
+    if sections is not None:
+        keep = set(sections)
+        order = [k for k in order if k in keep]
+    summary = f"Professional Summary\nEngineer with {rng.randint(1, 12)}+ years of experience in {rng.choice(SKILLS)}."
+    return "\n".join([name, contact, "", summary, ""] + ["\n" + blocks[k] for k in order])
+
+
+def make_resumes(n: int = 1000, seed: int = 0, size: int = 1,
+                 sections: Optional[Iterable[str]] = None) -> List[str]:
+    rng = random.Random(seed)
+    return [make_resume(rng, size, sections) for _ in range(n)]
+
+
+JD_YEARS = ["3+ years", "at least 5 years", "minimum 2 years", "4-6 years", "7 years", "no prior"]
+JD_DEGREES = ["Bachelor's degree in Computer Science", "BSc in Software Engineering", "Master's in Data Science",
+              "MSc in Statistics", "PhD", "MBA", "degree in a related field"]
+JD_CERTS = ["AWS Certified Developer", "Certified Scrum Master", "PMP", "GCP Professional Cloud Architect"]
+
+
+def make_jd(rng: random.Random) -> str:
+    level = rng.choice(["Senior", "Junior", "Mid-level", "Lead", ""])
+    return "\n".join([
+        f"{level} {rng.choice(TITLES)}".strip(),
+        f"We need {rng.choice(JD_YEARS)} experience in {rng.choice(['backend', 'data science', 'machine learning', 'cloud'])}.",
+        "Requirements:",
+        f"- {', '.join(rng.sample(SKILLS, 5))}",
+        f"- {rng.choice(JD_DEGREES)} or equivalent",
+        f"- Preferred certifications: {', '.join(rng.sample(JD_CERTS, 2))}",
+        "Responsibilities:",
+        "- Build and run production services",
+    ])
+
+
+def make_jds(n: int = 1000, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [make_jd(rng) for _ in range(n)]
+
+
+def write_document(text: str, path: str) -> str:
+    """
+    Render `text` to a .txt, .pdf or .docx file (chosen by the extension).
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".txt":
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    elif ext == ".pdf":
+        import fitz
+
+        doc = fitz.open()
+        lines = text.splitlines()
+        # 46 lines of 10pt text fit a Letter page inside 72pt margins
+        for start in range(0, max(len(lines), 1), 46):
+            page = doc.new_page(width=612, height=792)
+            page.insert_text((72, 72), "\n".join(lines[start:start + 46]), fontsize=10)
+        doc.save(path)
+        doc.close()
+    elif ext == ".docx":
+        from docx import Document
+
+        doc = Document()
+        for line in text.splitlines():
+            doc.add_paragraph(line)
+        doc.save(path)
+    else:
+        raise ValueError(f"Unsupported corpus format: {ext}")
+    return path
+
+
+def write_corpus(directory: str, n: int = 20, formats: Iterable[str] = ("txt", "pdf", "docx"),
+                 seed: int = 0, size: int = 1) -> List[str]:
+    """
+    Write n synthetic resumes in each format; returns the file paths.
+    """
+    os.makedirs(directory, exist_ok=True)
+    texts = make_resumes(n, seed=seed, size=size)
+    paths = []
+    for fmt in formats:
+        for i, text in enumerate(texts):
+            paths.append(write_document(text, os.path.join(directory, f"resume_{i:04d}.{fmt}")))
+    return paths
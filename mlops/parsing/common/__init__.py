@@ -0,0 +1 @@
+# Shared infrastructure for the ResumeParse and JDparse parsers.
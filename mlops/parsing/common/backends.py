@@ -0,0 +1,284 @@
+"""
+Pluggable LLM backends and the router that picks one per request.
+
+The parsers talk to an LLMBackend instead of a provider client directly:
+  - RemoteBackend adapts a provider client (call_groq, call_llm, ...).
+  - LocalBackend sends OpenAI-compatible requests to an inference server on this
+    machine running a small quantized model on CPU, e.g. llama.cpp's server with
+    continuous batching over parallel slots:
+
+        llama-server -m qwen2.5-1.5b-instruct-q4_k_m.gguf --port 8080 \\
+            --parallel 4 --cont-batching -c 16384
+
+    (or Ollama's /v1/chat/completions). Requests ask the server to keep the
+    shared prompt prefix (the schema block) in its KV cache.
+
+BackendRouter.select(tokens) sends short documents to the local model (no
+network round trip), overflows to it when the provider queue is deep, and uses
+it for everything while the provider's circuit breaker is open; the rest goes
+to the remote provider. Without HIRO_LOCAL_LLM_URL there is no local backend and
+every request goes remote, as before.
+
+Configuration (environment):
+    HIRO_LLM_BACKEND=auto|remote|local  routing policy (default auto)
+    HIRO_LOCAL_LLM_URL=<url>            local chat completions endpoint, e.g.
+                                        http://127.0.0.1:8080/v1/chat/completions
+    HIRO_LOCAL_LLM_MODEL=<name>         model name sent to the server (default local)
+    HIRO_LOCAL_LLM_SLOTS=<n>            parallel slots on the server (default 4)
+    HIRO_LOCAL_MAX_TOKENS=<n>           auto: documents up to this size go local (default 1200)
+    HIRO_REMOTE_QUEUE_DEPTH=<n>         auto: overflow to local past this many queued
+                                        provider requests (default 8)
+"""
+import os
+import threading
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, Optional
+
+from common.http_client import get_client
+from common.scheduler import get_scheduler
+from common.sse import iter_content
+from common.tracing import record, span
+
+AUTO = "auto"
+REMOTE = "remote"
+LOCAL = "local"
+
+DEFAULT_POLICY = os.getenv("HIRO_LLM_BACKEND", AUTO)
+LOCAL_LLM_URL = os.getenv("HIRO_LOCAL_LLM_URL")
+LOCAL_LLM_MODEL = os.getenv("HIRO_LOCAL_LLM_MODEL", "local")
+LOCAL_LLM_SLOTS = int(os.getenv("HIRO_LOCAL_LLM_SLOTS", "4"))
+LOCAL_MAX_TOKENS = int(os.getenv("HIRO_LOCAL_MAX_TOKENS", "1200"))
+REMOTE_QUEUE_DEPTH = int(os.getenv("HIRO_REMOTE_QUEUE_DEPTH", "8"))
+LOCAL_TIMEOUT = 120  # seconds; CPU generation is slow for long outputs
+
+# Requests in flight per local server URL, shared by every LocalBackend using it
+_local_in_flight: Dict[str, int] = {}
+_local_lock = threading.Lock()
+
+
+class LLMBackend:
+    """
+    Interface of an extraction backend: prompt in, raw completion text out.
+
+    Attributes:
+        name: Short label for logs and spans ("groq", "local", ...).
+        model: Model identifier; part of the LLM cache key.
+    """
+    name = "backend"
+    model = ""
+
+    def complete(self, prompt: str) -> str:
+        raise NotImplementedError
+
+    async def acomplete(self, prompt: str) -> str:
+        raise NotImplementedError
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        """
+        Completion text fragments as they are generated.
+        """
+        raise NotImplementedError
+
+    def available(self) -> bool:
+        return True
+
+    def queue_depth(self) -> int:
+        """
+        Requests waiting for (or holding) this backend.
+        """
+        return 0
+
+
+class RemoteBackend(LLMBackend):
+    """
+    Adapter over a provider client's functions; availability and queue depth come
+    from the provider's scheduler (see common.scheduler).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        complete: Callable[[str], str],
+        acomplete: Optional[Callable[[str], Awaitable[str]]] = None,
+        stream: Optional[Callable[[str], Iterator[str]]] = None,
+    ):
+        self.name = name
+        self.model = model
+        self._complete = complete
+        self._acomplete = acomplete
+        self._stream = stream
+
+    def complete(self, prompt: str) -> str:
+        return self._complete(prompt)
+
+    async def acomplete(self, prompt: str) -> str:
+        if self._acomplete is None:
+            raise NotImplementedError(f"{self.name} has no async client")
+        return await self._acomplete(prompt)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        if self._stream is None:
+            raise NotImplementedError(f"{self.name} has no streaming client")
+        return self._stream(prompt)
+
+    def available(self) -> bool:
+        return get_scheduler(self.name).breaker.state != "open"
+
+    def queue_depth(self) -> int:
+        return get_scheduler(self.name).queue_depth
+
+
+class LocalBackend(LLMBackend):
+    """
+    OpenAI-compatible inference server on this machine.
+
+    Args:
+        url: Chat completions endpoint.
+        model: Model name sent with every request.
+        slots: Requests the server decodes together (its --parallel setting).
+        system: Optional system message for every request.
+        temperature: Sampling temperature.
+    """
+    name = "local"
+
+    def __init__(self, url: str, model: str = LOCAL_LLM_MODEL, slots: int = LOCAL_LLM_SLOTS,
+                 system: Optional[str] = None, temperature: float = 0.0):
+        self.url = url
+        self.model = model
+        self.slots = slots
+        self.system = system
+        self.temperature = temperature
+
+    def _payload(self, prompt: str, stream: bool = False) -> dict:
+        messages = [{"role": "system", "content": self.system}] if self.system else []
+        messages.append({"role": "user", "content": prompt})
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "cache_prompt": True,  # llama.cpp: reuse the KV cache for the shared prefix
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    @contextmanager
+    def _slot(self):
+        with _local_lock:
+            _local_in_flight[self.url] = _local_in_flight.get(self.url, 0) + 1
+        try:
+            yield
+        finally:
+            with _local_lock:
+                _local_in_flight[self.url] -= 1
+
+    @staticmethod
+    def _content(response) -> str:
+        response.raise_for_status()
+        data = response.json()
+        usage = data.get("usage") or {}
+        record(
+            bytes_out=len(response.content),
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+        )
+        return data["choices"][0]["message"]["content"]
+
+    def complete(self, prompt: str) -> str:
+        payload = self._payload(prompt)
+        with span("llm.local", model=self.model) as stage, self._slot():
+            stage.add(bytes_in=len(prompt.encode("utf-8")))
+            response = get_scheduler(self.name).call(
+                lambda: get_client().post_sync(self.url, json=payload, timeout=LOCAL_TIMEOUT)
+            )
+            return self._content(response)
+
+    async def acomplete(self, prompt: str) -> str:
+        payload = self._payload(prompt)
+        with span("llm.local", model=self.model) as stage, self._slot():
+            stage.add(bytes_in=len(prompt.encode("utf-8")))
+            response = await get_scheduler(self.name).acall(
+                lambda: get_client().post(self.url, json=payload, timeout=LOCAL_TIMEOUT)
+            )
+            return self._content(response)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        payload = self._payload(prompt, stream=True)
+        with self._slot():
+            lines = get_scheduler(self.name).stream(
+                lambda: get_client().stream_lines_sync(self.url, json=payload, timeout=LOCAL_TIMEOUT)
+            )
+            try:
+                yield from iter_content(lines)
+            finally:
+                lines.close()
+
+    def available(self) -> bool:
+        return get_scheduler(self.name).breaker.state != "open"
+
+    def queue_depth(self) -> int:
+        return _local_in_flight.get(self.url, 0)
+
+
+def local_backend_from_env(system: Optional[str] = None, temperature: float = 0.0) -> Optional[LocalBackend]:
+    """
+    The configured local backend, or None when HIRO_LOCAL_LLM_URL is not set.
+    """
+    if not LOCAL_LLM_URL:
+        return None
+    return LocalBackend(LOCAL_LLM_URL, system=system, temperature=temperature)
+
+
+class BackendRouter:
+    """
+    Picks the backend for each request.
+
+    Args:
+        remote: The provider backend.
+        local: Optional local backend.
+        policy: "remote" or "local" pins every request (local falls back to remote
+            when unavailable); "auto" routes by document size and queue depth.
+        local_max_tokens: auto: documents up to this many tokens go local.
+        remote_queue_depth: auto: queued provider requests past which work overflows to local.
+    """
+
+    def __init__(
+        self,
+        remote: LLMBackend,
+        local: Optional[LLMBackend] = None,
+        policy: str = DEFAULT_POLICY,
+        local_max_tokens: int = LOCAL_MAX_TOKENS,
+        remote_queue_depth: int = REMOTE_QUEUE_DEPTH,
+    ):
+        if policy not in (AUTO, REMOTE, LOCAL):
+            raise ValueError(f"Unknown backend policy: {policy!r} (expected {AUTO!r}, {REMOTE!r} or {LOCAL!r})")
+        self.remote = remote
+        self.local = local
+        self.policy = policy
+        self.local_max_tokens = local_max_tokens
+        self.remote_queue_depth = remote_queue_depth
+
+    def models(self) -> list:
+        """
+        Models that may answer a request, remote first (for cache lookups).
+        """
+        return [self.remote.model] + ([self.local.model] if self.local is not None else [])
+
+    def select(self, tokens: int) -> LLMBackend:
+        """
+        Backend for a document of about `tokens` tokens.
+        """
+        local = self.local
+        if local is None or self.policy == REMOTE or not local.available():
+            return self.remote
+        if self.policy == LOCAL or not self.remote.available():
+            return local
+
+        slots = getattr(local, "slots", 1)
+        local_depth = local.queue_depth()
+        if tokens <= self.local_max_tokens and local_depth < slots:
+            return local
+        if self.remote.queue_depth() >= self.remote_queue_depth and local_depth < 2 * slots:
+            return local
+        return self.remote
@@ -0,0 +1,166 @@
+"""
+Batched LLM extraction: several documents in one chat completion.
+
+Every extraction call pays a network round trip, the fixed prompt instructions
+and a slot in the provider's request rate limit. For bulk runs (re-parsing a
+corpus after a prompt change, re-scoring) short documents are packed into one
+prompt that asks for a JSON array with one {"id": ..., "data": {...}} item per
+document. The response is validated item by item and split back into
+per-document results; a document whose item is missing, duplicated or invalid
+is retried on its own with the single-document call.
+
+    for batch in pack_batches(documents):
+        result = run_batch(batch, batch_call, single_call, validate)
+
+Configuration (environment):
+    HIRO_LLM_BATCH_TOKENS=<n>      document tokens per batched request (default 6000)
+    HIRO_LLM_BATCH_SIZE=<n>        documents per batched request (default 8)
+    HIRO_LLM_BATCH_DOC_TOKENS=<n>  larger documents are always sent alone (default 1500)
+"""
+import json
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from common.compaction import estimate_tokens
+from common.tracing import span
+
+DEFAULT_BATCH_TOKENS = int(os.getenv("HIRO_LLM_BATCH_TOKENS", "6000"))
+DEFAULT_BATCH_SIZE = int(os.getenv("HIRO_LLM_BATCH_SIZE", "8"))
+DEFAULT_MAX_DOC_TOKENS = int(os.getenv("HIRO_LLM_BATCH_DOC_TOKENS", "1500"))
+
+# A document is (id, text); ids must be unique within a batch
+Document = Tuple[str, str]
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+
+class BatchResult(NamedTuple):
+    results: Dict[str, Any]  # per-document result, by id
+    retried: List[str]       # ids that fell back to the single-document call
+
+
+def pack_batches(
+    documents: Iterable[Document],
+    token_budget: int = DEFAULT_BATCH_TOKENS,
+    max_docs: int = DEFAULT_BATCH_SIZE,
+    max_doc_tokens: int = DEFAULT_MAX_DOC_TOKENS,
+) -> List[List[Document]]:
+    """
+    Group documents into batches of at most `max_docs` documents and `token_budget`
+    estimated tokens, keeping their order within each batch. Documents over
+    `max_doc_tokens` get a batch of their own (sent with the single-document prompt).
+    """
+    batches: List[List[Document]] = []
+    current: List[Document] = []
+    used = 0
+    for doc in documents:
+        tokens = estimate_tokens(doc[1])
+        if tokens > max_doc_tokens:
+            batches.append([doc])
+            continue
+        if current and (len(current) >= max_docs or used + tokens > token_budget):
+            batches.append(current)
+            current, used = [], 0
+        current.append(doc)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _load_items(text: str) -> List[Any]:
+    """
+    The JSON array in a batched response (markdown fences and surrounding prose allowed).
+    """
+    fenced = _FENCE_RE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    text = text.strip()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        start, end = text.find("["), text.rfind("]")
+        if start == -1 or end <= start:
+            raise
+        data = json.loads(text[start:end + 1])
+
+    if isinstance(data, dict):
+        # {"results": [...]}, or a lone item when the model answered for one document
+        for value in data.values():
+            if isinstance(value, list):
+                return value
+        return [data]
+    if not isinstance(data, list):
+        raise ValueError(f"expected a JSON array, got {type(data).__name__}")
+    return data
+
+
+def parse_batch_response(
+    text: str,
+    ids: Sequence[str],
+    validate: Optional[Callable[[Any], bool]] = None,
+) -> Dict[str, Any]:
+    """
+    Split a batched response into {id: data} for the items that pass validation.
+
+    Items with an unknown id, a repeated id or data rejected by `validate` are
+    left out, so the caller can retry those documents. Raises ValueError (or
+    json.JSONDecodeError) when the response is not a JSON array at all.
+    """
+    wanted = set(ids)
+    results: Dict[str, Any] = {}
+    repeated = set()
+    for item in _load_items(text):
+        if not isinstance(item, dict) or "data" not in item:
+            continue
+        doc_id = str(item.get("id"))
+        if doc_id not in wanted:
+            continue
+        if doc_id in results:
+            repeated.add(doc_id)
+            continue
+        data = item["data"]
+        if validate is None or validate(data):
+            results[doc_id] = data
+    for doc_id in repeated:
+        # Two answers for one document: trust neither
+        results.pop(doc_id, None)
+    return results
+
+
+def run_batch(
+    batch: Sequence[Document],
+    batch_call: Callable[[Sequence[Document]], str],
+    single_call: Callable[[str, str], Any],
+    validate: Optional[Callable[[Any], bool]] = None,
+) -> BatchResult:
+    """
+    Extract one packed batch.
+
+    Args:
+        batch_call: Sends the batched prompt for `batch`; returns the raw response text.
+        single_call: single_call(id, text) extracts one document the usual way.
+        validate: Accepts or rejects one document's data from the batched response.
+
+    A batch of one document, a failed request or an unparsable response all fall
+    back to `single_call` for the affected documents.
+    """
+    if len(batch) == 1:
+        doc_id, text = batch[0]
+        return BatchResult({doc_id: single_call(doc_id, text)}, [])
+
+    with span("llm.batch", docs=len(batch)) as stage:
+        try:
+            results = parse_batch_response(batch_call(batch), [doc_id for doc_id, _ in batch], validate)
+        except Exception as e:
+            print(f"⚠️ Batched LLM call failed: {e}")
+            stage.set(failed=type(e).__name__)
+            results = {}
+        retried = [doc_id for doc_id, _ in batch if doc_id not in results]
+        stage.add(batch_docs=len(results), batch_retries=len(retried))
+
+    for doc_id, text in batch:
+        if doc_id in retried:
+            results[doc_id] = single_call(doc_id, text)
+    return BatchResult(results, retried)
@@ -0,0 +1,208 @@
+"""
+Prompt compaction: shrink a document before it is embedded in an LLM prompt.
+
+Input tokens dominate the latency and cost of an extraction call, and raw resume
+and JD text carries a lot that the model does not need:
+  - layout noise: runs of spaces, blank lines, zero-width characters, unicode
+    bullet glyphs (several tokens each),
+  - boilerplate lines ("Page 2 of 3", "References available upon request",
+    equal-opportunity statements),
+  - contact-only lines (email | phone | links), which the rule-based extractors
+    already read, so the parsers fill those fields from the fallback,
+  - bullets repeated verbatim across roles.
+After cleaning, a token budget is enforced by keeping whole sections in priority
+order and cutting the lowest-priority ones line by line.
+
+Token counts are estimated (about four characters per token), which is close
+enough for budgeting and avoids a tokenizer dependency.
+
+Configuration (environment):
+    HIRO_PROMPT_COMPACTION=0           send documents unchanged
+    HIRO_PROMPT_TOKEN_BUDGET=<n>       resume/JD text budget in tokens (default 2500)
+    HIRO_PROMPT_SIMPLE_MAX_TOKENS=<n>  documents at most this size use the short
+                                       prompt template (default 300)
+"""
+import os
+import re
+import unicodedata
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Bump when the compaction output changes so cached LLM responses are not reused
+COMPACTION_VERSION = "compact-v1"
+
+ENABLED = os.getenv("HIRO_PROMPT_COMPACTION", "1").lower() not in ("0", "false", "off")
+DEFAULT_TOKEN_BUDGET = int(os.getenv("HIRO_PROMPT_TOKEN_BUDGET", "2500"))
+SIMPLE_PROMPT_MAX_TOKENS = int(os.getenv("HIRO_PROMPT_SIMPLE_MAX_TOKENS", "300"))
+
+# A block is (section name or None for the text before the first header, text)
+Block = Tuple[Optional[str], str]
+
+_ZERO_WIDTH_RE = re.compile(r"[\u200b\u200c\u200d\u2060\ufeff\u00ad]")
+_SPACES_RE = re.compile(r"[ \t\u00a0\u2000-\u200a\u202f\u205f\u3000]+")
+_BULLET_RE = re.compile(r"^[\u2022\u25cf\u25aa\u25a0\u25e6\u2023\u2043\u2219\u27a2\u27a4\u25ba\u2713\u2714*\-\u2013\u2014]+\s*")
+
+BOILERPLATE_PATTERNS = [
+    r"page\s+\d+(\s*(of|/)\s*\d+)?",
+    r"(curriculum\s+vitae|resume|résumé|cv)",
+    r"references?\s+(are\s+)?(available\s+)?(up)?on\s+request\.?",
+    r"(i\s+)?hereby\s+declare\b.*",
+    r"declaration:?",
+    r".*\bequal\s+(employment\s+)?opportunity\s+employer\b.*",
+    r"(apply\s+now|click\s+here\b.*|share\s+this\s+job)\.?",
+]
+_BOILERPLATE_RE = re.compile(r"^(?:" + "|".join(BOILERPLATE_PATTERNS) + r")$", re.IGNORECASE)
+_WORD_RE = re.compile(r"\w+")
+
+# Contact tokens: emails, phone numbers (9+ digits, so date ranges do not count) and
+# links with a scheme, "www." or a path. Bare domains ("socket.io", "ASP.NET") only
+# count on a line that also has one of those, so skill lists are never mistaken
+# for contact details.
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE_RE = re.compile(r"\+?\(?\d[\d\s().-]{6,}\d")
+_LINK_RE = re.compile(r"(?:https?://|www\.)\S+|[\w-]+(?:\.[\w-]+)*\.[a-z]{2,}/\S*", re.IGNORECASE)
+_DOMAIN_RE = re.compile(r"[\w-]+(?:\.[\w-]+)*\.[a-z]{2,}", re.IGNORECASE)
+_CONTACT_LABEL_RE = re.compile(
+    r"\b(e-?mail|phone|mobile|cell|tel|contact|linkedin|github|portfolio|website)\b", re.IGNORECASE
+)
+_PHONE_DIGITS_RE = re.compile(r"\d(?:[\s().-]*\d){8}")
+_SEPARATORS_RE = re.compile(r"[\s|\u2022\u00b7,;:/\u2013\u2014()\[\]-]+")
+
+
+def _strip_phones(line: str) -> Tuple[str, bool]:
+    found = False
+
+    def repl(match):
+        nonlocal found
+        if sum(ch.isdigit() for ch in match.group()) >= 9:
+            found = True
+            return " "
+        return match.group()
+
+    return _PHONE_RE.sub(repl, line), found
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for budgeting (BPE tokenizers average ~4 characters per token).
+    """
+    return (len(text) + 3) // 4
+
+
+def normalize_line(line: str) -> str:
+    """
+    Collapse horizontal whitespace and turn bullet glyphs into a plain "- ".
+    """
+    line = _SPACES_RE.sub(" ", line).strip()
+    if line and _BULLET_RE.match(line):
+        rest = _BULLET_RE.sub("", line)
+        return f"- {rest}" if rest else ""
+    return line
+
+
+def is_boilerplate(line: str) -> bool:
+    return bool(_BOILERPLATE_RE.match(line))
+
+
+def is_contact_line(line: str) -> bool:
+    """
+    True when the line holds nothing but contact details (emails, phones, links, labels).
+    """
+    # Cheap precheck (most lines): nothing an email, link or phone number needs
+    if "@" not in line and "/" not in line and "www." not in line.lower() and not _PHONE_DIGITS_RE.search(line):
+        return False
+    rest, strong = _EMAIL_RE.subn(" ", line)
+    rest, links = _LINK_RE.subn(" ", rest)
+    rest, phone = _strip_phones(rest)
+    if not (strong or links or phone):
+        return False
+    rest = _DOMAIN_RE.sub(" ", rest)
+    rest = _CONTACT_LABEL_RE.sub(" ", rest)
+    return not _SEPARATORS_RE.sub("", rest)
+
+
+def clean_lines(text: str, strip_contacts: bool = True) -> List[str]:
+    """
+    Normalized lines with boilerplate, contact-only lines and repeated bullets removed.
+    Blank lines are kept (one at most in a row) as paragraph breaks.
+    """
+    text = unicodedata.normalize("NFKC", text or "")
+    text = _ZERO_WIDTH_RE.sub("", text)
+    seen = set()
+    out: List[str] = []
+    for raw in text.splitlines():
+        line = normalize_line(raw)
+        if not line:
+            if out and out[-1]:
+                out.append("")
+            continue
+        if is_boilerplate(line) or (strip_contacts and is_contact_line(line)):
+            continue
+        words = _WORD_RE.findall(line.lower())
+        if len(words) >= 3:
+            key = " ".join(words)
+            if key in seen:
+                continue
+            seen.add(key)
+        out.append(line)
+    while out and not out[-1]:
+        out.pop()
+    return out
+
+
+def fit_to_budget(blocks: Sequence[Block], budget: int, priority: Sequence[str] = ()) -> str:
+    """
+    Join blocks in document order, keeping at most `budget` estimated tokens.
+
+    Blocks are filled in priority order (the preamble first, then `priority`, then
+    everything else in document order); the first block that does not fit is cut
+    at a line boundary and lower-priority blocks are dropped.
+    """
+    rank = {name: i for i, name in enumerate(priority)}
+    order = sorted(range(len(blocks)),
+                   key=lambda i: (-1 if blocks[i][0] is None else rank.get(blocks[i][0], len(rank)), i))
+
+    kept: Dict[int, List[str]] = {}
+    remaining = budget
+    for i in order:
+        lines = []
+        for line in blocks[i][1].splitlines():
+            cost = estimate_tokens(line) + 1  # the newline
+            if cost > remaining:
+                remaining = 0
+                break
+            lines.append(line)
+            remaining -= cost
+        kept[i] = lines
+
+    return "\n\n".join("\n".join(kept[i]).strip() for i in range(len(blocks)) if any(kept[i])).strip()
+
+
+def compact_text(
+    text: str,
+    budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+    split: Optional[Callable[[str], List[Block]]] = None,
+    priority: Iterable[str] = (),
+    drop: Iterable[str] = (),
+    strip_contacts: bool = True,
+) -> str:
+    """
+    Clean `text` and, if `budget` is set, cut it to fit.
+
+    Args:
+        split: Splits the cleaned text into (section name, text) blocks; without it
+            the whole document is one block and is cut from the end.
+        priority: Section names to keep first when over budget.
+        drop: Section names that are always removed (never used by the prompt).
+    """
+    cleaned = "\n".join(clean_lines(text, strip_contacts=strip_contacts))
+    drop = set(drop)
+    if split is None:
+        blocks: List[Block] = [(None, cleaned)]
+    else:
+        blocks = [(name, body) for name, body in split(cleaned) if name not in drop]
+        if drop:
+            cleaned = "\n\n".join(body.strip() for _, body in blocks if body.strip())
+
+    if budget is None or estimate_tokens(cleaned) <= budget:
+        return cleaned
+    return fit_to_budget(blocks, budget, tuple(priority))
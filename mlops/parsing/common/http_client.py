@@ -0,0 +1,235 @@
+"""
+Shared HTTP client for the LLM providers (Groq, OpenRouter).
+
+One httpx.AsyncClient per process keeps a pool of keep-alive connections, and a
+semaphore bounds how many requests are in flight. Every request runs on a single
+background event loop, so sync callers (call_groq / call_llm) and async callers
+running on any other loop all share the same pool.
+
+Streaming responses (server-sent events) are read on the same loop and handed to
+the caller line by line; abandoning the iterator cancels the request and closes
+its connection.
+"""
+import asyncio
+import os
+import queue
+import threading
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+import httpx
+
+DEFAULT_MAX_CONNECTIONS = int(os.getenv("HIRO_LLM_MAX_CONNECTIONS", "64"))
+DEFAULT_MAX_IN_FLIGHT = int(os.getenv("HIRO_LLM_MAX_IN_FLIGHT", "32"))
+DEFAULT_TIMEOUT = float(os.getenv("HIRO_LLM_TIMEOUT", "60"))
+
+
+class AsyncLLMClient:
+    """
+    Pooled HTTP client with bounded concurrency.
+
+    Args:
+        max_connections: Size of the connection pool.
+        max_in_flight: Maximum concurrent requests; extra requests wait their turn.
+        timeout: Default request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.max_connections = max_connections
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._semaphore = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the background loop on first use (and again after a fork).
+        """
+        if self._loop is not None and self._pid == os.getpid():
+            return self._loop
+
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                self._client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                    timeout=self.timeout,
+                )
+                self._semaphore = asyncio.Semaphore(self.max_in_flight)
+                ready.set()
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run, name="llm-http-loop", daemon=True)
+            self._thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._pid = os.getpid()
+            return loop
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self._semaphore:
+            return await self._client.request(method, url, **kwargs)
+
+    async def post(
+        self,
+        url: str,
+        json: dict = None,
+        headers: dict = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """
+        POST from any event loop; the request itself runs on the shared pool.
+        """
+        loop = self._ensure_loop()
+        coro = self._request("POST", url, json=json, headers=headers, timeout=timeout or self.timeout)
+
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def post_sync(
+        self,
+        url: str,
+        json: dict = None,
+        headers: dict = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """
+        Blocking POST for the existing sync call sites.
+        """
+        loop = self._ensure_loop()
+        coro = self._request("POST", url, json=json, headers=headers, timeout=timeout or self.timeout)
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _stream_into(self, push: Callable[[str], None], url: str, **kwargs):
+        async with self._semaphore:
+            async with self._client.stream("POST", url, **kwargs) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                async for line in response.aiter_lines():
+                    push(line)
+
+    def stream_lines_sync(
+        self,
+        url: str,
+        json: dict = None,
+        headers: dict = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[str]:
+        """
+        Blocking iterator over the lines of a streamed POST response.
+        Closing the iterator early cancels the request.
+        """
+        loop = self._ensure_loop()
+        lines: queue.Queue = queue.Queue()
+        end = object()
+
+        async def produce():
+            try:
+                await self._stream_into(lines.put, url, json=json, headers=headers,
+                                        timeout=timeout or self.timeout)
+            finally:
+                lines.put(end)
+
+        future = asyncio.run_coroutine_threadsafe(produce(), loop)
+        try:
+            while True:
+                line = lines.get()
+                if line is end:
+                    break
+                yield line
+            future.result()  # re-raise HTTP and transport errors
+        finally:
+            if not future.done():
+                future.cancel()
+
+    async def stream_lines(
+        self,
+        url: str,
+        json: dict = None,
+        headers: dict = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async iterator over the lines of a streamed POST, usable from any event loop.
+        Closing the iterator early cancels the request.
+        """
+        loop = self._ensure_loop()
+        consumer = asyncio.get_running_loop()
+        lines: asyncio.Queue = asyncio.Queue()
+        end = object()
+
+        def push(item):
+            try:
+                consumer.call_soon_threadsafe(lines.put_nowait, item)
+            except RuntimeError:  # consumer loop already closed after an early exit
+                pass
+
+        async def produce():
+            try:
+                await self._stream_into(push, url, json=json, headers=headers,
+                                        timeout=timeout or self.timeout)
+            finally:
+                push(end)
+
+        future = asyncio.run_coroutine_threadsafe(produce(), loop)
+        try:
+            while True:
+                line = await lines.get()
+                if line is end:
+                    break
+                yield line
+            await asyncio.wrap_future(future)
+        finally:
+            if not future.done():
+                future.cancel()
+
+    def close(self):
+        """
+        Close pooled connections and stop the background loop.
+        """
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = None
+                return
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> AsyncLLMClient:
+    """
+    Return the process-wide client shared by every LLM call site.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = AsyncLLMClient()
+    return _default_client
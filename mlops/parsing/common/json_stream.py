@@ -0,0 +1,160 @@
+"""
+Incremental parsing of a streamed JSON object.
+
+LLM extraction responses are a single JSON object whose fields arrive in prompt
+order over a few seconds. IncrementalJSONObject is fed the text as it streams in
+and returns each top-level field the moment its value is complete, so short
+fields (name, email, skills) are usable while a long array is still generating.
+
+    parser = IncrementalJSONObject()
+    for chunk in stream:
+        for key, value in parser.feed(chunk):
+            ...
+
+Text before the opening brace (a markdown fence, a "Here is the JSON" preamble)
+is skipped. Each character is scanned once; values are decoded with json.loads
+when they close.
+"""
+import json
+from typing import Any, Dict, List, Tuple
+
+# Scanner states inside the top-level object
+_EXPECT_KEY, _IN_KEY, _EXPECT_COLON, _EXPECT_VALUE, _IN_VALUE, _AFTER_VALUE, _DONE = range(7)
+
+
+class IncrementalJSONObject:
+    """
+    Streaming reader for one top-level JSON object.
+
+    Attributes:
+        fields: Every field completed so far, in arrival order.
+        done: True once the closing brace has been read.
+    """
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._text = ""
+        self._pos = 0            # next character of _text to scan
+        self._started = False
+        self._state = _EXPECT_KEY
+        self._depth = 0          # nesting depth inside the current value
+        self._in_string = False
+        self._escape = False
+        self._key_start = 0
+        self._key = None
+        self._value_start = 0
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add streamed text; returns the (key, value) pairs completed by it.
+        """
+        if self.done or not chunk:
+            return []
+        self._text += chunk
+        completed = []
+        text = self._text
+        i = self._pos
+        n = len(text)
+
+        if not self._started:
+            i = text.find("{", i)
+            if i == -1:
+                self._pos = n
+                return []
+            self._started = True
+            i += 1
+
+        while i < n:
+            ch = text[i]
+            state = self._state
+
+            if state == _IN_VALUE or state == _IN_KEY:
+                if self._in_string:
+                    if self._escape:
+                        self._escape = False
+                    elif ch == "\\":
+                        self._escape = True
+                    elif ch == '"':
+                        self._in_string = False
+                        if state == _IN_KEY:
+                            self._key = json.loads(text[self._key_start:i + 1])
+                            self._state = _EXPECT_COLON
+                        elif self._depth == 0:
+                            completed.append(self._close_value(text, i + 1))
+                elif ch == '"':
+                    self._in_string = True
+                elif ch in "[{":
+                    self._depth += 1
+                elif ch in "]}":
+                    if self._depth == 0:
+                        # Closing brace of the top-level object ends a bare value
+                        completed.append(self._close_value(text, i))
+                        self.done = True
+                        self._state = _DONE
+                        break
+                    self._depth -= 1
+                    if self._depth == 0:
+                        completed.append(self._close_value(text, i + 1))
+                elif ch == "," and self._depth == 0:
+                    completed.append(self._close_value(text, i))
+                    self._state = _EXPECT_KEY
+                i += 1
+                continue
+
+            if ch.isspace():
+                pass
+            elif state == _EXPECT_KEY:
+                if ch == '"':
+                    self._state = _IN_KEY
+                    self._in_string = True
+                    self._key_start = i
+                elif ch == "}":
+                    self.done = True
+                    self._state = _DONE
+                    break
+            elif state == _EXPECT_COLON:
+                if ch == ":":
+                    self._state = _EXPECT_VALUE
+            elif state == _EXPECT_VALUE:
+                self._state = _IN_VALUE
+                self._value_start = i
+                self._depth = 0
+                if ch == '"':
+                    self._in_string = True
+                elif ch in "[{":
+                    self._depth = 1
+            elif state == _AFTER_VALUE:
+                if ch == ",":
+                    self._state = _EXPECT_KEY
+                elif ch == "}":
+                    self.done = True
+                    self._state = _DONE
+                    break
+            i += 1
+
+        self._pos = i
+        return [pair for pair in completed if pair is not None]
+
+    def _close_value(self, text: str, end: int):
+        """
+        Decode text[value_start:end] and record it under the pending key.
+        """
+        raw = text[self._value_start:end].strip()
+        self._state = _AFTER_VALUE
+        key, self._key = self._key, None
+        if key is None or not raw:
+            return None
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        self.fields[key] = value
+        return key, value
+
+    def result(self) -> Dict[str, Any]:
+        """
+        The fields parsed so far as a dict (the whole object once `done`).
+        """
+        return dict(self.fields)
+
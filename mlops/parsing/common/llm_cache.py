@@ -0,0 +1,262 @@
+"""
+Content-addressed cache for LLM extraction responses.
+
+Keys are a SHA-256 of (normalized document text, prompt template version, model,
+temperature), so re-uploads of the same resume or JD skip the LLM round trip.
+An in-process LRU sits in front of a SQLite store that is shared across processes
+and survives restarts. Entries expire after a TTL, and the oldest-accessed entries
+are evicted once the store grows past `max_entries`. Memory hits record their
+access time too, written to SQLite in batches, so the disk LRU keeps hot entries.
+
+Configuration (environment):
+    HIRO_LLM_CACHE=0             disable caching
+    HIRO_LLM_CACHE_PATH=<file>   SQLite file (default ~/.cache/hiro/llm_cache.sqlite3)
+    HIRO_LLM_CACHE_TTL=<secs>    entry lifetime (default 30 days)
+    HIRO_LLM_CACHE_MAX=<n>       maximum stored entries (default 100000)
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+DEFAULT_PATH = os.getenv(
+    "HIRO_LLM_CACHE_PATH", str(Path.home() / ".cache" / "hiro" / "llm_cache.sqlite3")
+)
+DEFAULT_TTL = float(os.getenv("HIRO_LLM_CACHE_TTL", str(30 * 24 * 3600)))
+DEFAULT_MAX_ENTRIES = int(os.getenv("HIRO_LLM_CACHE_MAX", "100000"))
+
+# Memory-hit access times are written to SQLite once this many are pending or
+# this many seconds have passed, and always before an eviction
+TOUCH_BATCH = 64
+TOUCH_INTERVAL = 60.0
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize unicode and whitespace so trivially different copies of a document share a key.
+    """
+    text = unicodedata.normalize("NFKC", text or "")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def make_cache_key(text: str, prompt_version: str, model: str, temperature: Optional[float]) -> str:
+    """
+    Hash of everything that determines the LLM output for a document.
+    """
+    material = json.dumps(
+        [normalize_text(text), prompt_version, model, temperature],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Two-level (memory LRU + SQLite) cache of raw LLM responses.
+
+    Args:
+        path: SQLite database file, or ":memory:".
+        memory_entries: Size of the in-process LRU.
+        max_entries: Maximum rows kept on disk before the oldest-accessed are evicted.
+        ttl: Seconds an entry stays valid.
+        clock: Time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        memory_entries: int = 1024,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._memory = OrderedDict()  # key -> (value, created_at)
+        self._touched = {}  # key -> accessed_at of memory hits not yet on disk
+        self._touched_flushed = clock()
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed_at)")
+        self._db.commit()
+        self._count = self._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def get(self, key: str) -> Optional[str]:
+        now = self.clock()
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                value, created_at = hit
+                if now - created_at < self.ttl:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    self._touch(key, now)
+                    return value
+                del self._memory[key]
+
+            row = self._db.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if now - created_at >= self.ttl:
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._db.commit()
+                self._count -= 1
+                self.misses += 1
+                return None
+
+            self._db.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._touched.pop(key, None)
+            self._db.commit()
+            self._remember(key, value, created_at)
+            self.disk_hits += 1
+            return value
+
+    def set(self, key: str, value: str):
+        now = self.clock()
+        with self._lock:
+            exists = self._db.execute("SELECT 1 FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._touched.pop(key, None)
+            if not exists:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict(now)
+            self._db.commit()
+            self._remember(key, value, now)
+
+    def get_or_call(self, key: str, fn: Callable[[], str]) -> str:
+        """
+        Return the cached value for `key`, or call `fn`, store and return its result.
+        """
+        value = self.get(key)
+        if value is None:
+            value = fn()
+            self.set(key, value)
+        return value
+
+    def stats(self) -> dict:
+        hits = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": hits / total if total else 0.0,
+            "entries": self._count,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            self._db.execute("DELETE FROM llm_cache")
+            self._db.commit()
+            self._count = 0
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._db.commit()
+        self._db.close()
+
+    def _remember(self, key: str, value: str, created_at: float):
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key: str, now: float):
+        self._touched[key] = now
+        if len(self._touched) >= TOUCH_BATCH or now - self._touched_flushed >= TOUCH_INTERVAL:
+            self._flush_touched()
+            self._db.commit()
+
+    def _flush_touched(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()],
+            )
+            self._touched.clear()
+        self._touched_flushed = self.clock()
+
+    def _evict(self, now: float):
+        """
+        Drop expired rows, then the least recently accessed rows down to 90% of capacity.
+        Evicted keys are dropped from the memory LRU too.
+        """
+        self._flush_touched()
+        cur = self._db.execute("DELETE FROM llm_cache WHERE created_at <= ?", (now - self.ttl,))
+        removed = max(cur.rowcount, 0)
+        for key in [k for k, (_, created_at) in self._memory.items() if now - created_at >= self.ttl]:
+            del self._memory[key]
+
+        self._count = self._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        excess = self._count - int(self.max_entries * 0.9)
+        if excess > 0:
+            keys = [row[0] for row in self._db.execute(
+                "SELECT key FROM llm_cache ORDER BY accessed_at LIMIT ?", (excess,)
+            )]
+            self._db.executemany("DELETE FROM llm_cache WHERE key = ?", [(key,) for key in keys])
+            for key in keys:
+                self._memory.pop(key, None)
+            removed += len(keys)
+            self._count -= len(keys)
+
+        self.evictions += removed
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[LLMResponseCache]:
+    """
+    Process-wide cache used by the parsers, or None when HIRO_LLM_CACHE=0.
+    """
+    global _default_cache
+    if os.getenv("HIRO_LLM_CACHE", "1").lower() in ("0", "false", "off"):
+        return None
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = LLMResponseCache()
+    return _default_cache
@@ -0,0 +1,132 @@
+"""
+Run the LLM extraction and the rule-based extractors side by side.
+
+The parsers' serial mode calls the LLM first and only runs the deterministic
+extractors for the fields it left empty, so a failed or slow LLM call costs its
+full latency plus the extractor time. In concurrent mode the LLM call starts on a
+shared thread pool while the extractors run on the calling thread, and the LLM
+result is awaited only until the deadline; past it the parser returns the
+fallback result. An abandoned call keeps running in the background, so its
+response still lands in the LLM cache for the next parse of the same document.
+
+arace_with_fallback is the same race for event-loop servers (ASGI): the LLM
+coroutine is awaited on the loop and only the extractors take a thread.
+
+Configuration (environment):
+    HIRO_PARSE_MODE=serial|concurrent   default orchestration (default serial)
+    HIRO_LLM_DEADLINE=<secs>            concurrent-mode wait for the LLM (default: no limit)
+    HIRO_LLM_THREADS=<n>                threads for concurrent LLM calls (default 16)
+"""
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+SERIAL = "serial"
+CONCURRENT = "concurrent"
+
+DEFAULT_MODE = os.getenv("HIRO_PARSE_MODE", SERIAL)
+DEFAULT_DEADLINE = float(os.getenv("HIRO_LLM_DEADLINE")) if os.getenv("HIRO_LLM_DEADLINE") else None
+LLM_THREADS = int(os.getenv("HIRO_LLM_THREADS", "16"))
+
+_executor = None
+_executor_pid = None
+_lock = threading.Lock()
+_background_tasks = set()  # abandoned async LLM calls, referenced until they finish
+
+
+class RaceResult(NamedTuple):
+    llm: Any            # LLM result, or None if it failed or missed the deadline
+    fallback: Any       # rule-based result (always computed)
+    timed_out: bool
+    llm_seconds: float  # time spent waiting on the LLM after the fallback finished
+
+
+def resolve_mode(mode: Optional[str]) -> str:
+    mode = mode or DEFAULT_MODE
+    if mode not in (SERIAL, CONCURRENT):
+        raise ValueError(f"Unknown parse mode: {mode!r} (expected {SERIAL!r} or {CONCURRENT!r})")
+    return mode
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        with _lock:
+            if _executor is None or _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(max_workers=LLM_THREADS, thread_name_prefix="llm-call")
+                _executor_pid = os.getpid()
+    return _executor
+
+
+def race_with_fallback(
+    llm_call: Callable[[], Any],
+    fallback_call: Callable[[], Any],
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+) -> RaceResult:
+    """
+    Start `llm_call` on the shared pool, run `fallback_call` here, then wait for the
+    LLM until `deadline` seconds after the start. Exceptions from `llm_call` count
+    as a missing result; exceptions from `fallback_call` propagate.
+    """
+    start = time.perf_counter()
+    # Copy the context so tracing spans opened by the LLM call keep their parent
+    future = _get_executor().submit(contextvars.copy_context().run, llm_call)
+
+    fallback = fallback_call()
+
+    waited_from = time.perf_counter()
+    remaining = None if deadline is None else max(0.0, deadline - (waited_from - start))
+    try:
+        llm = future.result(timeout=remaining)
+        timed_out = False
+    except FutureTimeout:
+        llm, timed_out = None, True
+    except Exception:
+        llm, timed_out = None, False
+    return RaceResult(llm, fallback, timed_out, time.perf_counter() - waited_from)
+
+
+def _keep_running(task: "asyncio.Task"):
+    def done(t):
+        _background_tasks.discard(t)
+        if not t.cancelled():
+            t.exception()  # retrieved, so asyncio does not log it as unhandled
+
+    _background_tasks.add(task)
+    task.add_done_callback(done)
+
+
+async def arace_with_fallback(
+    llm_call: Callable[[], Awaitable[Any]],
+    fallback_call: Callable[[], Any],
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+) -> RaceResult:
+    """
+    Async race_with_fallback: await the coroutine from `llm_call` while
+    `fallback_call` runs on a worker thread, then wait for the LLM until
+    `deadline` seconds after the start. A call that misses the deadline keeps
+    running on the loop.
+    """
+    start = time.perf_counter()
+    task = asyncio.ensure_future(llm_call())
+    try:
+        fallback = await asyncio.to_thread(fallback_call)
+    except BaseException:
+        _keep_running(task)
+        raise
+
+    waited_from = time.perf_counter()
+    remaining = None if deadline is None else max(0.0, deadline - (waited_from - start))
+    try:
+        llm = await asyncio.wait_for(asyncio.shield(task), remaining)
+        timed_out = False
+    except asyncio.TimeoutError:
+        _keep_running(task)
+        llm, timed_out = None, True
+    except Exception:
+        llm, timed_out = None, False
+    return RaceResult(llm, fallback, timed_out, time.perf_counter() - waited_from)
@@ -0,0 +1,79 @@
+"""
+Compiled regular expressions for the parsing extractors, built once at import.
+
+Extractors used to hand raw pattern lists to re.search / re.finditer on every
+call. Each extractor now declares a PatternSet at module level and registers it
+here under a dotted name, so the benchmarks can list and time every set.
+
+A PatternSet supports the two ways the extractors consume their alternatives:
+
+    first(text)  "try each pattern in order, take the first that matches".
+    every(text)  "collect every match of every pattern". Alternatives can
+                 declare a literal that every match must contain; they are
+                 skipped outright when the text does not contain it.
+
+Alternatives are deliberately not merged into one big alternation: with
+CPython's re, a merged pattern loses the per-pattern prefix optimisations and
+measured 1.5-3x slower than searching the precompiled patterns in priority
+order, and for every() merging would drop overlapping matches ("AWS Certified
+X" and "Certified X") that the extractors keep.
+"""
+import re
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+REGISTRY: Dict[str, "PatternSet"] = {}
+
+
+class PatternSet:
+    """
+    Named alternatives for one extractor, compiled once.
+
+    Args:
+        patterns: (name, pattern) pairs in priority order.
+        flags: re flags shared by every alternative.
+        literals: Optional {name: lowercase literal} that every match of that
+            alternative contains (case-insensitively); used by every() to skip
+            alternatives that cannot match.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, str]], flags: int = 0,
+                 literals: Optional[Dict[str, str]] = None):
+        self.names = [name for name, _ in patterns]
+        self.patterns = [pattern for _, pattern in patterns]
+        self.flags = flags
+        self.literals = literals or {}
+        self.compiled: List["re.Pattern"] = [re.compile(p, flags) for p in self.patterns]
+
+    def first(self, text: str) -> Optional[Tuple[str, "re.Match"]]:
+        """
+        (name, match) for the first alternative, in priority order, that matches anywhere.
+        """
+        for name, compiled in zip(self.names, self.compiled):
+            m = compiled.search(text)
+            if m:
+                return name, m
+        return None
+
+    def every(self, text: str) -> Iterator[Tuple[str, "re.Match"]]:
+        """
+        (name, match) for every match of every alternative, alternative by alternative.
+        """
+        folded = text.casefold() if self.literals else None
+        for name, compiled in zip(self.names, self.compiled):
+            literal = self.literals.get(name)
+            if literal is not None and literal not in folded:
+                continue
+            for m in compiled.finditer(text):
+                yield name, m
+
+
+def register(name: str, pattern_set: PatternSet) -> PatternSet:
+    REGISTRY[name] = pattern_set
+    return pattern_set
+
+
+def compiled(name: str, pattern: str, flags: int = 0) -> "re.Pattern":
+    """
+    Register a single pattern and return it compiled.
+    """
+    return register(name, PatternSet([(name.rsplit(".", 1)[-1], pattern)], flags)).compiled[0]
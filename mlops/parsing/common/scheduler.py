@@ -0,0 +1,534 @@
+"""
+Rate-limit-aware scheduling for LLM requests.
+
+Every provider call goes through the provider's LLMScheduler, which
+  - holds requests until the request-per-minute and token-per-minute buckets
+    allow them, serving waiting requests in priority order (interactive uploads
+    ahead of backfills),
+  - retries 429, 5xx and transport errors with jittered exponential backoff;
+    a Retry-After header pauses every request to that provider for that long,
+  - opens a circuit breaker after repeated failures, so callers go straight to
+    the rule-based fallback instead of queueing behind a dead endpoint.
+
+    response = get_scheduler("groq").call(lambda: client.post_sync(...), tokens=1200)
+    lines = get_scheduler("groq").stream(lambda: client.stream_lines_sync(...), tokens=1200)
+
+Priorities are set per context, so the parsers do not need a new argument:
+
+    with request_priority(BACKFILL):
+        parse_resume(text)
+
+Configuration (environment, <NAME> is the upper-cased scheduler name):
+    HIRO_<NAME>_RPM=<n>            requests per minute (default: unlimited)
+    HIRO_<NAME>_TPM=<n>            prompt + completion tokens per minute (default: unlimited)
+    HIRO_LLM_COMPLETION_TOKENS=<n> completion tokens reserved per request until the
+                                   response reports its usage (default 500)
+    HIRO_LLM_MAX_RETRIES=<n>       retries after the first attempt (default 3)
+    HIRO_LLM_BACKOFF_BASE=<secs>   first backoff step (default 0.5)
+    HIRO_LLM_BACKOFF_MAX=<secs>    backoff and Retry-After cap (default 30)
+    HIRO_LLM_BREAKER_FAILURES=<n>  consecutive failures that open the breaker (default 5)
+    HIRO_LLM_BREAKER_RESET=<secs>  how long the breaker stays open (default 30)
+"""
+import asyncio
+import contextvars
+import heapq
+import itertools
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+
+import httpx
+
+from common.compaction import estimate_tokens
+from common.tracing import record
+
+# Lower values are served first
+INTERACTIVE = 0
+BACKFILL = 10
+
+COMPLETION_TOKENS = int(os.getenv("HIRO_LLM_COMPLETION_TOKENS", "500"))
+MAX_RETRIES = int(os.getenv("HIRO_LLM_MAX_RETRIES", "3"))
+BACKOFF_BASE = float(os.getenv("HIRO_LLM_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.getenv("HIRO_LLM_BACKOFF_MAX", "30"))
+BREAKER_FAILURES = int(os.getenv("HIRO_LLM_BREAKER_FAILURES", "5"))
+BREAKER_RESET = float(os.getenv("HIRO_LLM_BREAKER_RESET", "30"))
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("hiro_llm_priority", default=INTERACTIVE)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the provider's breaker is open.
+    """
+
+
+@contextmanager
+def request_priority(priority: int):
+    """
+    Schedule LLM requests made inside the block (on this thread or task) at `priority`.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+def request_tokens(prompt: str) -> int:
+    """
+    Tokens to reserve for a request: the estimated prompt plus a completion allowance.
+    """
+    return estimate_tokens(prompt) + COMPLETION_TOKENS
+
+
+class TokenBucket:
+    """
+    Refills at `per_minute` units a minute up to `capacity` (one minute's worth
+    by default). Not thread-safe; LLMScheduler guards it.
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """
+        Seconds until `amount` is available (requests larger than the capacity
+        only wait for a full bucket).
+        """
+        self._refill(now)
+        needed = min(amount, self.capacity) - self.level
+        return 0.0 if needed <= 0 else needed / self.rate
+
+    def take(self, amount: float):
+        # May go negative for oversized requests; the debt delays later ones
+        self.level -= amount
+
+    def give_back(self, amount: float):
+        self.level = min(self.capacity, self.level + amount)
+
+
+class CircuitBreaker:
+    """
+    Opens after `failures` consecutive failures; after `reset_timeout` seconds one
+    trial request is let through (half-open), and its outcome closes or re-opens it.
+    """
+
+    def __init__(self, failures: int = BREAKER_FAILURES, reset_timeout: float = BREAKER_RESET):
+        self.failure_threshold = failures
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release(self):
+        """
+        Give back the half-open trial slot of a request that ended without an outcome.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """
+    The Retry-After header (delta seconds or an HTTP date) in seconds, if present.
+    """
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _response_tokens(response: httpx.Response) -> Optional[int]:
+    try:
+        return (response.json().get("usage") or {}).get("total_tokens") or None
+    except (ValueError, AttributeError):
+        return None
+
+
+class LLMScheduler:
+    """
+    Admission control, retries and a circuit breaker for one provider.
+
+    Args:
+        name: Provider name, used for the environment settings.
+        requests_per_minute: Request bucket rate (None for no limit).
+        tokens_per_minute: Token bucket rate (None for no limit).
+        max_retries: Retries after the first attempt.
+        backoff_base: First backoff step in seconds; doubled on every retry.
+        backoff_max: Cap for one backoff and for Retry-After.
+        breaker: CircuitBreaker shared by every request to the provider.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+
+        self._cond = threading.Condition()
+        self._waiting = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Requests waiting for admission.
+        """
+        return len(self._waiting)
+
+    # -- admission ---------------------------------------------------------
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        wait = max(0.0, self._paused_until - now)
+        if self.requests:
+            wait = max(wait, self.requests.wait_time(1, now))
+        if self.tokens:
+            wait = max(wait, self.tokens.wait_time(tokens, now))
+        return wait
+
+    def _try_admit(self, entry: tuple, tokens: int) -> Optional[float]:
+        """
+        Admit `entry` if it is first in line and the buckets allow it (returns None),
+        otherwise the seconds to wait before trying again.
+        """
+        if self._waiting[0] != entry:
+            return self.backoff_max  # woken up by notify_all when the head moves
+        wait = self._wait_time(tokens, time.monotonic())
+        if wait > 0:
+            return wait
+        heapq.heappop(self._waiting)
+        if self.requests:
+            self.requests.take(1)
+        if self.tokens:
+            self.tokens.take(tokens)
+        self._cond.notify_all()
+        return None
+
+    def _leave(self, entry: tuple):
+        if entry in self._waiting:
+            self._waiting.remove(entry)
+            heapq.heapify(self._waiting)
+            self._cond.notify_all()
+
+    def _check_breaker(self):
+        if not self.breaker.allow():
+            record(circuit_open=1)
+            raise CircuitOpenError(f"{self.name} circuit breaker is open; not sending the request")
+
+    def acquire(self, tokens: int = 0, priority: Optional[int] = None):
+        """
+        Block until a request of about `tokens` tokens may be sent. Raises
+        CircuitOpenError while the breaker is open.
+        """
+        self._check_breaker()
+        if not self.requests and not self.tokens and self._paused_until <= time.monotonic():
+            return
+        start = time.perf_counter()
+        with self._cond:
+            entry = (current_priority() if priority is None else priority, next(self._seq))
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    wait = self._try_admit(entry, tokens)
+                    if wait is None:
+                        break
+                    self._cond.wait(timeout=wait)
+            except BaseException:
+                self._leave(entry)
+                raise
+        record(queue_ms=round((time.perf_counter() - start) * 1000))
+
+    async def aacquire(self, tokens: int = 0, priority: Optional[int] = None):
+        """
+        acquire() for coroutines: waits with asyncio.sleep instead of blocking the loop.
+        """
+        self._check_breaker()
+        if not self.requests and not self.tokens and self._paused_until <= time.monotonic():
+            return
+        start = time.perf_counter()
+        with self._cond:
+            entry = (current_priority() if priority is None else priority, next(self._seq))
+            heapq.heappush(self._waiting, entry)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_admit(entry, tokens)
+                if wait is None:
+                    break
+                await asyncio.sleep(min(wait, 0.05))
+        except BaseException:
+            with self._cond:
+                self._leave(entry)
+            raise
+        record(queue_ms=round((time.perf_counter() - start) * 1000))
+
+    # -- outcomes ----------------------------------------------------------
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """
+        Seconds to wait before retry `attempt` (0-based): Retry-After when the
+        provider sent one, otherwise full-jitter exponential backoff.
+        """
+        retry_after = retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            delay = min(retry_after, self.backoff_max)
+            if response.status_code == 429:
+                # The limit is per account, so hold every request, not just this one
+                with self._cond:
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                    self._cond.notify_all()
+            return delay + random.uniform(0, 0.1 * delay)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _settle(self, response: httpx.Response, tokens: int):
+        """
+        Correct the token bucket with the usage the provider reported.
+        """
+        if self.tokens:
+            used = _response_tokens(response)
+            if used is not None:
+                with self._cond:
+                    if used > tokens:
+                        self.tokens.take(used - tokens)
+                    else:
+                        self.tokens.give_back(tokens - used)
+
+    def _outcome(self, response: Optional[httpx.Response], error: Optional[Exception]) -> bool:
+        """
+        Record a finished attempt with the breaker; True if it should be retried.
+        """
+        if error is not None:
+            self.breaker.record_failure()
+            return True
+        if response.status_code == 429:
+            # Rate limiting is not an outage: the endpoint answered
+            record(rate_limited=1)
+            self.breaker.record_success()
+            return True
+        if response.status_code in RETRY_STATUSES:
+            self.breaker.record_failure()
+            return True
+        self.breaker.record_success()
+        return False
+
+    # -- calls -------------------------------------------------------------
+
+    def call(self, send: Callable[[], httpx.Response], tokens: int = 0,
+             priority: Optional[int] = None) -> httpx.Response:
+        """
+        Send a request through the scheduler, retrying rate limits and transient
+        failures. The last response (or transport error) is returned (or raised)
+        once the retries run out, so the client's error handling still applies.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.acquire(tokens, priority)
+            response, error = None, None
+            try:
+                response = send()
+            except httpx.TransportError as e:
+                error = e
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            retry = self._outcome(response, error)
+            if not retry or attempt == self.max_retries:
+                break
+            record(retries=1)
+            time.sleep(self._backoff(attempt, response))
+
+        if error is not None:
+            raise error
+        self._settle(response, tokens)
+        return response
+
+    async def acall(self, send: Callable[[], Awaitable[httpx.Response]], tokens: int = 0,
+                    priority: Optional[int] = None) -> httpx.Response:
+        """
+        Async variant of call(); `send` returns a new awaitable on every attempt.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.aacquire(tokens, priority)
+            response, error = None, None
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                error = e
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            retry = self._outcome(response, error)
+            if not retry or attempt == self.max_retries:
+                break
+            record(retries=1)
+            await asyncio.sleep(self._backoff(attempt, response))
+
+        if error is not None:
+            raise error
+        self._settle(response, tokens)
+        return response
+
+    def _stream_error(self, error: Exception):
+        if isinstance(error, httpx.HTTPStatusError):
+            self._outcome(error.response, None)
+        elif isinstance(error, httpx.TransportError):
+            self._outcome(None, error)
+        else:
+            self.breaker.record_failure()
+
+    def stream(self, open_lines: Callable[[], Iterator[str]], tokens: int = 0,
+               priority: Optional[int] = None) -> Iterator[str]:
+        """
+        Admit a streamed request and yield the lines of `open_lines()`. The first
+        line (or an empty, successful stream) counts as a success with the breaker;
+        transport errors and error statuses are recorded as in call(). Streams are
+        not retried, since lines may already be out. Closing the iterator before
+        any line arrived gives back the half-open trial slot.
+        """
+        self.acquire(tokens, priority)
+        settled = False
+        lines = open_lines()
+        try:
+            for line in lines:
+                if not settled:
+                    self.breaker.record_success()
+                    settled = True
+                yield line
+        except Exception as e:
+            settled = True
+            self._stream_error(e)
+            raise
+        else:
+            if not settled:
+                self.breaker.record_success()
+                settled = True
+        finally:
+            lines.close()
+            if not settled:
+                self.breaker.release()
+
+    async def astream(self, open_lines: Callable[[], AsyncIterator[str]], tokens: int = 0,
+                      priority: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        Async variant of stream().
+        """
+        await self.aacquire(tokens, priority)
+        settled = False
+        lines = open_lines()
+        try:
+            async for line in lines:
+                if not settled:
+                    self.breaker.record_success()
+                    settled = True
+                yield line
+        except Exception as e:
+            settled = True
+            self._stream_error(e)
+            raise
+        else:
+            if not settled:
+                self.breaker.record_success()
+                settled = True
+        finally:
+            await lines.aclose()
+            if not settled:
+                self.breaker.release()
+
+
+_schedulers: Dict[str, LLMScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def _env_rate(name: str, kind: str) -> Optional[float]:
+    value = os.getenv(f"HIRO_{name.upper()}_{kind}")
+    return float(value) if value else None
+
+
+def get_scheduler(name: str) -> LLMScheduler:
+    """
+    The process-wide scheduler for provider `name`, configured from the environment.
+    """
+    scheduler = _schedulers.get(name)
+    if scheduler is None:
+        with _schedulers_lock:
+            scheduler = _schedulers.get(name)
+            if scheduler is None:
+                scheduler = LLMScheduler(name, _env_rate(name, "RPM"), _env_rate(name, "TPM"))
+                _schedulers[name] = scheduler
+    return scheduler
+
+
+def reset_schedulers():
+    """
+    Drop every scheduler (tests, or after changing the environment settings).
+    """
+    with _schedulers_lock:
+        _schedulers.clear()
@@ -0,0 +1,56 @@
+"""
+Server-sent events from OpenAI-compatible chat completion streams.
+
+With "stream": true the providers answer with `data: {...}` lines, each carrying
+a `choices[0].delta.content` fragment, and a final `data: [DONE]`. Usage (token
+counts) arrives on the last chunk when the provider reports it.
+"""
+import json
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Optional
+
+UsageCallback = Optional[Callable[[dict], None]]
+
+
+def _event_content(line: str, on_usage: UsageCallback):
+    """
+    Content fragment carried by one SSE line, "" for other lines, None at [DONE].
+    """
+    if not line.startswith("data:"):
+        return ""  # blank separators, comments (": keep-alive"), event/id fields
+    data = line[5:].strip()
+    if data == "[DONE]":
+        return None
+    try:
+        event = json.loads(data)
+    except json.JSONDecodeError:
+        return ""
+    if on_usage and event.get("usage"):
+        on_usage(event["usage"])
+    choices = event.get("choices") or []
+    if not choices:
+        return ""
+    return (choices[0].get("delta") or {}).get("content") or ""
+
+
+def iter_content(lines: Iterable[str], on_usage: UsageCallback = None) -> Iterator[str]:
+    """
+    Yield the assistant text fragments of a streamed completion.
+    """
+    for line in lines:
+        content = _event_content(line, on_usage)
+        if content is None:
+            return
+        if content:
+            yield content
+
+
+async def aiter_content(lines: AsyncIterable[str], on_usage: UsageCallback = None) -> AsyncIterator[str]:
+    """
+    Async variant of iter_content.
+    """
+    async for line in lines:
+        content = _event_content(line, on_usage)
+        if content is None:
+            return
+        if content:
+            yield content
@@ -0,0 +1,192 @@
+"""
+Local stand-in for an OpenAI-compatible chat completions endpoint.
+
+Used by the tests and benchmarks so the LLM clients can be exercised without
+network access or API keys:
+
+    with StubLLMServer(content='{"name": "Jane"}') as server:
+        call_groq(prompt)  # with GROQ_API_URL pointed at server.url
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # many clients connect at once
+
+
+class StubLLMServer:
+    """
+    Threaded HTTP server answering chat completion requests.
+
+    Args:
+        content: Assistant message returned for every request.
+        responder: Optional callable(payload) -> str overriding `content`.
+        delay: Seconds to sleep before answering (simulates model latency).
+        chunk_size: Characters per event when a request asks for "stream": true.
+        chunk_delay: Seconds between streamed events (simulates generation speed).
+        failures: Status codes to answer the first requests with, in order
+            (e.g. [429, 429, 503]); later requests succeed.
+        retry_after: Retry-After header value sent with 429 answers.
+    """
+
+    def __init__(
+        self,
+        content: str = "{}",
+        responder: Optional[Callable[[dict], str]] = None,
+        delay: float = 0.0,
+        chunk_size: int = 16,
+        chunk_delay: float = 0.0,
+        failures: Optional[List[int]] = None,
+        retry_after: Optional[float] = None,
+    ):
+        self.content = content
+        self.responder = responder
+        self.delay = delay
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.cancelled = 0  # streams the client closed before the last event
+        self.failures = list(failures or [])
+        self.retry_after = retry_after
+
+        self.requests = 0
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def _completion(self, payload: dict) -> dict:
+        content = self.responder(payload) if self.responder else self.content
+        return {
+            "id": f"stub-{self.requests}",
+            "object": "chat.completion",
+            "model": payload.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    def _stream_events(self, payload: dict):
+        content = self.responder(payload) if self.responder else self.content
+        base = {"id": f"stub-{self.requests}", "object": "chat.completion.chunk",
+                "model": payload.get("model", "stub")}
+        for start in range(0, len(content), self.chunk_size):
+            delta = {"content": content[start:start + self.chunk_size]}
+            yield {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+        yield {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        if (payload.get("stream_options") or {}).get("include_usage"):
+            yield {**base, "choices": [], "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}}
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+            # Headers and body go out in separate writes; without TCP_NODELAY each
+            # keep-alive response waits on the client's delayed ACK (~40 ms)
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+
+                with stub._lock:
+                    stub.requests += 1
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    failure = stub.failures.pop(0) if stub.failures else None
+                try:
+                    if failure is not None:
+                        headers = {}
+                        if failure == 429 and stub.retry_after is not None:
+                            headers["Retry-After"] = f"{stub.retry_after:g}"
+                        self._send_json(failure, {"error": {"message": f"stub failure {failure}"}}, headers)
+                        return
+                    if stub.delay:
+                        time.sleep(stub.delay)
+                    if payload.get("stream"):
+                        self._send_sse(stub._stream_events(payload))
+                    else:
+                        self._send_json(200, stub._completion(payload))
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+            def _send_json(self, status: int, body: dict, headers: dict = None):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_sse(self, events):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for i, event in enumerate(events):
+                        if i and stub.chunk_delay:
+                            time.sleep(stub.chunk_delay)
+                        self._write_chunk(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+                    self._write_chunk(b"data: [DONE]\n\n")
+                    self._write_chunk(b"")
+                except (BrokenPipeError, ConnectionResetError):
+                    with stub._lock:
+                        stub.cancelled += 1
+                    self.close_connection = True
+
+            def _write_chunk(self, data: bytes):
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubLLMServer":
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    server = StubLLMServer(content='{"status": "ok"}').start()
+    print(f"Stub LLM server listening on {server.url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,95 @@
+from common.backends import BackendRouter, LLMBackend, LocalBackend, RemoteBackend
+from common.scheduler import get_scheduler, reset_schedulers
+from common.stub_server import StubLLMServer
+
+
+class FakeBackend(LLMBackend):
+    def __init__(self, name, depth=0, up=True, slots=None):
+        self.name = self.model = name
+        self.depth = depth
+        self.up = up
+        if slots is not None:
+            self.slots = slots
+
+    def available(self):
+        return self.up
+
+    def queue_depth(self):
+        return self.depth
+
+
+def test_router_routes_by_size_queue_depth_and_availability():
+    remote, local = FakeBackend("remote"), FakeBackend("local", slots=2)
+    router = BackendRouter(remote, local, local_max_tokens=500, remote_queue_depth=4)
+
+    assert router.select(200) is local
+    assert router.select(2000) is remote
+    assert router.models() == ["remote", "local"]
+
+    local.depth = 2  # every slot busy: short documents stay remote
+    assert router.select(200) is remote
+    remote.depth = 4  # provider backed up: overflow while the local queue is short
+    assert router.select(2000) is local
+    local.depth = 4
+    assert router.select(2000) is remote
+
+    local.depth, remote.up = 0, False  # breaker open: everything local
+    assert router.select(5000) is local
+    local.up = False
+    assert router.select(200) is remote
+
+
+def test_router_policies_and_missing_local():
+    remote, local = FakeBackend("remote"), FakeBackend("local")
+    assert BackendRouter(remote, local, policy="remote").select(10) is remote
+    assert BackendRouter(remote, local, policy="local").select(10_000) is local
+    assert BackendRouter(remote, None, policy="local").select(10) is remote
+    assert BackendRouter(remote, None).models() == ["remote"]
+
+
+def test_remote_backend_unavailable_while_breaker_open():
+    reset_schedulers()
+    backend = RemoteBackend("test-remote", "m", complete=lambda prompt: prompt.upper())
+    assert backend.complete("hi") == "HI" and backend.available()
+    breaker = get_scheduler("test-remote").breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert not backend.available()
+    reset_schedulers()
+
+
+def test_local_backend_sends_openai_request_with_prompt_cache():
+    payloads = []
+
+    def responder(payload):
+        payloads.append(payload)
+        return '{"name": "Jane"}'
+
+    reset_schedulers()
+    with StubLLMServer(responder=responder) as server:
+        backend = LocalBackend(server.url, model="qwen", system="Return JSON.")
+        assert backend.complete("resume text") == '{"name": "Jane"}'
+        assert "".join(backend.stream("resume text")) == '{"name": "Jane"}'
+        assert backend.queue_depth() == 0
+
+    payload = payloads[0]
+    assert payload["model"] == "qwen" and payload["cache_prompt"] is True
+    assert payload["messages"] == [
+        {"role": "system", "content": "Return JSON."},
+        {"role": "user", "content": "resume text"},
+    ]
+    assert payloads[1]["stream"] is True
+
+
+def test_local_backend_stream_settles_the_half_open_breaker():
+    reset_schedulers()
+    breaker = get_scheduler("local").breaker
+    breaker.reset_timeout = 0.0
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.state == "half-open"
+
+    with StubLLMServer(content='{"name": "Jane"}') as server:
+        assert "".join(LocalBackend(server.url).stream("resume text")) == '{"name": "Jane"}'
+    assert breaker.state == "closed" and breaker.allow()
+    reset_schedulers()
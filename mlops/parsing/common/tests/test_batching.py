@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from common.batching import pack_batches, parse_batch_response, run_batch
+
+
+def test_pack_batches_respects_budget_size_and_long_documents():
+    docs = [("a", "x" * 400), ("b", "x" * 400), ("long", "x" * 8000), ("c", "x" * 400), ("d", "x" * 40)]
+    batches = pack_batches(docs, token_budget=220, max_docs=2, max_doc_tokens=1000)
+
+    assert [[doc_id for doc_id, _ in batch] for batch in batches] == [["long"], ["a", "b"], ["c", "d"]]
+    assert pack_batches(docs[:2], token_budget=150, max_docs=8)[0] == [docs[0]]
+
+
+def test_parse_batch_response_keeps_only_valid_unique_items():
+    response = "```json\n" + json.dumps([
+        {"id": "0", "data": {"name": "Ann"}},
+        {"id": 1, "data": {"name": "Bob"}},
+        {"id": "2", "data": {"name": "Cy"}},
+        {"id": "2", "data": {"name": "Cyrus"}},
+        {"id": "3", "data": "not an object"},
+        {"id": "9", "data": {"name": "Unknown"}},
+    ]) + "\n```"
+    results = parse_batch_response(response, ["0", "1", "2", "3"], validate=lambda d: isinstance(d, dict))
+
+    assert results == {"0": {"name": "Ann"}, "1": {"name": "Bob"}}
+    assert parse_batch_response('{"id": "0", "data": {"a": 1}}', ["0", "1"]) == {"0": {"a": 1}}
+    with pytest.raises(ValueError):
+        parse_batch_response("Sorry, I cannot help with that.", ["0"])
+
+
+def test_run_batch_falls_back_to_single_calls():
+    batch = [("0", "first"), ("1", "second"), ("2", "third")]
+    singles = []
+
+    def single(doc_id, text):
+        singles.append(doc_id)
+        return {"text": text, "single": True}
+
+    answer = json.dumps([{"id": "0", "data": {"text": "first"}}, {"id": "1", "data": {}}])
+    outcome = run_batch(batch, lambda b: answer, single, validate=bool)
+
+    assert outcome.retried == ["1", "2"] and singles == ["1", "2"]
+    assert outcome.results["0"] == {"text": "first"}
+    assert outcome.results["2"] == {"text": "third", "single": True}
+
+    def broken(_):
+        raise RuntimeError("rate limited")
+
+    assert run_batch(batch, broken, single).retried == ["0", "1", "2"]
+    assert run_batch(batch[:1], broken, single).retried == []  # one document: single call only
@@ -0,0 +1,51 @@
+from common.compaction import clean_lines, compact_text, estimate_tokens, fit_to_budget, is_contact_line
+
+
+def test_contact_lines_need_an_email_phone_or_link():
+    assert is_contact_line("jane@doe.dev | +1 415 555 0199 | linkedin.com/in/jane")
+    assert is_contact_line("Portfolio: janedoe.dev | GitHub: github.com/jdoe")
+    assert not is_contact_line("Node.js, Vue.js, Socket.io, ASP.NET")
+    assert not is_contact_line("Jan 2019 - Dec 2021")
+    assert not is_contact_line("Contact centre agent at example.com")
+
+
+def test_clean_lines_normalizes_and_drops_noise():
+    text = (
+        "Jane​ Doe\n"
+        "jane@doe.dev  |  (415) 555-0199\n\n\n"
+        "Experience\n"
+        "•  Built   billing APIs in Python\n"
+        "Page 1 of 2\n"
+        "● Built billing APIs in Python.\n"
+        "- Go\n- Go\n"
+        "References available upon request\n"
+    )
+    assert clean_lines(text) == [
+        "Jane Doe", "", "Experience", "- Built billing APIs in Python", "- Go", "- Go",
+    ]
+    assert "jane@doe.dev | (415) 555-0199" in clean_lines(text, strip_contacts=False)
+
+
+def test_fit_to_budget_keeps_priority_sections_in_document_order():
+    blocks = [
+        (None, "Jane Doe"),
+        ("projects", "Projects\n" + "\n".join(f"- project {i} " + "x" * 40 for i in range(20))),
+        ("skills", "Skills\nPython, SQL"),
+    ]
+    text = fit_to_budget(blocks, budget=60, priority=("skills", "projects"))
+
+    assert text.startswith("Jane Doe\n\nProjects\n- project 0")
+    assert text.endswith("Skills\nPython, SQL")
+    assert text.index("Projects") < text.index("Skills")
+    assert estimate_tokens(text) <= 60
+    assert "project 19" not in text
+
+
+def test_compact_text_drops_sections_and_skips_budget_when_small():
+    def split(text):
+        head, _, refs = text.partition("References\n")
+        return [(None, head), ("references", "References\n" + refs)]
+
+    text = "Jane Doe\nPython developer\nReferences\nJohn Smith, ACME"
+    assert compact_text(text, split=split, drop=("references",)) == "Jane Doe\nPython developer"
+    assert compact_text("a  b\n\n\n\nc", budget=None) == "a b\n\nc"
@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+import pytest
+
+from common.http_client import AsyncLLMClient
+from common.sse import aiter_content, iter_content
+from common.stub_server import StubLLMServer
+
+
+@pytest.fixture
+def client():
+    c = AsyncLLMClient(max_connections=64, max_in_flight=64, timeout=10)
+    yield c
+    c.close()
+
+
+def test_sync_calls_reuse_one_connection(client):
+    with StubLLMServer(content='{"status": "ok"}') as server:
+        for _ in range(20):
+            resp = client.post_sync(server.url, json={"model": "m", "messages": []})
+            assert resp.json()["choices"][0]["message"]["content"] == '{"status": "ok"}'
+
+        assert server.requests == 20
+        assert server.connections == 1
+
+
+def test_many_requests_in_flight_from_another_loop(client):
+    with StubLLMServer(delay=0.2) as server:
+        async def run():
+            return await asyncio.gather(*(client.post(server.url, json={}) for _ in range(40)))
+
+        start = time.perf_counter()
+        responses = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        assert all(r.status_code == 200 for r in responses)
+        assert server.max_in_flight > 10
+        assert elapsed < 40 * 0.2 / 4
+
+
+def test_in_flight_limit_is_enforced():
+    client = AsyncLLMClient(max_in_flight=4, timeout=10)
+    try:
+        with StubLLMServer(delay=0.05) as server:
+            async def run():
+                await asyncio.gather(*(client.post(server.url, json={}) for _ in range(20)))
+
+            asyncio.run(run())
+            assert server.requests == 20
+            assert server.max_in_flight <= 4
+    finally:
+        client.close()
+
+
+def test_streamed_completion_is_reassembled(client):
+    content = '{"name": "Jane", "skills": ["Python", "SQL"]}'
+    usage = []
+    with StubLLMServer(content=content, chunk_size=5) as server:
+        payload = {"model": "m", "stream": True, "stream_options": {"include_usage": True}}
+        fragments = list(iter_content(client.stream_lines_sync(server.url, json=payload), on_usage=usage.append))
+
+        assert "".join(fragments) == content
+        assert len(fragments) == -(-len(content) // 5)
+        assert usage and usage[0]["total_tokens"] == 0
+
+
+def test_closing_a_stream_early_cancels_the_request(client):
+    with StubLLMServer(content="x" * 100, chunk_size=1, chunk_delay=0.02) as server:
+        start = time.perf_counter()
+        lines = client.stream_lines_sync(server.url, json={"stream": True})
+        fragments = iter_content(lines)
+        assert next(fragments) == "x"
+        lines.close()
+        assert time.perf_counter() - start < 1.0
+
+        deadline = time.time() + 5
+        while server.in_flight and time.time() < deadline:
+            time.sleep(0.02)
+        assert server.in_flight == 0
+        assert server.cancelled == 1
+
+
+def test_async_stream_from_another_loop(client):
+    with StubLLMServer(content='{"a": 1}', chunk_size=2) as server:
+        async def run():
+            lines = client.stream_lines(server.url, json={"stream": True})
+            return "".join([f async for f in aiter_content(lines)])
+
+        assert asyncio.run(run()) == '{"a": 1}'
@@ -0,0 +1,47 @@
+import json
+import random
+
+from common.json_stream import IncrementalJSONObject
+
+RESUME = {
+    "name": "Jane \"JD\" Doe, PhD",
+    "email": "jane@doe.dev",
+    "years": 4.5,
+    "remote": True,
+    "manager": None,
+    "skills": ["C++", "a, b", "x]y"],
+    "experience": [{"title": "Eng {II}", "responsibilities": ["Built \\ things", "Led"]}],
+    "summary": "Line one\nLine two",
+}
+
+
+def test_fields_complete_in_order_for_any_chunking():
+    text = "Here you go:\n```json\n" + json.dumps(RESUME, indent=2) + "\n```"
+    rng = random.Random(0)
+    for _ in range(100):
+        parser = IncrementalJSONObject()
+        got, i = [], 0
+        while i < len(text):
+            step = rng.randint(1, 9)
+            got += parser.feed(text[i:i + step])
+            i += step
+        assert parser.done
+        assert got == list(RESUME.items())
+        assert parser.result() == RESUME
+
+
+def test_short_fields_surface_before_the_object_closes():
+    parser = IncrementalJSONObject()
+    assert parser.feed('{"name": "Jane", "em') == [("name", "Jane")]
+    assert parser.feed('ail": "j@x.org", "experience": [{"title": "Eng"') == [("email", "j@x.org")]
+    assert not parser.done
+    assert parser.feed("}]}") == [("experience", [{"title": "Eng"}])]
+    assert parser.done
+    assert parser.feed(', "late": 1}') == []
+
+
+def test_truncated_stream_keeps_completed_fields():
+    parser = IncrementalJSONObject()
+    parser.feed('{"name": "Jane", "skills": ["Python", "S')
+    assert parser.result() == {"name": "Jane"}
+    assert not parser.done
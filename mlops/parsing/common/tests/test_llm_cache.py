@@ -0,0 +1,96 @@
+from common.llm_cache import LLMResponseCache, make_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_key_ignores_whitespace_but_not_model_or_version():
+    key = make_cache_key("Jane Doe\n  Python  ", "resume-v1", "llama", 0.0)
+    assert key == make_cache_key("Jane Doe Python", "resume-v1", "llama", 0.0)
+    assert key != make_cache_key("Jane Doe Python", "resume-v2", "llama", 0.0)
+    assert key != make_cache_key("Jane Doe Python", "resume-v1", "other", 0.0)
+    assert key != make_cache_key("Jane Doe Python", "resume-v1", "llama", 0.7)
+
+
+def test_memory_and_disk_hits(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = LLMResponseCache(path)
+    assert cache.get("k") is None
+    cache.set("k", '{"name": "Jane"}')
+    assert cache.get("k") == '{"name": "Jane"}'
+    cache.close()
+
+    # A fresh process only has the SQLite copy
+    cache = LLMResponseCache(path)
+    assert cache.get("k") == '{"name": "Jane"}'
+    assert cache.get("k") == '{"name": "Jane"}'
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_ttl_expiry(tmp_path):
+    clock = FakeClock()
+    cache = LLMResponseCache(str(tmp_path / "c.sqlite3"), ttl=60, clock=clock)
+    cache.set("k", "v")
+    clock.now += 59
+    assert cache.get("k") == "v"
+    clock.now += 2
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_size_eviction_keeps_recently_used(tmp_path):
+    clock = FakeClock()
+    cache = LLMResponseCache(str(tmp_path / "c.sqlite3"), memory_entries=1, max_entries=10, clock=clock)
+    for i in range(10):
+        clock.now += 1
+        cache.set(f"k{i}", str(i))
+
+    clock.now += 1
+    assert cache.get("k0") == "0"  # refresh k0 on disk
+
+    clock.now += 1
+    cache.set("k10", "10")
+    assert cache.stats()["entries"] <= 10
+    assert cache.stats()["evictions"] >= 1
+    assert cache.get("k0") == "0"
+    assert cache.get("k1") is None
+
+
+def test_memory_hits_keep_entries_hot_on_disk(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "c.sqlite3")
+    cache = LLMResponseCache(path, memory_entries=20, max_entries=10, clock=clock)
+    for i in range(10):
+        clock.now += 1
+        cache.set(f"k{i}", str(i))
+
+    clock.now += 1
+    assert cache.get("k0") == "0"  # memory hit only
+
+    clock.now += 1
+    cache.set("k10", "10")
+    assert cache.get("k1") is None  # evicted from disk and from memory
+    cache.close()
+
+    cache = LLMResponseCache(path, clock=clock)
+    assert cache.get("k0") == "0"
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_get_or_call_only_calls_once(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "c.sqlite3"))
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return "response"
+
+    assert cache.get_or_call("k", fetch) == "response"
+    assert cache.get_or_call("k", fetch) == "response"
+    assert len(calls) == 1
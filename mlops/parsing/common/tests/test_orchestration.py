@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import pytest
+
+from common.orchestration import arace_with_fallback, race_with_fallback, resolve_mode
+from common.tracing import configure, span
+
+
+def slow(value, seconds):
+    def call():
+        time.sleep(seconds)
+        return value
+    return call
+
+
+def test_llm_and_fallback_overlap():
+    start = time.perf_counter()
+    result = race_with_fallback(slow({"name": "Jane"}, 0.2), slow({"name": "J."}, 0.2))
+    elapsed = time.perf_counter() - start
+
+    assert result.llm == {"name": "Jane"} and result.fallback == {"name": "J."}
+    assert not result.timed_out
+    assert elapsed < 0.35
+
+
+def test_deadline_returns_fallback_without_waiting_for_the_llm():
+    start = time.perf_counter()
+    result = race_with_fallback(slow({"name": "Jane"}, 1.0), slow({"name": "J."}, 0.05), deadline=0.2)
+    elapsed = time.perf_counter() - start
+
+    assert result.llm is None and result.timed_out
+    assert result.fallback == {"name": "J."}
+    assert 0.2 <= elapsed < 0.5
+
+
+def test_llm_errors_count_as_missing():
+    def boom():
+        raise RuntimeError("429")
+
+    result = race_with_fallback(boom, lambda: {"skills": ["Python"]})
+    assert result.llm is None and not result.timed_out
+    assert result.fallback == {"skills": ["Python"]}
+
+
+def test_async_race_awaits_llm_while_fallback_runs_on_a_thread():
+    finished = []
+
+    async def llm(seconds):
+        await asyncio.sleep(seconds)
+        finished.append(seconds)
+        return {"name": "Jane"}
+
+    async def main():
+        start = time.perf_counter()
+        both = await arace_with_fallback(lambda: llm(0.2), slow({"name": "J."}, 0.2))
+        overlap = time.perf_counter() - start
+        late = await arace_with_fallback(lambda: llm(0.5), slow({}, 0.05), deadline=0.1)
+        await asyncio.sleep(0.5)  # the abandoned call still completes
+        return both, overlap, late
+
+    both, overlap, late = asyncio.run(main())
+    assert both.llm == {"name": "Jane"} and not both.timed_out and overlap < 0.35
+    assert late.llm is None and late.timed_out
+    assert finished == [0.2, 0.5]
+
+
+def test_llm_spans_keep_their_parent(tmp_path):
+    tracer = configure(enabled=True)
+    tracer.metrics.reset()
+    seen = {}
+    try:
+        def llm_call():
+            with span("llm.groq") as inner:
+                seen["parent"] = inner.parent_id
+            return {}
+
+        with span("resume.parse") as outer:
+            race_with_fallback(llm_call, lambda: {})
+        assert seen["parent"] == outer.span_id
+    finally:
+        configure(enabled=False)
+        tracer.metrics.reset()
+
+
+def test_unknown_mode_is_rejected():
+    assert resolve_mode("concurrent") == "concurrent"
+    with pytest.raises(ValueError):
+        resolve_mode("parallel")
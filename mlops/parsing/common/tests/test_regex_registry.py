@@ -0,0 +1,26 @@
+import re
+
+from common.regex_registry import REGISTRY, PatternSet, compiled, register
+
+
+def test_first_respects_priority_not_position():
+    patterns = PatternSet([("plus", r"(\d+)\+ years"), ("plain", r"(\d+) years")], re.IGNORECASE)
+    name, match = patterns.first("2 years in QA, 5+ years overall")
+    assert (name, match.group(1)) == ("plus", "5")
+    assert patterns.first("no numbers here") is None
+
+
+def test_every_keeps_overlapping_matches_and_skips_by_literal():
+    patterns = PatternSet(
+        [("aws", r"aws certified [\w ]+"), ("certified", r"certified [\w ]+"), ("pmp", r"pmp")],
+        re.IGNORECASE,
+        literals={"aws": "aws certified", "pmp": "pmp"},
+    )
+    found = [(name, m.group(0)) for name, m in patterns.every("AWS Certified Developer")]
+    assert found == [("aws", "AWS Certified Developer"), ("certified", "Certified Developer")]
+
+
+def test_registry():
+    email = compiled("test.email", r"\S+@\S+")
+    assert REGISTRY["test.email"].compiled[0] is email
+    assert register("test.set", PatternSet([("a", "a")])) is REGISTRY["test.set"]
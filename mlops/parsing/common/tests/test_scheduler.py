@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from common.http_client import AsyncLLMClient
+from common.scheduler import (
+    BACKFILL, INTERACTIVE, CircuitBreaker, CircuitOpenError, LLMScheduler, TokenBucket, request_priority,
+)
+from common.stub_server import StubLLMServer
+
+
+@pytest.fixture
+def client():
+    c = AsyncLLMClient(max_connections=8, max_in_flight=8, timeout=10)
+    yield c
+    c.close()
+
+
+def test_retries_429_and_honors_retry_after(client):
+    scheduler = LLMScheduler("test", backoff_base=0.01)
+    with StubLLMServer(content="ok", failures=[429, 429], retry_after=0.2) as server:
+        start = time.perf_counter()
+        response = scheduler.call(lambda: client.post_sync(server.url, json={}))
+        elapsed = time.perf_counter() - start
+
+    assert response.status_code == 200 and server.requests == 3
+    assert elapsed >= 0.4  # two Retry-After pauses, not the 10 ms backoff
+    assert scheduler.breaker.state == "closed"
+
+
+def test_gives_up_and_returns_the_last_error_response(client):
+    scheduler = LLMScheduler("test", max_retries=2, backoff_base=0.01)
+    with StubLLMServer(failures=[503] * 5) as server:
+        response = scheduler.call(lambda: client.post_sync(server.url, json={}))
+
+    assert response.status_code == 503 and server.requests == 3
+
+
+def test_async_call_retries(client):
+    scheduler = LLMScheduler("test", backoff_base=0.01)
+    with StubLLMServer(content="ok", failures=[500, 429]) as server:
+        response = asyncio.run(scheduler.acall(lambda: client.post(server.url, json={})))
+
+    assert response.status_code == 200 and server.requests == 3
+
+
+def test_circuit_breaker_opens_then_lets_one_trial_through(client):
+    breaker = CircuitBreaker(failures=3, reset_timeout=0.2)
+    scheduler = LLMScheduler("test", max_retries=0, breaker=breaker)
+    with StubLLMServer(content="ok", failures=[503] * 3) as server:
+        for _ in range(3):
+            scheduler.call(lambda: client.post_sync(server.url, json={}))
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            scheduler.call(lambda: client.post_sync(server.url, json={}))
+        assert server.requests == 3  # the open breaker sent nothing
+
+        time.sleep(0.25)
+        assert breaker.state == "half-open"
+        assert scheduler.call(lambda: client.post_sync(server.url, json={})).status_code == 200
+        assert breaker.state == "closed"
+
+
+def test_token_bucket_wait_time():
+    bucket = TokenBucket(per_minute=600)  # 10 per second
+    now = bucket.updated
+    assert bucket.wait_time(600, now) == 0
+    bucket.take(600)
+    assert bucket.wait_time(5, now) == pytest.approx(0.5)
+    assert bucket.wait_time(5, now + 0.5) == pytest.approx(0.0)
+
+
+def test_interactive_requests_go_ahead_of_backfill():
+    scheduler = LLMScheduler("test", requests_per_minute=600)  # one request per 0.1 s
+    scheduler.requests.take(scheduler.requests.level)  # start empty
+    order = []
+
+    def send(tag, priority):
+        with request_priority(priority):
+            scheduler.acquire()
+        order.append(tag)
+
+    threads = [threading.Thread(target=send, args=(f"backfill-{i}", BACKFILL)) for i in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.02)
+    urgent = threading.Thread(target=send, args=("interactive", INTERACTIVE))
+    urgent.start()
+    for t in threads + [urgent]:
+        t.join(5)
+
+    assert order.index("interactive") <= 1
+    assert len(order) == 4
+
+
+def test_streamed_trial_closes_or_reopens_the_breaker(client):
+    breaker = CircuitBreaker(failures=1, reset_timeout=0.1)
+    scheduler = LLMScheduler("test", breaker=breaker)
+
+    def stream(server):
+        return scheduler.stream(lambda: client.stream_lines_sync(server.url, json={"stream": True}))
+
+    with StubLLMServer(content="streamed answer", chunk_size=4, failures=[503, 503]) as server:
+        with pytest.raises(httpx.HTTPStatusError):
+            list(stream(server))
+        assert breaker.state == "open"  # a failed stream counts toward the breaker
+
+        time.sleep(0.15)
+        with pytest.raises(httpx.HTTPStatusError):
+            list(stream(server))
+        assert breaker.state == "open"  # the failed trial re-opened it
+
+        time.sleep(0.15)
+        lines = stream(server)
+        next(lines)
+        lines.close()  # the first line settled the trial, even though the stream ended early
+        assert breaker.state == "closed"
+
+
+def test_streamed_trial_cancelled_before_the_first_line_gives_back_the_slot(client):
+    breaker = CircuitBreaker(failures=1, reset_timeout=0.1)
+    scheduler = LLMScheduler("test", breaker=breaker)
+    breaker.record_failure()
+    time.sleep(0.15)
+
+    async def cancel_trial(server):
+        lines = scheduler.astream(lambda: client.stream_lines(server.url, json={"stream": True}))
+        task = asyncio.ensure_future(lines.__anext__())
+        await asyncio.sleep(0.1)  # admitted, waiting on the slow response
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await lines.aclose()
+
+    with StubLLMServer(content="ok", delay=0.5) as server:
+        asyncio.run(cancel_trial(server))
+        assert breaker.state == "half-open"
+        scheduler.acquire()  # the next request is the trial, not blocked
@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+
+from common import tracing
+from common.tracing import NOOP_SPAN, MetricsRegistry, record, span, traced
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer = tracing.configure(enabled=True, jsonl_path=str(path))
+    tracer.metrics.reset()
+    yield tracer, path
+    tracing.configure(enabled=False, jsonl_path="")
+    tracer.metrics.reset()
+
+
+def read_spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_disabled_spans_are_shared_noops():
+    tracing.configure(enabled=False)
+    assert span("resume.llm") is NOOP_SPAN
+    with span("resume.llm") as s:
+        s.add(bytes_in=10)
+        record(prompt_tokens=5)
+
+    @traced("stage")
+    def f(x):
+        return x + 1
+
+    assert f(1) == 2
+    assert tracing.get_tracer().metrics.snapshot() == {}
+
+
+def test_nested_spans_counters_and_jsonl(tracer):
+    tracer_obj, path = tracer
+    with span("resume.parse") as outer:
+        outer.add(bytes_in=100)
+        with span("llm.groq", model="m"):
+            record(prompt_tokens=40, completion_tokens=12, cache_hits=0)
+        record(cache_misses=1)
+
+    outer_rec, inner_rec = sorted(read_spans(path), key=lambda r: r["parent_id"] is not None)
+    assert inner_rec["parent_id"] == outer_rec["span_id"]
+    assert inner_rec["trace_id"] == outer_rec["trace_id"]
+    assert inner_rec["prompt_tokens"] == 40 and inner_rec["model"] == "m"
+    assert "cache_hits" not in inner_rec  # zero counters are not recorded
+    assert outer_rec["bytes_in"] == 100 and outer_rec["cache_misses"] == 1
+
+    snap = tracer_obj.metrics.snapshot()
+    assert snap["llm.groq"]["count"] == 1
+    assert snap["llm.groq"]["completion_tokens"] == 12
+
+
+def test_errors_are_counted_and_reraised(tracer):
+    tracer_obj, path = tracer
+
+    @traced("jd.parse")
+    def boom():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        boom()
+    assert read_spans(path)[0]["error"] == "ValueError"
+    assert tracer_obj.metrics.snapshot()["jd.parse"]["errors"] == 1
+
+
+def test_async_decorator(tracer):
+    tracer_obj, _ = tracer
+
+    @traced("llm.openrouter")
+    async def call():
+        record(prompt_tokens=3)
+        return "ok"
+
+    assert asyncio.run(call()) == "ok"
+    assert tracer_obj.metrics.snapshot()["llm.openrouter"]["prompt_tokens"] == 3
+
+
+def test_prometheus_rendering():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+
+    class Done:
+        name = 'resume."llm"'
+        duration = 0.5
+        error = None
+        counters = {"prompt_tokens": 7}
+
+    registry.observe(Done)
+    text = registry.render_prometheus()
+    assert 'hiro_stage_seconds_bucket{stage="resume.\\"llm\\"",le="0.1"} 0' in text
+    assert 'hiro_stage_seconds_bucket{stage="resume.\\"llm\\"",le="1"} 1' in text
+    assert 'hiro_stage_seconds_bucket{stage="resume.\\"llm\\"",le="+Inf"} 1' in text
+    assert 'hiro_stage_seconds_count{stage="resume.\\"llm\\""} 1' in text
+    assert 'hiro_stage_prompt_tokens_total{stage="resume.\\"llm\\""} 7' in text
+    assert "# TYPE hiro_stage_errors_total counter" in text
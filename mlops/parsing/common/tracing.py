@@ -0,0 +1,396 @@
+"""
+Lightweight per-stage tracing for the resume and JD pipelines.
+
+A span times one pipeline stage and carries numeric counters (bytes in/out, LLM
+token counts, cache hits/misses). Finished spans are aggregated per stage name into
+Prometheus histograms/counters and, optionally, appended to a JSONL file for
+offline runs. Spans nest through a context variable, so a stage opened inside
+another records its parent.
+
+    with span("resume.llm") as s:
+        s.add(bytes_in=len(prompt))
+        ...
+
+    @traced("resume.fallback.skills")
+    def extract_skills(...): ...
+
+    record(prompt_tokens=812)   # add to the innermost open span
+
+Tracing is off unless enabled, and a disabled span() / record() / @traced call is a
+single flag check. Configuration (environment):
+    HIRO_TRACING=1               enable tracing
+    HIRO_TRACE_FILE=<file>       also append every finished span to this JSONL file
+"""
+import contextvars
+import functools
+import inspect
+import json
+import os
+import random
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+# Stage latency histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_current: contextvars.ContextVar = contextvars.ContextVar("hiro_span", default=None)
+
+
+def _new_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class _NoopSpan:
+    """
+    Stand-in returned while tracing is disabled; every method does nothing.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def add(self, **counters):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """
+    One timed stage. Use through span(); counters added with add() are summed per
+    stage in the metrics, attributes set with set() only go to the JSONL trace.
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "counters", "attrs",
+                 "start", "duration", "error", "detached", "_tracer", "_token", "_t0")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: dict, detached: bool = False):
+        parent = _current.get()
+        self.name = name
+        self.trace_id = parent.trace_id if parent else _new_id()
+        self.span_id = _new_id()
+        self.parent_id = parent.span_id if parent else None
+        self.counters: Dict[str, float] = {}
+        self.attrs = attrs
+        self.start = 0.0
+        self.duration = 0.0
+        self.error: Optional[str] = None
+        self.detached = detached
+        self._tracer = tracer
+        self._token = None
+        self._t0 = 0.0
+
+    def __enter__(self):
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+        if not self.detached:
+            self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self._t0
+        if self._token is not None:
+            _current.reset(self._token)
+        if exc_type is GeneratorExit:
+            self.attrs["cancelled"] = True  # a streaming consumer stopped early
+        elif exc_type is not None:
+            self.error = exc_type.__name__
+        self._tracer.finish(self)
+        return False
+
+    def add(self, **counters):
+        for key, value in counters.items():
+            if value:
+                self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.start, 6),
+            "duration_ms": round(self.duration * 1000, 3),
+            "error": self.error,
+            **self.counters,
+            **self.attrs,
+        }
+
+
+class _StageStats:
+    __slots__ = ("buckets", "count", "total", "errors", "counters")
+
+    def __init__(self, n_buckets: int):
+        self.buckets = [0] * n_buckets
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+        self.counters: Dict[str, float] = {}
+
+
+class MetricsRegistry:
+    """
+    Per-stage latency histograms and counter totals, rendered as Prometheus text.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.bucket_bounds = tuple(buckets)
+        self._stages: Dict[str, _StageStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, span: Span):
+        with self._lock:
+            stats = self._stages.get(span.name)
+            if stats is None:
+                stats = self._stages[span.name] = _StageStats(len(self.bucket_bounds))
+            idx = bisect_left(self.bucket_bounds, span.duration)
+            if idx < len(stats.buckets):
+                stats.buckets[idx] += 1
+            stats.count += 1
+            stats.total += span.duration
+            if span.error:
+                stats.errors += 1
+            for key, value in span.counters.items():
+                stats.counters[key] = stats.counters.get(key, 0) + value
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Plain-dict copy of the aggregates, keyed by stage name.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "count": s.count,
+                    "seconds": s.total,
+                    "errors": s.errors,
+                    "buckets": list(s.buckets),
+                    **s.counters,
+                }
+                for name, s in self._stages.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def render_prometheus(self, prefix: str = "hiro") -> str:
+        """
+        Prometheus text exposition (format 0.0.4) of every stage seen so far.
+        """
+        with self._lock:
+            stages = sorted(self._stages.items())
+            lines: List[str] = [
+                f"# HELP {prefix}_stage_seconds Wall time per pipeline stage.",
+                f"# TYPE {prefix}_stage_seconds histogram",
+            ]
+            for name, s in stages:
+                label = _label(name)
+                cumulative = 0
+                for bound, n in zip(self.bucket_bounds, s.buckets):
+                    cumulative += n
+                    lines.append(f'{prefix}_stage_seconds_bucket{{stage="{label}",le="{bound:g}"}} {cumulative}')
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{label}",le="+Inf"}} {s.count}')
+                lines.append(f'{prefix}_stage_seconds_sum{{stage="{label}"}} {s.total:.6f}')
+                lines.append(f'{prefix}_stage_seconds_count{{stage="{label}"}} {s.count}')
+
+            lines.append(f"# HELP {prefix}_stage_errors_total Stage runs that raised.")
+            lines.append(f"# TYPE {prefix}_stage_errors_total counter")
+            for name, s in stages:
+                lines.append(f'{prefix}_stage_errors_total{{stage="{_label(name)}"}} {s.errors}')
+
+            counter_names = sorted({key for _, s in stages for key in s.counters})
+            for key in counter_names:
+                metric = f"{prefix}_stage_{key}_total"
+                lines.append(f"# HELP {metric} Sum of {key} recorded by each stage.")
+                lines.append(f"# TYPE {metric} counter")
+                for name, s in stages:
+                    if key in s.counters:
+                        lines.append(f'{metric}{{stage="{_label(name)}"}} {s.counters[key]:g}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class JSONLExporter:
+    """
+    Appends one JSON object per finished span to a file (shared by worker processes).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                # Line-buffered append, so lines from several processes do not interleave
+                self._file = open(self.path, "a", buffering=1, encoding="utf-8")
+            self._file.write(line)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Tracer:
+    """
+    Process-wide switch plus the sinks that finished spans are sent to.
+    """
+
+    def __init__(self, enabled: bool = False, jsonl_path: Optional[str] = None):
+        self.enabled = enabled
+        self.metrics = MetricsRegistry()
+        self.exporter = JSONLExporter(jsonl_path) if jsonl_path else None
+
+    def finish(self, span: Span):
+        self.metrics.observe(span)
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+
+_tracer = Tracer(
+    enabled=os.getenv("HIRO_TRACING", "0") not in ("", "0", "false", "False"),
+    jsonl_path=os.getenv("HIRO_TRACE_FILE") or None,
+)
+
+
+def configure(enabled: Optional[bool] = None, jsonl_path: Optional[str] = None) -> Tracer:
+    """
+    Turn tracing on/off and (re)point the JSONL exporter; returns the process tracer.
+    """
+    if enabled is not None:
+        _tracer.enabled = enabled
+    if jsonl_path is not None:
+        if _tracer.exporter is not None:
+            _tracer.exporter.close()
+        _tracer.exporter = JSONLExporter(jsonl_path) if jsonl_path else None
+    return _tracer
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def is_enabled() -> bool:
+    return _tracer.enabled
+
+
+def span(name: str, **attrs):
+    """
+    Context manager timing one stage; a shared no-op object while tracing is off.
+    """
+    if not _tracer.enabled:
+        return NOOP_SPAN
+    return Span(_tracer, name, attrs)
+
+
+def detached_span(name: str, **attrs):
+    """
+    Like span(), but never becomes the current span. Use it inside generators, whose
+    body runs in the consumer's context between yields; record counters on it directly.
+    """
+    if not _tracer.enabled:
+        return NOOP_SPAN
+    return Span(_tracer, name, attrs, detached=True)
+
+
+def current_span():
+    """
+    The innermost open span, or the no-op span if there is none.
+    """
+    return _current.get() or NOOP_SPAN
+
+
+def record(**counters):
+    """
+    Add counters (e.g. prompt_tokens=..., cache_hits=1) to the innermost open span.
+    """
+    if not _tracer.enabled:
+        return
+    active = _current.get()
+    if active is not None:
+        active.add(**counters)
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator form of span(); works on sync and async functions.
+    """
+
+    def decorate(func):
+        stage = name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _tracer.enabled:
+                    return await func(*args, **kwargs)
+                with Span(_tracer, stage, {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(_tracer, stage, {}):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def render_prometheus() -> str:
+    return _tracer.metrics.render_prometheus()
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0"):
+    """
+    Serve /metrics from a daemon thread, for processes without a web server
+    (batch runs, the parse worker). Returns the HTTP server.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="hiro-metrics", daemon=True).start()
+    return server
@@ -128,6 +128,34 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Uploaded resumes
+MEDIA_URL = "media/"
+MEDIA_ROOT = os.getenv("HIRO_MEDIA_ROOT", BASE_DIR / "media")
+MAX_RESUME_UPLOAD_BYTES = 10 * 1024 * 1024
+
+# Job API response cache (posts/cache.py). Local memory is per process; set
+# HIRO_REDIS_URL (needs the redis package) when running more than one server
+# process so invalidation is shared.
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "hiro"},
+}
+if os.getenv("HIRO_REDIS_URL"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("HIRO_REDIS_URL"),
+    }
+JOB_CACHE_TIMEOUT = 300
+
+# Resume parse queue (posts/tasks.py, run workers with `manage.py parse_worker`)
+RESUME_PARSER_DIR = BASE_DIR.parent / "mlops" / "parsing" / "ResumeParse"
+RESUME_PARSE_FUNCTION = "posts.parsing.parse_resume_file"
+PARSE_TASK_MAX_ATTEMPTS = 3
+PARSE_TASK_LEASE_SECONDS = 600  # a running task older than this is assumed abandoned
+
+# Async parse endpoints (posts/async_views.py)
+RESUME_ASYNC_PARSE_FUNCTION = "posts.parsing.aparse_resume_text"
+PARSE_STATUS_MAX_WAIT = 30  # seconds a status poll may long-poll with ?wait=
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -1,3 +1,7 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Applicant, Job, ParseTask
+
+admin.site.register(Job)
+admin.site.register(Applicant)
+admin.site.register(ParseTask)
@@ -0,0 +1,168 @@
+"""
+Async views for the Job API and resume parsing, for serving under ASGI
+(`uvicorn backend.asgi:application`).
+
+A sync view holds a worker thread for its whole run, so slow status polls and
+LLM-backed requests exhaust the server's threads long before its CPU. These
+views keep the waiting on the event loop:
+  - Job list/detail GETs answer cache hits (posts/cache.py) without a thread;
+    misses and writes run the DRF views on a worker thread, so responses,
+    validation and the browsable API are unchanged.
+  - Parse status polls read the task with the async ORM and can long-poll
+    (?wait=SECONDS) by sleeping on the loop between reads.
+  - Parse triggers queue a task, or parse posted text inline, awaiting the LLM
+    client.
+
+They also work under WSGI (Django runs them per request), which is what
+`manage.py bench_wsgi_asgi` compares against.
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.utils.module_loading import import_string
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from . import cache as job_cache
+from .models import Applicant, ParseTask
+from .serializers import ParseTaskSerializer
+from .tasks import requeue_parse
+from .views import JobListCreateAPIView, JobRetrieveUpdateDestroyAPIView
+
+POLL_INTERVAL = 0.25  # seconds between reads while long-polling
+FINISHED = ('done', 'failed')
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    """
+    JSON rendered as the DRF views render it.
+    """
+    return HttpResponse(JSONRenderer().render(data), status=status_code, content_type='application/json')
+
+
+def not_found():
+    return json_response({'detail': "No ParseTask matches the given query."}, status.HTTP_404_NOT_FOUND)
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class CachedAPIView(View):
+    """
+    GET answered on the event loop from the response cache when the entry exists
+    and the client wants JSON; everything else goes to `drf_view`.
+    """
+    drf_view = None
+
+    async def cache_key(self, request, **kwargs):
+        raise NotImplementedError
+
+    async def get(self, request, *args, **kwargs):
+        if 'text/html' not in request.headers.get('Accept', ''):
+            entry = await cache.aget(await self.cache_key(request, **kwargs))
+            if entry is not None:
+                return job_cache.entry_response(request, entry)
+        return await self.delegate(request, *args, **kwargs)
+
+    async def delegate(self, request, *args, **kwargs):
+        response = await sync_to_async(self.drf_view)(request, *args, **kwargs)
+        return await sync_to_async(response.render)()
+
+    post = put = patch = delete = options = delegate
+
+
+class JobListAPIView(CachedAPIView):
+    drf_view = staticmethod(JobListCreateAPIView.as_view())
+
+    async def cache_key(self, request, **kwargs):
+        return await job_cache.alist_key(request)
+
+
+class JobDetailAPIView(CachedAPIView):
+    drf_view = staticmethod(JobRetrieveUpdateDestroyAPIView.as_view())
+
+    async def cache_key(self, request, pk):
+        return job_cache.detail_key(pk)
+
+
+async def _get_task(pk):
+    return await ParseTask.objects.select_related('applicant').aget(pk=pk)
+
+
+@require_GET
+async def parse_task_status(request, pk):
+    """
+    GET a parse task. With ?wait=SECONDS (at most PARSE_STATUS_MAX_WAIT) the
+    answer is held until the task's status, progress or stage changes, it
+    finishes, or the wait runs out.
+    """
+    try:
+        wait = min(max(float(request.GET.get('wait') or 0), 0.0), settings.PARSE_STATUS_MAX_WAIT)
+    except ValueError:
+        return json_response({'wait': ["A number of seconds is required."]}, status.HTTP_400_BAD_REQUEST)
+
+    try:
+        task = await _get_task(pk)
+    except ParseTask.DoesNotExist:
+        return not_found()
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    seen = (task.status, task.progress, task.stage)
+    while task.status not in FINISHED and loop.time() < deadline:
+        await asyncio.sleep(min(POLL_INTERVAL, deadline - loop.time()))
+        task = await _get_task(pk)
+        if (task.status, task.progress, task.stage) != seen:
+            break
+
+    return json_response(ParseTaskSerializer(task, context={'request': request}).data)
+
+
+@csrf_exempt
+@require_POST
+async def reparse_applicant(request, pk):
+    """
+    POST queues a new parse of an applicant's stored resume; answers 202 with the task id,
+    or 200 with the task already queued or running for that applicant.
+    """
+    try:
+        task, created = await sync_to_async(requeue_parse)(pk)
+    except Applicant.DoesNotExist:
+        return json_response({'detail': "No Applicant matches the given query."}, status.HTTP_404_NOT_FOUND)
+
+    return json_response(
+        {'task_id': str(task.pk), 'applicant_id': task.applicant_id, 'status': task.status},
+        status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
+    )
+
+
+@csrf_exempt
+@require_POST
+async def parse_text(request):
+    """
+    POST {"text": "...", "urls": [...]} parses resume text inline and answers
+    {"data": {...}}. The LLM request is awaited, so a slow provider costs no thread.
+    """
+    try:
+        body = json.loads(request.body or b'{}')
+    except ValueError:
+        return json_response({'detail': "JSON parse error."}, status.HTTP_400_BAD_REQUEST)
+
+    if not isinstance(body, dict):
+        body = {}
+    text, urls = body.get('text'), body.get('urls') or []
+    if not isinstance(text, str) or not text.strip():
+        return json_response({'text': ["This field is required."]}, status.HTTP_400_BAD_REQUEST)
+    if len(text.encode('utf-8')) > settings.MAX_RESUME_UPLOAD_BYTES:
+        return json_response({'text': ["Resume text is too large."]}, status.HTTP_400_BAD_REQUEST)
+    if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+        return json_response({'urls': ["A list of strings is required."]}, status.HTTP_400_BAD_REQUEST)
+
+    parse = import_string(settings.RESUME_ASYNC_PARSE_FUNCTION)
+    return json_response({'data': await parse(text, urls)})
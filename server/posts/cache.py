@@ -0,0 +1,135 @@
+"""
+Response cache for the read-heavy Job API endpoints.
+
+Job detail responses are cached per job, list pages per query string (filters,
+fields, cursor). Entries hold the response data with a weak ETag (a hash of the
+data) and a Last-Modified stamp (when the entry was built), so repeat readers
+revalidate with If-None-Match / If-Modified-Since and get a 304 without a
+database query. The async views (posts/async_views.py) serve hits on the event
+loop through entry_response().
+
+Invalidation is driven by writes (posts/signals.py and the parse worker):
+a job write or an applicant change drops that job's detail entry and moves
+the list generation, which retires every cached page at once (a write can
+move a job between any filtered pages). Invalidation runs immediately and
+again after the transaction commits, so a concurrent read cannot re-cache
+pre-commit data.
+
+The cache is Django's default cache: local memory (per process, fine for one
+server process) or Redis with HIRO_REDIS_URL. Entries expire after
+JOB_CACHE_TIMEOUT seconds regardless.
+"""
+import hashlib
+import json
+import time
+import uuid
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+KEY_PREFIX = 'posts:job'
+LIST_GENERATION_KEY = f'{KEY_PREFIX}:list-generation'
+
+
+def detail_key(pk):
+    return f'{KEY_PREFIX}:detail:{pk}'
+
+
+def _list_key(generation, request):
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    return f'{KEY_PREFIX}:list:{generation}:{hashlib.md5(query.encode()).hexdigest()}'
+
+
+def list_key(request):
+    """
+    Key for one list page: the list generation plus the normalized query string.
+    """
+    generation = cache.get(LIST_GENERATION_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        if not cache.add(LIST_GENERATION_KEY, generation, timeout=None):
+            generation = cache.get(LIST_GENERATION_KEY, generation)
+    return _list_key(generation, request)
+
+
+async def alist_key(request):
+    generation = await cache.aget(LIST_GENERATION_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        if not await cache.aadd(LIST_GENERATION_KEY, generation, timeout=None):
+            generation = await cache.aget(LIST_GENERATION_KEY, generation)
+    return _list_key(generation, request)
+
+
+def _invalidate(job_pks):
+    cache.delete_many([detail_key(pk) for pk in job_pks])
+    cache.set(LIST_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_jobs(*job_pks):
+    """
+    Drop the cached detail of these jobs and every cached list page.
+    """
+    _invalidate(job_pks)
+    transaction.on_commit(lambda: _invalidate(job_pks))
+
+
+def _not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match:
+        # Weak comparison: W/"x" matches "x"
+        wanted = {tag.removeprefix('W/') for tag in parse_etags(if_none_match)}
+        return '*' in wanted or etag.removeprefix('W/') in wanted
+    since = parse_http_date_safe(request.headers.get('If-Modified-Since') or '')
+    return since is not None and int(last_modified) <= since
+
+
+def _set_validators(response, entry):
+    response['ETag'] = entry['etag']
+    response['Last-Modified'] = http_date(entry['last_modified'])
+    response['Cache-Control'] = 'no-cache'  # always revalidate
+    return response
+
+
+def cached_response(request, key, build):
+    """
+    The cached response for `key`, or build() (a DRF Response) cached on a 200.
+    Answers 304 when the client's validators still match.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        response = build()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        body = json.dumps(response.data, cls=DjangoJSONEncoder, sort_keys=True)
+        entry = {
+            'data': response.data,
+            'etag': f'W/"{hashlib.md5(body.encode()).hexdigest()}"',
+            'last_modified': int(time.time()),
+        }
+        cache.set(key, entry, timeout=settings.JOB_CACHE_TIMEOUT)
+
+    if _not_modified(request, entry['etag'], entry['last_modified']):
+        return _set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), entry)
+    return _set_validators(Response(entry['data']), entry)
+
+
+def entry_response(request, entry):
+    """
+    A cache entry as a plain Django response, byte-for-byte what the DRF view
+    renders as JSON (for async views, which answer without DRF).
+    """
+    if _not_modified(request, entry['etag'], entry['last_modified']):
+        response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = HttpResponse(JSONRenderer().render(entry['data']), content_type='application/json')
+    response['Vary'] = 'Accept'
+    return _set_validators(response, entry)
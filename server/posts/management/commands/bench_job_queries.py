@@ -0,0 +1,123 @@
+"""
+Time the job list and dashboard queries against a large table.
+
+Run against a scratch PostgreSQL database (point DATABASES at it); --seed
+inserts synthetic rows:
+
+    python manage.py migrate
+    python manage.py bench_job_queries --seed 1000000 --applicants-per-job 2
+    python manage.py bench_job_queries --explain    # later runs reuse the rows
+
+Each query runs --repeat times after one warm-up; the table reports the median
+and worst time. --explain prints EXPLAIN ANALYZE for each query, to check that
+the planner picks the intended index.
+"""
+import statistics
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from posts import stats
+from posts.models import Job
+from posts.serializers import JobListSerializer
+
+LIST_COLUMNS = [name for name in JobListSerializer.Meta.fields if name != 'applicant_stats']
+PAGE = 20
+
+SEED_JOBS = """
+INSERT INTO posts_job (title, description, status, date, jobtype, jobtime, shift,
+                       required_skills, domain, applicants_total)
+SELECT (ARRAY['Backend Engineer', 'Data Scientist', 'Frontend Developer',
+              'DevOps Engineer', 'Product Manager'])[1 + i % 5] || ' ' || i,
+       'We are looking for an engineer to build and run '
+           || (ARRAY['payment APIs', 'data pipelines', 'design systems', 'cloud infrastructure',
+                     'search ranking', 'mobile apps', 'ML platforms'])[1 + i % 7]
+           || '. You will work with a small team, own services end to end and mentor others.',
+       (ARRAY['active', 'active', 'active', 'closed', 'paused'])[1 + (i / 7) % 5],
+       CURRENT_DATE - (i % 730),
+       (ARRAY['onsite', 'remote'])[1 + i % 2],
+       (ARRAY['full-time', 'part-time'])[1 + (i / 3) % 2],
+       NULL,
+       (ARRAY['Python, Django, PostgreSQL', 'React, TypeScript, CSS', 'Go, Kubernetes, Terraform',
+              'Python, PyTorch, SQL', 'Java, Spring, Kafka'])[1 + i % 5],
+       (ARRAY['Engineering', 'Data', 'Design', 'Operations', 'Sales', 'Marketing'])[1 + i % 6],
+       0
+FROM generate_series(1, %s) AS i
+"""
+
+SEED_APPLICANTS = """
+INSERT INTO posts_applicant (job_id, name, email, resume, status, ai_score, created_at, updated_at)
+SELECT j.id, 'Applicant ' || n, '', 'resumes/seed.txt',
+       (ARRAY['pending', 'parsed', 'parsed', 'parsed', 'failed'])[1 + (j.id + n) % 5],
+       CASE WHEN (j.id + n) % 3 = 0 THEN NULL ELSE ((j.id * 31 + n * 17) % 100) / 100.0 END,
+       now(), now()
+FROM posts_job j CROSS JOIN generate_series(1, %s) AS n
+WHERE j.id > %s
+"""
+
+
+def queries():
+    """
+    (name, callable that fetches the rows, queryset to EXPLAIN or None).
+    """
+    jobs = Job.objects.only(*LIST_COLUMNS)
+    pages = [
+        ("active jobs by date", jobs.filter(status='active').order_by('-date', '-id')[:PAGE]),
+        ("status + jobtype page", jobs.filter(status='active', jobtype='remote').order_by('-id')[:PAGE]),
+        ("domain by date", jobs.filter(domain='Data').order_by('-date')[:PAGE]),
+        ("page with applicant stats", jobs.with_applicant_stats().order_by('-id')[:PAGE]),
+        ("full-text search", jobs.search('python postgresql').order_by('-id')[:PAGE]),
+    ]
+    cases = [(name, (lambda qs=qs: list(qs.all())), qs) for name, qs in pages]
+    cases.append(("dashboard stats, live", stats.live_stats_rows, None))
+    cases.append(("dashboard stats, view", stats.stats_rows, None))
+    return cases
+
+
+class Command(BaseCommand):
+    help = "Benchmark the job list and dashboard queries (PostgreSQL; use a scratch database)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=0, metavar='JOBS',
+                            help="Insert this many synthetic jobs first.")
+        parser.add_argument('--applicants-per-job', type=int, default=2,
+                            help="Synthetic applicants per seeded job.")
+        parser.add_argument('--repeat', type=int, default=20, help="Timed runs per query.")
+        parser.add_argument('--explain', action='store_true', help="Print EXPLAIN ANALYZE per query.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("This benchmark needs PostgreSQL (the indexes and view it measures are PostgreSQL-only)")
+        if options['seed']:
+            self.seed(options['seed'], options['applicants_per_job'])
+
+        self.stdout.write(f"{Job.objects.count()} jobs")
+        self.stdout.write(f"{'query':<28} {'median ms':>10} {'max ms':>10}")
+        for name, run, queryset in queries():
+            run()  # warm-up
+            timings = []
+            for _ in range(options['repeat']):
+                start = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - start) * 1000)
+            self.stdout.write(f"{name:<28} {statistics.median(timings):>10.2f} {max(timings):>10.2f}")
+            if options['explain'] and queryset is not None:
+                self.stdout.write(queryset.explain(analyze=True))
+                self.stdout.write("")
+
+    def seed(self, jobs, applicants_per_job):
+        start = time.perf_counter()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM posts_job")
+            last_id = cursor.fetchone()[0]
+            cursor.execute(SEED_JOBS, [jobs])
+            if applicants_per_job:
+                cursor.execute(SEED_APPLICANTS, [applicants_per_job, last_id])
+        call_command('recount_applicants', stdout=self.stdout)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE posts_job")
+            cursor.execute("ANALYZE posts_applicant")
+        stats.refresh()
+        self.stdout.write(f"Seeded {jobs} jobs in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,181 @@
+"""
+Load test: the same app under a WSGI server (gunicorn) and an ASGI server
+(uvicorn), against a local stub LLM.
+
+    pip install gunicorn uvicorn
+    python manage.py bench_wsgi_asgi --concurrency 64 --duration 15 --llm-delay 0.5
+
+Each server gets the same worker count; gunicorn also gets --threads per worker.
+The parser is pointed at the stub through the local LLM backend
+(HIRO_LOCAL_LLM_URL, see mlops/parsing/common/backends.py) with the LLM cache
+off, so every inline parse waits --llm-delay seconds on the "model". Clients
+cycle through the scenarios (inline parse, parse status poll, job list) and the
+table reports requests/sec and p50/p99 latency per server and scenario.
+
+Uses the configured database; a job, an applicant and a parse task are created
+if there are none.
+"""
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.models import Applicant, Job, ParseTask
+from posts.parsing import load_stub_server
+
+RESUME_TEXT = """Jane Doe
+jane@doe.dev | github.com/janedoe
+
+Experience
+Backend Engineer, Acme (2019 - 2024)
+- Built payment APIs in Python and Django
+
+Technical Skills
+Languages: Python, SQL, Go
+"""
+
+LLM_ANSWER = json.dumps({"name": "Jane Doe", "email": "jane@doe.dev", "skills": ["Python", "SQL", "Go"]})
+
+SERVERS = {
+    'wsgi': lambda addr, opts: [
+        sys.executable, '-m', 'gunicorn', 'backend.wsgi:application', '--bind', addr,
+        '--workers', str(opts['workers']), '--threads', str(opts['threads']), '--log-level', 'warning',
+    ],
+    'asgi': lambda addr, opts: [
+        sys.executable, '-m', 'uvicorn', 'backend.asgi:application', '--host', addr.split(':')[0],
+        '--port', addr.split(':')[1], '--workers', str(opts['workers']), '--log-level', 'warning',
+    ],
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class Command(BaseCommand):
+    help = "Compare requests/sec and p99 latency of the API under WSGI and ASGI with a stub LLM."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--servers', default='wsgi,asgi', help="Comma-separated: wsgi, asgi.")
+        parser.add_argument('--scenarios', default='parse,status,jobs',
+                            help="Comma-separated: parse (inline LLM parse), status (task poll), jobs (job list).")
+        parser.add_argument('--concurrency', type=int, default=64, help="Concurrent clients.")
+        parser.add_argument('--duration', type=float, default=15.0, help="Seconds of load per server.")
+        parser.add_argument('--workers', type=int, default=2, help="Server worker processes.")
+        parser.add_argument('--threads', type=int, default=4, help="Threads per gunicorn worker.")
+        parser.add_argument('--llm-delay', type=float, default=0.5, help="Stub LLM latency in seconds.")
+
+    def handle(self, *args, **options):
+        servers = [name.strip() for name in options['servers'].split(',') if name.strip()]
+        scenarios = [name.strip() for name in options['scenarios'].split(',') if name.strip()]
+        unknown = set(servers) - set(SERVERS)
+        if unknown:
+            raise CommandError(f"Unknown server(s): {', '.join(sorted(unknown))}")
+
+        task = self.fixture_task()
+        requests = {
+            'parse': ('POST', '/api/parse/', {'text': RESUME_TEXT, 'urls': []}),
+            'status': ('GET', f'/api/parse-tasks/{task.pk}/', None),
+            'jobs': ('GET', '/api/jobs/', None),
+        }
+        missing = set(scenarios) - set(requests)
+        if missing:
+            raise CommandError(f"Unknown scenario(s): {', '.join(sorted(missing))}")
+
+        StubLLMServer = load_stub_server()
+        with StubLLMServer(content=LLM_ANSWER, delay=options['llm_delay']) as llm:
+            self.stdout.write(f"{'server':<6} {'scenario':<8} {'requests':>9} {'errors':>7} "
+                              f"{'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+            for server in servers:
+                results = self.run_server(server, llm.url, [requests[name] for name in scenarios], options)
+                for name, (latencies, errors) in zip(scenarios, results):
+                    rps = len(latencies) / options['duration']
+                    p50 = percentile(latencies, 0.50) * 1000 if latencies else float('nan')
+                    p99 = percentile(latencies, 0.99) * 1000 if latencies else float('nan')
+                    self.stdout.write(f"{server:<6} {name:<8} {len(latencies):>9} {errors:>7} "
+                                      f"{rps:>9.1f} {p50:>9.1f} {p99:>9.1f}")
+
+    def fixture_task(self):
+        job = Job.objects.order_by('id').first() or Job.objects.create(
+            title="Load test", description="Load test job", jobtype='remote', jobtime='full-time',
+            required_skills="Python",
+        )
+        applicant = job.applicants.first() or Applicant.objects.create(job=job, resume='resumes/loadtest.txt')
+        return applicant.parse_tasks.first() or ParseTask.objects.create(applicant=applicant, status='done')
+
+    def run_server(self, server, llm_url, requests, options):
+        addr = f"127.0.0.1:{free_port()}"
+        env = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'backend.settings'),
+            HIRO_LOCAL_LLM_URL=llm_url,
+            HIRO_LLM_BACKEND='local',
+            HIRO_LLM_CACHE='0',
+        )
+        process = subprocess.Popen(SERVERS[server](addr, options), cwd=settings.BASE_DIR, env=env)
+        try:
+            self.wait_until_up(f"http://{addr}", process)
+            return asyncio.run(self.load(f"http://{addr}", requests, options))
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def wait_until_up(self, base, process, timeout=30.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError(f"Server exited with status {process.returncode} (is it installed?)")
+            try:
+                httpx.get(f"{base}/api/jobs/", timeout=1.0)
+                return
+            except httpx.TransportError:
+                time.sleep(0.2)
+        raise CommandError(f"Server at {base} did not start within {timeout}s")
+
+    async def load(self, base, requests, options):
+        """
+        `concurrency` clients, each cycling through `requests` until the duration is up.
+        Returns (latencies, errors) per request.
+        """
+        latencies = [[] for _ in requests]
+        errors = [0] * len(requests)
+        stop_at = time.perf_counter() + options['duration']
+        limits = httpx.Limits(max_connections=options['concurrency'])
+
+        async with httpx.AsyncClient(base_url=base, limits=limits, timeout=60.0) as client:
+            async def worker(offset):
+                i = offset
+                while time.perf_counter() < stop_at:
+                    index = i % len(requests)
+                    method, path, body = requests[index]
+                    start = time.perf_counter()
+                    try:
+                        response = await client.request(method, path, json=body)
+                        ok = response.status_code < 400
+                    except httpx.HTTPError:
+                        ok = False
+                    if ok:
+                        latencies[index].append(time.perf_counter() - start)
+                    else:
+                        errors[index] += 1
+                    i += 1
+
+            await asyncio.gather(*(worker(n) for n in range(options['concurrency'])))
+        return list(zip(latencies, errors))
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from posts.parsing import load_tracing
+from posts.tasks import claim_next_task, run_task
+
+
+class Command(BaseCommand):
+    help = "Run queued resume parse tasks (run several for more throughput)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Exit when the queue is empty.")
+        parser.add_argument('--poll-interval', type=float, default=2.0,
+                            help="Seconds to sleep when there is nothing to do.")
+        parser.add_argument('--metrics-port', type=int, default=None,
+                            help="Serve this worker's /metrics on the port (enables tracing).")
+
+    def handle(self, *args, **options):
+        if options['metrics_port']:
+            tracing = load_tracing()
+            tracing.configure(enabled=True)
+            tracing.start_metrics_server(options['metrics_port'])
+        self.stdout.write("Resume parse worker started")
+        try:
+            while True:
+                task = claim_next_task()
+                if task is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+                ok = run_task(task)
+                self.stdout.write(f"{task.pk}: {'done' if ok else 'failed'}")
+        except KeyboardInterrupt:
+            pass
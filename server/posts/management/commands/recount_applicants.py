@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from posts.models import Applicant, Job
+
+
+class Command(BaseCommand):
+    help = "Rebuild Job.applicants_total from the applicants table (after bulk imports or deletes)."
+
+    def handle(self, *args, **options):
+        counts = (
+            Applicant.objects.filter(job=OuterRef('pk'))
+            .order_by()
+            .values('job')
+            .annotate(n=Count('pk'))
+            .values('n')
+        )
+        updated = Job.objects.update(applicants_total=Coalesce(Subquery(counts), 0))
+        self.stdout.write(f"Recounted applicants for {updated} jobs")
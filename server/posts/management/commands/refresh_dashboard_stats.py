@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from posts import stats
+
+
+class Command(BaseCommand):
+    help = "Refresh the dashboard stats materialized view (PostgreSQL)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--every', type=float, default=None, metavar='SECONDS',
+                            help="Keep running and refresh on this interval.")
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                start = time.perf_counter()
+                if not stats.refresh():
+                    self.stdout.write("No materialized view on this database; stats are computed live")
+                    return
+                self.stdout.write(f"Refreshed {stats.STATS_VIEW} in {time.perf_counter() - start:.2f}s")
+                if options['every'] is None:
+                    return
+                time.sleep(options['every'])
+        except KeyboardInterrupt:
+            pass
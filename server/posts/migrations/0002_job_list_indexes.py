@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', '-id'], name='posts_job_status_fc689e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['jobtype', '-id'], name='posts_job_jobtype_b3cfe1_idx'),
+        ),
+    ]
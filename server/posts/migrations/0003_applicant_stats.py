@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:03
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_existing_applicants(apps, schema_editor):
+    Applicant = apps.get_model('posts', 'Applicant')
+    Job = apps.get_model('posts', 'Job')
+    counts = (
+        Applicant.objects.filter(job=OuterRef('pk'))
+        .order_by()
+        .values('job')
+        .annotate(n=Count('pk'))
+        .values('n')
+    )
+    Job.objects.update(applicants_total=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0002_job_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicant',
+            name='ai_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applicants_total',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_existing_applicants, migrations.RunPython.noop),
+    ]
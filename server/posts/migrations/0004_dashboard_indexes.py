@@ -0,0 +1,74 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:04
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+# PostgreSQL-only objects: the full-text index behind JobQuerySet.search() and the
+# dashboard stats materialized view (read by posts/stats.py, refreshed by
+# `manage.py refresh_dashboard_stats`). Other databases skip them.
+SEARCH_INDEX = GinIndex(
+    SearchVector('title', 'description', 'required_skills', config='english'),
+    name='posts_job_search_gin',
+)
+
+CREATE_STATS_VIEW = """
+CREATE MATERIALIZED VIEW posts_dashboard_stats AS
+SELECT j.status,
+       j.jobtype,
+       COUNT(*) AS jobs,
+       COUNT(*) FILTER (WHERE j.date >= CURRENT_DATE - 30) AS jobs_last_30_days,
+       COALESCE(SUM(a.applicants), 0) AS applicants,
+       COALESCE(SUM(a.parsed), 0) AS parsed_applicants,
+       COALESCE(SUM(a.scored), 0) AS scored_applicants,
+       SUM(a.score_sum) / NULLIF(SUM(a.scored), 0) AS avg_ai_score
+FROM posts_job j
+LEFT JOIN (
+    SELECT job_id,
+           COUNT(*) AS applicants,
+           COUNT(*) FILTER (WHERE status = 'parsed') AS parsed,
+           COUNT(ai_score) AS scored,
+           SUM(ai_score) AS score_sum
+    FROM posts_applicant
+    GROUP BY job_id
+) a ON a.job_id = j.id
+GROUP BY j.status, j.jobtype;
+CREATE UNIQUE INDEX posts_dashboard_stats_key ON posts_dashboard_stats (status, jobtype);
+"""
+
+
+def create_postgres_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('posts', 'Job'), SEARCH_INDEX)
+    schema_editor.execute(CREATE_STATS_VIEW)
+
+
+def drop_postgres_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP MATERIALIZED VIEW IF EXISTS posts_dashboard_stats")
+    schema_editor.remove_index(apps.get_model('posts', 'Job'), SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0003_applicant_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'jobtype', '-id'], name='posts_job_status_45aad6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['domain', '-date'], name='posts_job_domain_a9123a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['-date', '-id'], name='posts_job_active_date_idx'),
+        ),
+        migrations.RunPython(create_postgres_objects, drop_postgres_objects),
+    ]
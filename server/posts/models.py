@@ -1,4 +1,18 @@
-from django.db import models
+import uuid
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connections, models
+
+# Text search configuration of the job search GIN index (migration 0004)
+SEARCH_CONFIG = 'english'
+
+
+def job_search_vector():
+    """
+    The tsvector expression the GIN index is built on; queries must use exactly
+    this expression for PostgreSQL to use the index.
+    """
+    return SearchVector('title', 'description', 'required_skills', config=SEARCH_CONFIG)
 
 
 
@@ -12,6 +26,39 @@ from django.db import models
 
 # /job/<id>/delete/ → Delete
 
+class JobQuerySet(models.QuerySet):
+    def search(self, terms):
+        """
+        Jobs whose title, description or required skills match `terms` (web search
+        syntax: words, "quoted phrases", -excluded). Uses the full-text GIN index on
+        PostgreSQL; other databases fall back to a substring match on every word.
+        """
+        if connections[self.db].vendor != 'postgresql':
+            match = models.Q()
+            for word in terms.split():
+                match &= (models.Q(title__icontains=word) | models.Q(description__icontains=word)
+                          | models.Q(required_skills__icontains=word))
+            return self.filter(match)
+        return self.alias(search_vector=job_search_vector()).filter(
+            search_vector=SearchQuery(terms, config=SEARCH_CONFIG, search_type='websearch')
+        )
+
+    def with_applicant_stats(self):
+        """
+        Annotate each job with its applicant count, per-status counts and average
+        AI score, computed in the same query as the jobs (one LEFT JOIN + GROUP BY).
+        """
+        counts = {
+            f'applicants_{status}': models.Count('applicants', filter=models.Q(applicants__status=status))
+            for status, _ in Applicant.STATUS_CHOICES
+        }
+        return self.annotate(
+            applicant_count=models.Count('applicants'),
+            avg_ai_score=models.Avg('applicants__ai_score'),
+            **counts,
+        )
+
+
 class Job(models.Model):
     STATUS_CHOICES = [
         ('active', 'Active'),
@@ -36,9 +83,96 @@ class Job(models.Model):
     shift = models.CharField(max_length=50, blank=True, null=True)
     required_skills = models.TextField()
     domain = models.CharField(max_length=100, blank=True, null=True)
+    # Denormalized applicant count, kept current by posts/signals.py
+    applicants_total = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = JobQuerySet.as_manager()
+
+    class Meta:
+        # The job list API filters on these and pages by descending id; the
+        # dashboard lists active jobs and jobs per domain newest first. The
+        # full-text GIN index is PostgreSQL-only and lives in migration 0004.
+        indexes = [
+            models.Index(fields=['status', '-id']),
+            models.Index(fields=['jobtype', '-id']),
+            models.Index(fields=['status', 'jobtype', '-id']),
+            models.Index(fields=['domain', '-date']),
+            models.Index(fields=['-date', '-id'], condition=models.Q(status='active'), name='posts_job_active_date_idx'),
+        ]
 
     def total_applicants(self):
-        return self.applicants.count()
+        """
+        Applicant count without a query: the with_applicant_stats() annotation
+        when present, else the denormalized counter.
+        """
+        count = getattr(self, 'applicant_count', None)
+        return self.applicants_total if count is None else count
+
+    def applicant_stats(self):
+        """
+        {"total", "pending", "parsing", "parsed", "failed", "avg_ai_score"} from the
+        with_applicant_stats() annotations, or None on a job loaded without them.
+        """
+        if not hasattr(self, 'applicant_count'):
+            return None
+        stats = {'total': self.applicant_count}
+        for status, _ in Applicant.STATUS_CHOICES:
+            stats[status] = getattr(self, f'applicants_{status}')
+        stats['avg_ai_score'] = self.avg_ai_score
+        return stats
 
     def __str__(self):
         return self.title
+
+
+class Applicant(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('parsing', 'Parsing'),
+        ('parsed', 'Parsed'),
+        ('failed', 'Failed'),
+    ]
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applicants')
+    name = models.CharField(max_length=200, blank=True)
+    email = models.EmailField(blank=True)
+    resume = models.FileField(upload_to='resumes/%Y/%m/')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    parsed_data = models.JSONField(blank=True, null=True)
+    # Job match score from mlops/matching (0-1); null until the applicant is scored
+    ai_score = models.FloatField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.name or self.resume.name
+
+
+class ParseTask(models.Model):
+    """
+    One row per queued resume parse. The table is the queue: workers claim rows
+    with SELECT ... FOR UPDATE SKIP LOCKED (see posts/tasks.py).
+    """
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    applicant = models.ForeignKey(Applicant, on_delete=models.CASCADE, related_name='parse_tasks')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    progress = models.PositiveSmallIntegerField(default=0)
+    stage = models.CharField(max_length=50, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'created_at'])]
+
+    def __str__(self):
+        return f"{self.applicant} ({self.status})"
@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class JobCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the job id: each page is an index range scan
+    (WHERE id < cursor ORDER BY id DESC LIMIT n), so page N costs the same as
+    page 1 and rows inserted meanwhile never shift a page.
+    """
+    ordering = '-id'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,76 @@
+"""
+Bridge from the Django server to the resume parser in mlops/parsing/ResumeParse.
+
+The parser is a script-style package (its modules import each other as
+top-level names), so its directory is put on sys.path the first time a
+worker parses a resume. The web process loads the shared tracing module (for
+/metrics), and the parser only when the inline parse endpoint is used.
+"""
+import sys
+
+
+def _add_parser_paths():
+    from django.conf import settings
+
+    # ResumeParse for the parser modules, its parent for the shared `common` package
+    for path in (str(settings.RESUME_PARSER_DIR), str(settings.RESUME_PARSER_DIR.parent)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def load_tracing():
+    """
+    The parsers' tracing module (common.tracing), whose spans feed /metrics.
+    """
+    _add_parser_paths()
+    from common import tracing
+    return tracing
+
+
+def _load_parser():
+    _add_parser_paths()
+    from resume_parser import parse_resume
+    from text.extract import extract_text
+    return extract_text, parse_resume
+
+
+def load_stub_server():
+    """
+    The parsers' stub LLM server class (common.stub_server), for load tests.
+    """
+    _add_parser_paths()
+    from common.stub_server import StubLLMServer
+    return StubLLMServer
+
+
+def parse_resume_file(path, progress=None):
+    """
+    Extract text from the uploaded file and run parse_resume on it.
+
+    Args:
+        path: Path to the stored resume file.
+        progress: Optional callable(percent, stage) for status reporting.
+    """
+    report = progress or (lambda percent, stage: None)
+    extract_text, parse_resume = _load_parser()
+
+    report(10, 'extracting')
+    text, urls = extract_text(path)
+    if not text:
+        raise ValueError("No text could be extracted from the resume")
+
+    report(40, 'parsing')
+    data = parse_resume(text, urls)
+
+    report(90, 'saving')
+    return data
+
+
+async def aparse_resume_text(text, urls=None):
+    """
+    Parse already-extracted resume text without blocking the event loop: the LLM
+    request is awaited and the rule-based extractors run on a worker thread.
+    """
+    _add_parser_paths()
+    from resume_parser import aparse_resume
+    return await aparse_resume(text, urls or [])
@@ -1,7 +1,64 @@
+import os
+
+from django.conf import settings
 from rest_framework import serializers
-from .models import Job
+from .models import Applicant, Job, ParseTask
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.odt', '.txt')
+
+class ProjectedFieldsMixin:
+    """
+    Keeps only the fields named in the `fields` context entry, when present.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        wanted = self.context.get('fields')
+        if wanted:
+            for name in set(self.fields) - set(wanted):
+                self.fields.pop(name)
+
+
+class JobSerializer(ProjectedFieldsMixin, serializers.ModelSerializer):
+    # Only filled in on querysets built with Job.objects.with_applicant_stats()
+    applicant_stats = serializers.ReadOnlyField()
 
-class JobSerializer(serializers.ModelSerializer):
     class Meta:
         model = Job
         fields = '__all__'
+
+
+class JobListSerializer(serializers.ModelSerializer):
+    """
+    Job list rows without the large text columns (description, required_skills).
+    """
+    applicant_stats = serializers.ReadOnlyField()
+
+    class Meta:
+        model = Job
+        fields = ['id', 'title', 'status', 'date', 'jobtype', 'jobtime', 'shift', 'domain', 'applicant_stats']
+
+
+class ApplicantSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Applicant
+        fields = ['id', 'job', 'name', 'email', 'resume', 'status', 'parsed_data', 'ai_score',
+                  'created_at', 'updated_at']
+        read_only_fields = ['job', 'status', 'parsed_data', 'ai_score', 'created_at', 'updated_at']
+
+    def validate_resume(self, value):
+        ext = os.path.splitext(value.name)[1].lower()
+        if ext not in RESUME_EXTENSIONS:
+            raise serializers.ValidationError(f"Unsupported file type '{ext}'.")
+        if value.size > settings.MAX_RESUME_UPLOAD_BYTES:
+            raise serializers.ValidationError("Resume file is too large.")
+        return value
+
+
+class ParseTaskSerializer(serializers.ModelSerializer):
+    applicant = ApplicantSerializer(read_only=True)
+
+    class Meta:
+        model = ParseTask
+        fields = ['id', 'status', 'progress', 'stage', 'attempts', 'error',
+                  'created_at', 'started_at', 'finished_at', 'applicant']
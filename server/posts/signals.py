@@ -0,0 +1,39 @@
+"""
+Keeps Job.applicants_total in step with the applicants table, and drops cached
+Job API responses (posts/cache.py) when a job or its applicants change.
+
+Each insert or delete of an Applicant adjusts the counter with an atomic
+UPDATE ... SET applicants_total = applicants_total +/- 1, so concurrent uploads
+never lose an increment. QuerySet.update() and bulk_create() skip these signals;
+run `manage.py recount_applicants` after bulk changes.
+"""
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_jobs
+from .models import Applicant, Job
+
+
+@receiver(post_save, sender=Applicant)
+def applicant_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        Job.objects.filter(pk=instance.job_id).update(applicants_total=F('applicants_total') + 1)
+    invalidate_jobs(instance.job_id)
+
+
+@receiver(post_delete, sender=Applicant)
+def applicant_deleted(sender, instance, **kwargs):
+    Job.objects.filter(pk=instance.job_id, applicants_total__gt=0).update(
+        applicants_total=F('applicants_total') - 1
+    )
+    invalidate_jobs(instance.job_id)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def job_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_jobs(instance.pk)
@@ -0,0 +1,96 @@
+"""
+Recruiter dashboard stats cards.
+
+On PostgreSQL the numbers come from the posts_dashboard_stats materialized view
+(migration 0004): one pre-aggregated row per (job status, job type), so the
+dashboard reads a handful of rows instead of scanning every job and applicant.
+The view is as fresh as its last refresh; run
+
+    python manage.py refresh_dashboard_stats --every 300
+
+(or the same command without --every from cron). Other databases compute the
+same rows live.
+"""
+from datetime import timedelta
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Avg, Count, Q
+from django.utils import timezone
+
+from .models import Job
+
+STATS_VIEW = 'posts_dashboard_stats'
+COLUMNS = ('status', 'jobtype', 'jobs', 'jobs_last_30_days', 'applicants',
+           'parsed_applicants', 'scored_applicants', 'avg_ai_score')
+RECENT_DAYS = 30
+
+
+def uses_materialized_view(using=DEFAULT_DB_ALIAS):
+    return connections[using].vendor == 'postgresql'
+
+
+def refresh(using=DEFAULT_DB_ALIAS):
+    """
+    Recompute the materialized view without blocking readers (CONCURRENTLY, which
+    the view's unique index allows). Returns False when there is no view.
+    """
+    if not uses_materialized_view(using):
+        return False
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {STATS_VIEW}")
+    return True
+
+
+def live_stats_rows(using=DEFAULT_DB_ALIAS):
+    """
+    The view's rows computed from the tables (what a refresh would store).
+    """
+    recent = timezone.localdate() - timedelta(days=RECENT_DAYS)
+    rows = (
+        Job.objects.using(using)
+        .values('status', 'jobtype')
+        .annotate(
+            jobs=Count('id', distinct=True),
+            jobs_last_30_days=Count('id', distinct=True, filter=Q(date__gte=recent)),
+            parsed_applicants=Count('applicants', filter=Q(applicants__status='parsed')),
+            scored_applicants=Count('applicants__ai_score'),
+            avg_ai_score=Avg('applicants__ai_score'),
+        )
+        # Last: once annotated, "applicants" names the count instead of the relation
+        .annotate(applicants=Count('applicants'))
+        .order_by('status', 'jobtype')
+    )
+    return list(rows)
+
+
+def stats_rows(using=DEFAULT_DB_ALIAS):
+    """
+    One dict per (status, jobtype) with the COLUMNS keys.
+    """
+    if not uses_materialized_view(using):
+        return live_stats_rows(using)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(COLUMNS)} FROM {STATS_VIEW} ORDER BY status, jobtype")
+        return [dict(zip(COLUMNS, row)) for row in cursor.fetchall()]
+
+
+def dashboard_stats(using=DEFAULT_DB_ALIAS):
+    """
+    {"totals": {...}, "by_status": {...}, "by_jobtype": {...}} for the stats cards.
+    """
+    rows = stats_rows(using)
+    counters = ('jobs', 'jobs_last_30_days', 'applicants', 'parsed_applicants')
+
+    def total(selected):
+        out = {name: sum(int(row[name]) for row in selected) for name in counters}
+        scored = sum(int(row['scored_applicants']) for row in selected)
+        score_sum = sum(float(row['avg_ai_score']) * int(row['scored_applicants'])
+                        for row in selected if row['avg_ai_score'] is not None)
+        out['avg_ai_score'] = round(score_sum / scored, 4) if scored else None
+        return out
+
+    def group(key):
+        return {value: total([row for row in rows if row[key] == value])
+                for value in sorted({row[key] for row in rows})}
+
+    return {'totals': total(rows), 'by_status': group('status'), 'by_jobtype': group('jobtype')}
@@ -0,0 +1,162 @@
+"""
+Database-backed queue for resume parsing.
+
+The upload API calls enqueue_parse() and returns straight away; one or more
+`python manage.py parse_worker` processes claim queued rows and run the parser.
+Claims use SELECT ... FOR UPDATE SKIP LOCKED, so workers never block on or
+double-process each other's rows, and a row whose worker died mid-parse is
+picked up again once its lease expires (or marked failed, with its applicant,
+if that was its last attempt).
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .cache import invalidate_jobs
+from .models import Applicant, ParseTask
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_parse(applicant):
+    """
+    Queue a parse for `applicant`. Workers only see the row once the
+    surrounding transaction commits.
+    """
+    return ParseTask.objects.create(applicant=applicant)
+
+
+def requeue_parse(applicant_pk):
+    """
+    Queue a new parse of an applicant's stored resume, unless one is already queued
+    or running. Returns (task, created); raises Applicant.DoesNotExist.
+    """
+    with transaction.atomic():
+        # The row lock serializes concurrent re-parse requests for one applicant
+        applicant = Applicant.objects.select_for_update().get(pk=applicant_pk)
+        active = (
+            applicant.parse_tasks
+            .filter(status__in=('queued', 'running'))
+            .order_by('-created_at')
+            .first()
+        )
+        if active is not None:
+            return active, False
+        Applicant.objects.filter(pk=applicant.pk).update(status='pending')
+        task = enqueue_parse(applicant)
+        invalidate_jobs(applicant.job_id)
+    return task, True
+
+
+def claim_next_task():
+    """
+    Atomically mark the oldest runnable task as running and return it (None if idle).
+    """
+    lease_expired = timezone.now() - timedelta(seconds=settings.PARSE_TASK_LEASE_SECONDS)
+    with transaction.atomic():
+        fail_exhausted_tasks(lease_expired)
+        task = (
+            ParseTask.objects
+            .select_for_update(skip_locked=True)
+            .filter(Q(status='queued') | Q(status='running', started_at__lt=lease_expired))
+            .filter(attempts__lt=settings.PARSE_TASK_MAX_ATTEMPTS)
+            .order_by('created_at')
+            .first()
+        )
+        if task is None:
+            return None
+        task.status = 'running'
+        task.stage = 'claimed'
+        task.started_at = timezone.now()
+        task.attempts = F('attempts') + 1
+        task.save(update_fields=['status', 'stage', 'started_at', 'attempts'])
+    task.refresh_from_db(fields=['attempts'])
+    return task
+
+
+def fail_exhausted_tasks(lease_expired):
+    """
+    Mark running tasks whose lease expired on their last attempt as failed, with
+    their applicants; no worker will claim them again.
+    """
+    exhausted = list(
+        ParseTask.objects
+        .select_for_update(skip_locked=True)
+        .filter(status='running', started_at__lt=lease_expired,
+                attempts__gte=settings.PARSE_TASK_MAX_ATTEMPTS)
+        .values_list('pk', 'applicant_id')
+    )
+    if not exhausted:
+        return
+    task_pks, applicant_pks = zip(*exhausted)
+    logger.warning("Parse tasks %s lost their worker on the last attempt", ", ".join(map(str, task_pks)))
+    ParseTask.objects.filter(pk__in=task_pks).update(
+        status='failed', error="Worker stopped during the last attempt.", finished_at=timezone.now(),
+    )
+    applicants = Applicant.objects.filter(pk__in=applicant_pks)
+    applicants.update(status='failed')
+    invalidate_jobs(*set(applicants.values_list('job_id', flat=True)))
+
+
+def set_progress(task, progress, stage):
+    ParseTask.objects.filter(pk=task.pk).update(progress=progress, stage=stage)
+    task.progress, task.stage = progress, stage
+
+
+def run_task(task):
+    """
+    Parse the applicant's resume and store the structured result on the applicant row.
+    """
+    applicant = task.applicant
+    Applicant.objects.filter(pk=applicant.pk).update(status='parsing')
+    invalidate_jobs(applicant.job_id)
+    parse = import_string(settings.RESUME_PARSE_FUNCTION)
+
+    try:
+        data = parse(applicant.resume.path, progress=lambda p, stage: set_progress(task, p, stage))
+    except Exception as e:
+        logger.exception("Parse task %s failed", task.pk)
+        retry = task.attempts < settings.PARSE_TASK_MAX_ATTEMPTS
+        with transaction.atomic():
+            ParseTask.objects.filter(pk=task.pk).update(
+                status='queued' if retry else 'failed',
+                error=str(e),
+                finished_at=None if retry else timezone.now(),
+            )
+            if not retry:
+                Applicant.objects.filter(pk=applicant.pk).update(status='failed')
+                invalidate_jobs(applicant.job_id)
+        return False
+
+    with transaction.atomic():
+        Applicant.objects.filter(pk=applicant.pk).update(
+            status='parsed',
+            parsed_data=data,
+            name=applicant.name or str(data.get('name') or '')[:200],
+            email=applicant.email or str(data.get('email') or '')[:254],
+            updated_at=timezone.now(),
+        )
+        ParseTask.objects.filter(pk=task.pk).update(
+            status='done', progress=100, stage='done', error='', finished_at=timezone.now(),
+        )
+        invalidate_jobs(applicant.job_id)  # applicant stats changed
+    return True
+
+
+def run_pending(limit=None):
+    """
+    Drain the queue in this process; returns the number of tasks run.
+    """
+    done = 0
+    while limit is None or done < limit:
+        task = claim_next_task()
+        if task is None:
+            break
+        run_task(task)
+        done += 1
+    return done
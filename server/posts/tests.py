@@ -1,3 +1,333 @@
-from django.test import TestCase
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Applicant, Job, ParseTask
+from .parsing import load_tracing
+from .tasks import claim_next_task, run_pending
+
+MEDIA_ROOT = tempfile.mkdtemp()
+calls = []
+
+
+def fake_parse(path, progress=None):
+    calls.append(path)
+    progress(40, 'parsing')
+    return {"name": "Jane Doe", "email": "jane@doe.dev", "skills": ["Python"]}
+
+
+def failing_parse(path, progress=None):
+    raise RuntimeError("boom")
+
+
+async def fake_aparse(text, urls):
+    return {"name": text.splitlines()[0], "links": urls}
+
+
+def make_job(**kwargs):
+    fields = dict(title="Backend Engineer", description="Django", jobtype="remote",
+                  jobtime="full-time", required_skills="Python")
+    fields.update(kwargs)
+    return Job.objects.create(**fields)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, RESUME_PARSE_FUNCTION='posts.tests.fake_parse')
+class ResumeUploadTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def upload(self, job, name="cv.txt", body=b"Jane Doe\nPython"):
+        return self.client.post(
+            reverse('api_applicant_list_create', args=[job.pk]),
+            {'resume': SimpleUploadedFile(name, body)},
+        )
+
+    def test_upload_returns_task_id_without_parsing(self):
+        job = make_job()
+        calls.clear()
+        response = self.upload(job)
+
+        self.assertEqual(response.status_code, 202)
+        task = ParseTask.objects.get(pk=response.json()['task_id'])
+        self.assertEqual(task.status, 'queued')
+        self.assertEqual(calls, [])
+        job.refresh_from_db()
+        self.assertEqual(job.total_applicants(), 1)
+
+    def test_rejects_unsupported_files(self):
+        response = self.upload(make_job(), name="cv.exe")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ParseTask.objects.exists())
+
+    def test_worker_writes_result_and_status_reports_it(self):
+        job = make_job()
+        task_id = self.upload(job).json()['task_id']
+
+        self.assertEqual(run_pending(), 1)
+        status_url = reverse('api_parse_task_detail', args=[task_id])
+        body = self.client.get(status_url).json()
+        self.assertEqual((body['status'], body['progress']), ('done', 100))
+        self.assertEqual(body['applicant']['parsed_data']['skills'], ["Python"])
+
+        applicant = Applicant.objects.get()
+        self.assertEqual((applicant.status, applicant.name), ('parsed', "Jane Doe"))
+        self.assertIsNone(claim_next_task())
+
+    @override_settings(RESUME_PARSE_FUNCTION='posts.tests.failing_parse', PARSE_TASK_MAX_ATTEMPTS=2)
+    def test_failed_parse_is_retried_then_marked_failed(self):
+        task_id = self.upload(make_job()).json()['task_id']
+
+        self.assertEqual(run_pending(), 2)
+        task = ParseTask.objects.get(pk=task_id)
+        self.assertEqual((task.status, task.attempts, task.error), ('failed', 2, "boom"))
+        self.assertEqual(task.applicant.status, 'failed')
+
+    @override_settings(PARSE_TASK_MAX_ATTEMPTS=2, PARSE_TASK_LEASE_SECONDS=60)
+    def test_task_whose_worker_died_on_the_last_attempt_is_marked_failed(self):
+        job = make_job()
+        task = ParseTask.objects.get(pk=self.upload(job).json()['task_id'])
+        ParseTask.objects.filter(pk=task.pk).update(
+            status='running', attempts=2, started_at=timezone.now() - timedelta(minutes=5),
+        )
+        Applicant.objects.filter(pk=task.applicant_id).update(status='parsing')
+        detail_url = reverse('api_job_detail', args=[job.pk])
+        self.assertEqual(self.client.get(detail_url).json()['applicant_stats']['parsing'], 1)  # now cached
+
+        self.assertIsNone(claim_next_task())
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.attempts), ('failed', 2))
+        self.assertEqual(task.applicant.status, 'failed')
+        self.assertEqual(self.client.get(detail_url).json()['applicant_stats']['failed'], 1)
+
+
+class JobListAPITests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('api_job_list_create')
+
+    def test_pages_newest_first_without_large_columns(self):
+        jobs = [make_job(title=f"Job {i}") for i in range(5)]
+
+        with CaptureQueriesContext(connection) as queries:
+            first = self.client.get(self.url, {'page_size': 2}).json()
+        self.assertNotIn('description', queries.captured_queries[0]['sql'])
+        self.assertEqual([row['id'] for row in first['results']], [jobs[4].pk, jobs[3].pk])
+        self.assertNotIn('description', first['results'][0])
+        self.assertNotIn('required_skills', first['results'][0])
+
+        make_job(title="Newer")  # must not shift the next page
+        second = self.client.get(first['next']).json()
+        self.assertEqual([row['id'] for row in second['results']], [jobs[2].pk, jobs[1].pk])
+
+    def test_filters_and_field_projection(self):
+        make_job(title="Remote", jobtype="remote")
+        make_job(title="Onsite", jobtype="onsite")
+        make_job(title="Closed", jobtype="remote", status="closed")
+
+        body = self.client.get(self.url, {'status': 'active', 'jobtype': 'remote',
+                                          'fields': 'title,required_skills'}).json()
+        self.assertEqual(body['results'], [{'title': "Remote", 'required_skills': "Python"}])
+
+        self.assertEqual(self.client.get(self.url, {'status': 'archived'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'fields': 'title,salary'}).status_code, 400)
+
+
+def make_applicant(job, **kwargs):
+    return Applicant.objects.create(job=job, resume='resumes/cv.txt', **kwargs)
+
+
+class ApplicantStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_list_stats_take_the_same_queries_for_any_number_of_jobs(self):
+        url = reverse('api_job_list_create')
+        job = make_job()
+        make_applicant(job, status='parsed', ai_score=0.8)
+        make_applicant(job, status='parsed', ai_score=0.6)
+        make_applicant(job, status='failed')
+
+        with CaptureQueriesContext(connection) as one_job:
+            row = self.client.get(url).json()['results'][0]
+        self.assertEqual(row['applicant_stats'], {
+            'total': 3, 'pending': 0, 'parsing': 0, 'parsed': 2, 'failed': 1, 'avg_ai_score': 0.7,
+        })
+
+        for _ in range(4):
+            make_applicant(make_job(), status='pending')
+        with self.assertNumQueries(len(one_job)):
+            rows = self.client.get(url).json()['results']
+        self.assertEqual([r['applicant_stats']['total'] for r in rows], [1, 1, 1, 1, 3])
+
+    def test_counter_follows_inserts_and_deletes(self):
+        job = make_job()
+        first, _ = make_applicant(job), make_applicant(job)
+        job.refresh_from_db()
+        self.assertEqual(job.applicants_total, 2)
+
+        first.delete()
+        job.refresh_from_db()
+        self.assertEqual(job.total_applicants(), 1)
+
+        Job.objects.filter(pk=job.pk).update(applicants_total=7)
+        call_command('recount_applicants', stdout=StringIO())
+        job.refresh_from_db()
+        self.assertEqual(job.applicants_total, 1)
+
+
+class JobCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_repeat_reads_revalidate_without_queries(self):
+        job = make_job()
+        url = reverse('api_job_detail', args=[job.pk])
+        first = self.client.get(url)
+        self.assertTrue(first['ETag'].startswith('W/"'))
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(url)
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+            by_date = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(cached.json(), first.json())
+        self.assertEqual((not_modified.status_code, by_date.status_code), (304, 304))
+
+    async def test_cache_hits_match_the_drf_response_byte_for_byte(self):
+        job = await sync_to_async(make_job)()
+        for url in (reverse('api_job_detail', args=[job.pk]), reverse('api_job_list_create')):
+            built = await self.async_client.get(url)  # miss: rendered by the DRF view
+            cached = await self.async_client.get(url)
+            self.assertEqual(cached.content, built.content)
+            self.assertEqual(cached['ETag'], built['ETag'])
+
+    def test_writes_invalidate_detail_and_list(self):
+        job, other = make_job(), make_job(title="Other")
+        detail = reverse('api_job_detail', args=[job.pk])
+        other_detail = reverse('api_job_detail', args=[other.pk])
+        etag = self.client.get(detail)['ETag']
+        self.client.get(other_detail)
+        self.client.get(reverse('api_job_list_create'))
+
+        self.client.patch(detail, {'title': "Staff Engineer"}, content_type='application/json')
+        response = self.client.get(detail, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], "Staff Engineer")
+        with self.assertNumQueries(0):
+            self.client.get(other_detail)  # untouched job stays cached
+
+        self.client.post(reverse('job_create'), {
+            'title': "New role", 'description': "Go", 'status': 'active', 'jobtype': 'onsite',
+            'jobtime': 'part-time', 'required_skills': "Go",
+        })
+        titles = [row['title'] for row in self.client.get(reverse('api_job_list_create')).json()['results']]
+        self.assertEqual(titles, ["New role", "Other", "Staff Engineer"])
+
+        make_applicant(other)
+        stats = self.client.get(other_detail).json()['applicant_stats']
+        self.assertEqual(stats['total'], 1)
+
+
+@override_settings(RESUME_ASYNC_PARSE_FUNCTION='posts.tests.fake_aparse')
+class AsyncParseViewTests(TestCase):
+    def test_status_long_poll_waits_only_for_unfinished_tasks(self):
+        task = ParseTask.objects.create(applicant=make_applicant(make_job()))
+        url = reverse('api_parse_task_detail', args=[task.pk])
+
+        start = time.perf_counter()
+        body = self.client.get(url, {'wait': '0.3'}).json()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.3)
+        self.assertEqual(body['status'], 'queued')
+
+        ParseTask.objects.filter(pk=task.pk).update(status='done', progress=100)
+        start = time.perf_counter()
+        self.assertEqual(self.client.get(url, {'wait': '5'}).json()['status'], 'done')
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(self.client.get(url, {'wait': 'soon'}).status_code, 400)
+
+    def test_reparse_queues_a_new_task(self):
+        applicant = make_applicant(make_job(), status='failed')
+        response = self.client.post(reverse('api_applicant_parse', args=[applicant.pk]))
+
+        self.assertEqual(response.status_code, 202)
+        task = ParseTask.objects.get(pk=response.json()['task_id'])
+        self.assertEqual((task.status, task.applicant_id), ('queued', applicant.pk))
+        applicant.refresh_from_db()
+        self.assertEqual(applicant.status, 'pending')
+        self.assertEqual(self.client.get(reverse('api_applicant_parse', args=[applicant.pk])).status_code, 405)
+
+    def test_reparse_returns_the_active_task_instead_of_queueing_another(self):
+        applicant = make_applicant(make_job(), status='failed')
+        url = reverse('api_applicant_parse', args=[applicant.pk])
+        first = self.client.post(url).json()['task_id']
+
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['task_id'], first)
+        self.assertEqual(applicant.parse_tasks.count(), 1)
+
+        ParseTask.objects.filter(pk=first).update(status='failed')
+        self.assertEqual(self.client.post(url).status_code, 202)
+        self.assertEqual(self.client.post(reverse('api_applicant_parse', args=[0])).status_code, 404)
+
+    def test_inline_parse_awaits_the_parser(self):
+        url = reverse('api_parse_text')
+        response = self.client.post(url, {'text': "Jane Doe\nPython", 'urls': ["https://x.dev"]},
+                                    content_type='application/json')
+        self.assertEqual(response.json(), {'data': {'name': "Jane Doe", 'links': ["https://x.dev"]}})
+        self.assertEqual(self.client.post(url, {'text': " "}, content_type='application/json').status_code, 400)
+
+
+class DashboardStatsTests(TestCase):
+    def test_stats_cards_aggregate_jobs_and_applicants(self):
+        remote = make_job(jobtype="remote")
+        make_applicant(remote, status='parsed', ai_score=0.9)
+        make_applicant(remote, status='pending')
+        onsite = make_job(jobtype="onsite", status="closed")
+        make_applicant(onsite, status='parsed', ai_score=0.3)
+
+        body = self.client.get(reverse('api_dashboard_stats')).json()
+        self.assertEqual(body['totals'], {'jobs': 2, 'jobs_last_30_days': 2, 'applicants': 3,
+                                          'parsed_applicants': 2, 'avg_ai_score': 0.6})
+        self.assertEqual(body['by_status']['closed']['applicants'], 1)
+        self.assertEqual(body['by_jobtype']['remote']['avg_ai_score'], 0.9)
+
+    def test_search_filters_the_job_list(self):
+        make_job(title="Data Engineer", required_skills="Spark, Airflow")
+        make_job(title="Frontend Developer", required_skills="React")
+
+        body = self.client.get(reverse('api_job_list_create'), {'search': 'airflow'}).json()
+        self.assertEqual([row['title'] for row in body['results']], ["Data Engineer"])
+
+
+class MetricsTests(TestCase):
+    def test_metrics_hidden_unless_tracing_enabled(self):
+        tracing = load_tracing()
+        tracing.configure(enabled=False)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 404)
+
+        tracing.configure(enabled=True)
+        try:
+            with tracing.span("resume.llm") as stage:
+                stage.add(prompt_tokens=12)
+            response = self.client.get(reverse('metrics'))
+        finally:
+            tracing.configure(enabled=False)
+            tracing.get_tracer().metrics.reset()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn('hiro_stage_prompt_tokens_total{stage="resume.llm"} 12', response.content.decode())
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     path('', views.JobListView.as_view(), name='job_list'),
@@ -7,6 +7,12 @@ urlpatterns = [
     path('job/create/', views.JobCreateView.as_view(), name='job_create'),
     path('job/<int:pk>/update/', views.JobUpdateView.as_view(), name='job_update'),
     path('job/<int:pk>/delete/', views.JobDeleteView.as_view(), name='job_delete'),
-    path('api/jobs/', views.JobListCreateAPIView.as_view(), name='api_job_list_create'),
-    path('api/jobs/<int:pk>/', views.JobRetrieveUpdateDestroyAPIView.as_view(), name='api_job_detail'),
+    path('api/jobs/', async_views.JobListAPIView.as_view(), name='api_job_list_create'),
+    path('api/jobs/<int:pk>/', async_views.JobDetailAPIView.as_view(), name='api_job_detail'),
+    path('api/jobs/<int:pk>/applicants/', views.ApplicantListCreateAPIView.as_view(), name='api_applicant_list_create'),
+    path('api/applicants/<int:pk>/parse/', async_views.reparse_applicant, name='api_applicant_parse'),
+    path('api/parse/', async_views.parse_text, name='api_parse_text'),
+    path('api/parse-tasks/<uuid:pk>/', async_views.parse_task_status, name='api_parse_task_detail'),
+    path('api/dashboard/stats/', views.DashboardStatsAPIView.as_view(), name='api_dashboard_stats'),
+    path('metrics', views.metrics, name='metrics'),
 ]
@@ -5,9 +5,21 @@ from django.views.generic import (
 )
 from django.urls import reverse_lazy
 from .models import Job
-from rest_framework import generics
-from .models import Job
-from .serializers import JobSerializer
+from django.db import transaction
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, status
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from . import cache as job_cache
+from .models import Applicant, Job
+from .pagination import JobCursorPagination
+from .serializers import ApplicantSerializer, JobListSerializer, JobSerializer
+from .parsing import load_tracing
+from .stats import dashboard_stats
+from .tasks import enqueue_parse
 class JobListView(ListView):
     model = Job
     template_name = 'posts/job_list.html'
@@ -43,9 +55,124 @@ class JobDeleteView(DeleteView):
 
 
 class JobListCreateAPIView(generics.ListCreateAPIView):
+    """
+    GET lists jobs newest first, one cursor page at a time (follow `next`).
+
+    Query parameters:
+        status, jobtype: filter on these (indexed) columns.
+        search: full-text search over title, description and required skills.
+        fields: comma-separated job fields to return, e.g. fields=id,title,required_skills.
+            By default every field but description and required_skills, plus
+            applicant_stats (counts per status and average AI score, computed in
+            the same query as the page).
+        page_size: jobs per page (default 20, at most 100).
+
+    Pages are served from the response cache with ETag/Last-Modified (see posts/cache.py).
+    """
     queryset = Job.objects.all()
     serializer_class = JobSerializer
+    pagination_class = JobCursorPagination
+    filter_fields = {'status': Job.STATUS_CHOICES, 'jobtype': Job.JOB_TYPE_CHOICES}
+
+    def requested_fields(self):
+        raw = self.request.query_params.get('fields')
+        if not raw:
+            return None
+        fields = [name.strip() for name in raw.split(',') if name.strip()]
+        known = {field.name for field in Job._meta.concrete_fields} | {'applicant_stats'}
+        unknown = sorted(set(fields) - known)
+        if unknown:
+            raise ValidationError({'fields': [f"Unknown field(s): {', '.join(unknown)}."]})
+        return fields
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method != 'GET':
+            return queryset
+        for name, choices in self.filter_fields.items():
+            value = self.request.query_params.get(name)
+            if value is None:
+                continue
+            if value not in dict(choices):
+                raise ValidationError({name: [f"Unknown {name} '{value}'."]})
+            queryset = queryset.filter(**{name: value})
+        terms = self.request.query_params.get('search', '').strip()
+        if terms:
+            queryset = queryset.search(terms)
+
+        fields = self.requested_fields() or JobListSerializer.Meta.fields
+        if 'applicant_stats' in fields:
+            queryset = queryset.with_applicant_stats()
+        return queryset.only(*(name for name in fields if name != 'applicant_stats'))
+
+    def list(self, request, *args, **kwargs):
+        build = super().list
+        return job_cache.cached_response(request, job_cache.list_key(request),
+                                         lambda: build(request, *args, **kwargs))
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET' and not self.requested_fields():
+            return JobListSerializer
+        return JobSerializer
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method == 'GET':
+            context['fields'] = self.requested_fields()
+        return context
 
 class JobRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Job.objects.all()
+    """
+    GET is served from the response cache (see posts/cache.py); writes invalidate it.
+    """
+    queryset = Job.objects.with_applicant_stats()
     serializer_class = JobSerializer
+
+    def retrieve(self, request, *args, **kwargs):
+        build = super().retrieve
+        return job_cache.cached_response(request, job_cache.detail_key(kwargs['pk']),
+                                         lambda: build(request, *args, **kwargs))
+
+
+class ApplicantListCreateAPIView(generics.ListCreateAPIView):
+    """
+    GET lists a job's applicants; POST uploads a resume (multipart, field
+    `resume`) and queues it for parsing, answering 202 with the task id.
+    """
+    serializer_class = ApplicantSerializer
+    parser_classes = [MultiPartParser, FormParser]
+
+    def get_queryset(self):
+        return Applicant.objects.filter(job_id=self.kwargs['pk']).order_by('-created_at')
+
+    def create(self, request, *args, **kwargs):
+        job = get_object_or_404(Job, pk=self.kwargs['pk'])
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            applicant = serializer.save(job=job)
+            task = enqueue_parse(applicant)
+        return Response(
+            {'task_id': str(task.pk), 'applicant_id': applicant.pk, 'status': task.status},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class DashboardStatsAPIView(APIView):
+    """
+    Stats cards for the recruiter dashboard (see posts/stats.py).
+    """
+
+    def get(self, request):
+        return Response(dashboard_stats())
+
+
+def metrics(request):
+    """
+    Per-stage parse metrics of this process in Prometheus text format.
+    Returns 404 unless tracing is enabled (HIRO_TRACING=1).
+    """
+    tracing = load_tracing()
+    if not tracing.is_enabled():
+        raise Http404("Tracing is disabled")
+    return HttpResponse(tracing.render_prometheus(), content_type=tracing.PROMETHEUS_CONTENT_TYPE)